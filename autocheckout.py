@@ -1,60 +1,278 @@
 from __future__ import annotations
-import os, subprocess, threading, logging, time, re
+import asyncio
+import json
+import os, string, threading, logging, time, re
 from pathlib import Path
 from . import config
 from .scraper import Product
 
+# pyahocorasick is optional; without it we fall back to per-keyword scans.
+try:
+    import ahocorasick  # type: ignore
+    _AHOCORASICK_AVAILABLE = True
+except Exception:
+    _AHOCORASICK_AVAILABLE = False
+
 log = logging.getLogger(__name__)
-_gate = threading.Semaphore(1)  # avoid running multiple checkouts at once
+
+# All checkout subprocesses run as coroutines on one dedicated event loop
+# thread instead of one blocked OS thread per checkout.
+_loop: asyncio.AbstractEventLoop | None = None
+_loop_lock = threading.Lock()
+# Bounds concurrent checkouts; width comes from AUTO_CHECKOUT_MAX_CONCURRENCY
+# (1 = the historical one-at-a-time gate).
+_gate: asyncio.Semaphore | None = None
+
+# Product IDs with a checkout currently queued or running; duplicate
+# submissions during event bursts are dropped instead of queueing a
+# redundant Node run behind the gate.
+_inflight_lock = threading.Lock()
+_inflight: set[str] = set()
+
+# Product IDs ever submitted to auto-checkout in this process. Repeat stock
+# events for the same SKU bail out here before any haystack building or
+# keyword matching runs. A plain set is exact and already O(1) at the few
+# thousand IDs this process ever sees, so no Bloom filter is needed.
+_attempted: set[str] = set()
+
+
+def _claim_inflight(product_id: str) -> bool:
+    """Register a checkout for this product; False if one is already pending."""
+    with _inflight_lock:
+        if product_id in _inflight:
+            return False
+        _inflight.add(product_id)
+        return True
+
+
+def _release_inflight(product_id: str) -> None:
+    with _inflight_lock:
+        _inflight.discard(product_id)
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    """Return the shared checkout event loop, starting it on first use."""
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=loop.run_forever, name="checkout-loop", daemon=True
+            ).start()
+            _loop = loop
+    return _loop
+
+
+def _get_gate() -> asyncio.Semaphore:
+    # Only called from coroutines on the loop thread, so no lock needed.
+    global _gate
+    if _gate is None:
+        _gate = asyncio.Semaphore(config.AUTO_CHECKOUT_MAX_CONCURRENCY)
+    return _gate
+
+
+class _RadixNode:
+    """Node of a compressed (radix) trie: unary chains are collapsed into a
+    single string prefix, so sibling dispatch is one dict lookup plus one
+    C-level startswith instead of a chain of per-character nodes."""
+
+    __slots__ = ("prefix", "children", "terminal")
+
+    def __init__(self, prefix: str = ""):
+        self.prefix = prefix
+        self.children: dict[str, "_RadixNode"] = {}
+        self.terminal = False
+
+    def insert(self, word: str) -> None:
+        node = self
+        while word:
+            child = node.children.get(word[0])
+            if child is None:
+                leaf = _RadixNode(word)
+                leaf.terminal = True
+                node.children[word[0]] = leaf
+                return
+            p = child.prefix
+            k = 0
+            limit = min(len(p), len(word))
+            while k < limit and p[k] == word[k]:
+                k += 1
+            if k < len(p):
+                # Split the child at the divergence point.
+                tail = _RadixNode(p[k:])
+                tail.children = child.children
+                tail.terminal = child.terminal
+                child.prefix = p[:k]
+                child.children = {p[k]: tail}
+                child.terminal = False
+            word = word[k:]
+            node = child
+        node.terminal = True
+
+    def match_at(self, haystack: str, start: int) -> str | None:
+        """Return the shortest keyword matching at `start`, or None."""
+        node = self
+        pos = start
+        matched: list[str] = []
+        while pos < len(haystack):
+            child = node.children.get(haystack[pos])
+            if child is None or not haystack.startswith(child.prefix, pos):
+                return None
+            matched.append(child.prefix)
+            pos += len(child.prefix)
+            if child.terminal:
+                return haystack[:0].join(matched)
+            node = child
+        return None
+
+    def matches_at(self, haystack: str, start: int) -> list[str]:
+        """Return every keyword matching at `start` (shortest first)."""
+        node = self
+        pos = start
+        matched: list[str] = []
+        hits: list[str] = []
+        while pos < len(haystack):
+            child = node.children.get(haystack[pos])
+            if child is None or not haystack.startswith(child.prefix, pos):
+                break
+            matched.append(child.prefix)
+            pos += len(child.prefix)
+            if child.terminal:
+                hits.append(haystack[:0].join(matched))
+            node = child
+        return hits
+
+
+def _build_radix(keywords: tuple[str, ...]) -> _RadixNode:
+    root = _RadixNode()
+    for kw in keywords:
+        root.insert(kw)
+    return root
+
+
+class _KeywordMatcher:
+    """Match a fixed set of lowercased keywords against a haystack.
+
+    With pyahocorasick installed the keywords are compiled once into an
+    automaton so each haystack is scanned in a single linear pass instead of
+    one `in` scan per keyword. Without it we fall back to a compact radix
+    tree built once at import, so large keyword sets still cost a single
+    sliding walk rather than one scan per keyword.
+
+    When ``as_bytes`` is set the matcher is built over ASCII bytes and
+    expects haystacks folded via :func:`_fold`; `found_in` always reports
+    the original str keywords regardless of representation.
+    """
+
+    def __init__(self, keywords: list[str] | tuple[str, ...], *, as_bytes: bool = False):
+        self._keywords = tuple(dict.fromkeys(k for k in keywords if k))
+        self._as_bytes = as_bytes
+        keys: tuple = (
+            tuple(k.encode("ascii", "ignore") for k in self._keywords)
+            if as_bytes
+            else self._keywords
+        )
+        self._canonical = dict(zip(keys, self._keywords))
+        self._automaton = None
+        self._radix: _RadixNode | None = None
+        if self._keywords:
+            if _AHOCORASICK_AVAILABLE:
+                if as_bytes:
+                    auto = ahocorasick.Automaton(ahocorasick.STORE_ANY, ahocorasick.KEY_BYTES)
+                else:
+                    auto = ahocorasick.Automaton()
+                for key, kw in self._canonical.items():
+                    auto.add_word(key, kw)
+                auto.make_automaton()
+                self._automaton = auto
+            else:
+                self._radix = _build_radix(keys)
+
+    def __bool__(self) -> bool:
+        return bool(self._keywords)
+
+    def contains_any(self, haystack) -> bool:
+        if not self._keywords:
+            return False
+        if self._automaton is not None:
+            return next(self._automaton.iter(haystack), None) is not None
+        radix = self._radix
+        return any(
+            radix.match_at(haystack, i) is not None for i in range(len(haystack))
+        )
+
+    def found_in(self, haystack) -> set[str]:
+        """Return the subset of (original str) keywords present in the haystack."""
+        if self._automaton is not None:
+            return {kw for _, kw in self._automaton.iter(haystack)}
+        hits: set[str] = set()
+        radix = self._radix
+        if radix is not None:
+            for i in range(len(haystack)):
+                for key in radix.matches_at(haystack, i):
+                    hits.add(self._canonical[key])
+        return hits
+
+    def contains_all(self, haystack: str) -> bool:
+        return len(self.found_in(haystack)) == len(self._keywords)
+
+
+# In ASCII mode, case folding is a single C-level bytes.translate instead of
+# Unicode-aware str.lower() over the whole haystack.
+_ASCII_MATCH = bool(config.AUTO_CHECKOUT_ASCII_MATCH)
+_LOWER_TABLE = bytes.maketrans(
+    string.ascii_uppercase.encode("ascii"), string.ascii_lowercase.encode("ascii")
+)
+
+
+def _fold(text: str):
+    """Convert text to the matcher representation (ASCII bytes or str)."""
+    if _ASCII_MATCH:
+        return text.encode("ascii", "ignore").translate(_LOWER_TABLE)
+    return text
+
+
+# Compile the configured keyword sets once at import.
+_EXCLUDE_MATCHER = _KeywordMatcher(config.AUTO_CHECKOUT_EXCLUDE_KEYWORDS, as_bytes=_ASCII_MATCH)
+_INCLUDE_MATCHER = _KeywordMatcher(config.AUTO_CHECKOUT_INCLUDE_KEYWORDS, as_bytes=_ASCII_MATCH)
+_INTEREST_MATCHER = _KeywordMatcher(config.AUTO_CHECKOUT_KEYWORDS, as_bytes=_ASCII_MATCH)
+
+# Outcome classifiers for checkout-script output, compiled once.
+_SUCCESS_MATCHER = _KeywordMatcher(config.AUTO_CHECKOUT_SUCCESS_PATTERNS, as_bytes=_ASCII_MATCH)
+_FAILURE_MATCHER = _KeywordMatcher(config.AUTO_CHECKOUT_FAILURE_PATTERNS, as_bytes=_ASCII_MATCH)
+
 
 def _matches_keywords(product: Product) -> bool:
-    hay = f"{(product.name or '').lower()} {product.page_url.lower()} {product.id}"
-    if config.AUTO_CHECKOUT_EXCLUDE_KEYWORDS and any(kw in hay for kw in config.AUTO_CHECKOUT_EXCLUDE_KEYWORDS):
+    hay = _fold(product.match_blob)
+    if _EXCLUDE_MATCHER and _EXCLUDE_MATCHER.contains_any(hay):
         return False
-    if not config.AUTO_CHECKOUT_INCLUDE_KEYWORDS:
+    if not _INCLUDE_MATCHER:
         return True
-    return any(kw in hay for kw in config.AUTO_CHECKOUT_INCLUDE_KEYWORDS)
+    return _INCLUDE_MATCHER.contains_any(hay)
+
+
+# Snapshot of the parent environment with the constant CHECKOUT_* overlay
+# applied, built once at import instead of once per checkout attempt.
+_BASE_ENV: dict = {**os.environ, **config.CHECKOUT_ENV_OVERLAY}
 
 
 def _env_for_checkout(product_url: str) -> dict:
-    env = os.environ.copy()
-    env.update({
-        "PRODUCT_URL": product_url,
-        "CHECKOUT_FIRST_NAME": config.CHECKOUT_FIRST_NAME,
-        "CHECKOUT_LAST_NAME":  config.CHECKOUT_LAST_NAME,
-        "CHECKOUT_EMAIL":      config.CHECKOUT_EMAIL,
-        "CHECKOUT_PHONE":      config.CHECKOUT_PHONE,
-        "CHECKOUT_ADDRESS":    config.CHECKOUT_ADDRESS,
-        "CHECKOUT_CITY":       config.CHECKOUT_CITY,
-        "CHECKOUT_ZIP":        config.CHECKOUT_ZIP,
-        "CHECKOUT_CARDHOLDER_NAME": config.CHECKOUT_CARDHOLDER_NAME,
-        "CHECKOUT_CARD_NUMBER":     config.CHECKOUT_CARD_NUMBER,
-        "CHECKOUT_CVV":             config.CHECKOUT_CVV,
-        "CHECKOUT_EXPIRY":          config.CHECKOUT_EXPIRY,
-        "CHECKOUT_HEADLESS":        config.CHECKOUT_HEADLESS,
-    })
+    env = _BASE_ENV.copy()
+    env["PRODUCT_URL"] = product_url
     return env
 
 def _text_for_matching(product: Product) -> str:
-    parts: list[str] = []
-    fields = set(config.AUTO_CHECKOUT_SEARCH_FIELDS or [])
-    if "name" in fields:
-        parts.append(product.name or "")
-    if "page_url" in fields:
-        parts.append(product.page_url or "")
-    if "id" in fields:
-        parts.append(product.id or "")
-    return " ".join(parts).lower()
+    # The per-field join/lower is cached on the product itself.
+    return product.match_blob
 
 def _matches_interest(product: Product) -> bool:
-    kw = [k for k in (config.AUTO_CHECKOUT_KEYWORDS or []) if k]
-    if not kw:
+    if not _INTEREST_MATCHER:
         # Back-compat: if no keywords configured, allow all
         return True
-    hay = _text_for_matching(product)
+    hay = _fold(_text_for_matching(product))
     if config.AUTO_CHECKOUT_MATCH_MODE == "all":
-        return all(k in hay for k in kw)
-    return any(k in hay for k in kw)  # default "any"
+        return _INTEREST_MATCHER.contains_all(hay)
+    return _INTEREST_MATCHER.contains_any(hay)  # default "any"
 
 def _should_attempt_auto(product: Product, event_type: str) -> bool:
     """Check if we should automatically checkout (keyword-based only)."""
@@ -84,109 +302,157 @@ def _analyze_checkout_output(output: str, stderr: str) -> tuple[bool, str]:
     Analyze checkout script output to determine if it was successful.
     Returns (success, reason)
     """
-    combined_output = f"{output}\n{stderr}".lower()
-    
-    # Check for success patterns
-    success_patterns = getattr(config, 'AUTO_CHECKOUT_SUCCESS_PATTERNS', 'checkout completed,success: true').split(',')
-    for pattern in success_patterns:
-        if pattern.strip().lower() in combined_output:
-            log.info("✅ Success pattern found: '%s'", pattern.strip())
-            return True, f"Success: {pattern.strip()}"
-    
-    # Check for failure patterns
-    failure_patterns = getattr(config, 'AUTO_CHECKOUT_FAILURE_PATTERNS', 'error,failed,timeout,declined').split(',')
-    for pattern in failure_patterns:
-        if pattern.strip().lower() in combined_output:
-            log.warning("❌ Failure pattern found: '%s'", pattern.strip())
-            return False, f"Failed: {pattern.strip()}"
-    
+    # Preferred: the Node script's terminating JSON status line
+    # ({"status": "success"|"failure", "reason": ...}). O(1) in the number
+    # of configured patterns; scan stdout backwards so the last line wins.
+    for line in reversed(output.splitlines()):
+        line = line.strip()
+        if not line:
+            continue
+        if line.startswith("{") and '"status"' in line:
+            try:
+                obj = json.loads(line)
+            except ValueError:
+                break
+            status = str(obj.get("status", "")).lower()
+            if status in ("success", "failure"):
+                return status == "success", str(obj.get("reason", "") or status)
+        break  # only the trailing line counts as the protocol marker
+
+    # Fallback: substring classification of free-form output (older script).
+    # Case-fold once, then sweep the output with the precompiled matchers
+    # instead of one substring scan per configured pattern.
+    combined = f"{output}\n{stderr}"
+    combined_output = (
+        combined.encode("ascii", "ignore").translate(_LOWER_TABLE)
+        if _ASCII_MATCH
+        else combined.lower()
+    )
+
+    success_hits = _SUCCESS_MATCHER.found_in(combined_output)
+    if success_hits:
+        # Report the first configured pattern that hit, as before.
+        pattern = next(p for p in config.AUTO_CHECKOUT_SUCCESS_PATTERNS if p in success_hits)
+        log.info("✅ Success pattern found: '%s'", pattern)
+        return True, f"Success: {pattern}"
+
+    failure_hits = _FAILURE_MATCHER.found_in(combined_output)
+    if failure_hits:
+        pattern = next(p for p in config.AUTO_CHECKOUT_FAILURE_PATTERNS if p in failure_hits)
+        log.warning("❌ Failure pattern found: '%s'", pattern)
+        return False, f"Failed: {pattern}"
+
     # If no clear success/failure pattern, check exit code behavior
-    if "checkout completed" in combined_output:
+    if _fold("checkout completed") in combined_output:
         return True, "Checkout process completed"
-    
+
     # Default to failure if we can't determine success
     return False, "Could not determine success/failure from output"
 
-def _run_checkout_with_retry(product: Product, checkout_type: str = "AUTO") -> bool:
+async def _pump_stream(stream: asyncio.StreamReader, sink, fmt: str) -> list[str]:
+    """Drain a subprocess pipe line by line, logging as output arrives."""
+    lines: list[str] = []
+    while True:
+        raw = await stream.readline()
+        if not raw:
+            return lines
+        line = raw.decode("utf-8", errors="replace").rstrip("\n")
+        if line.strip():
+            sink(fmt, line.strip())
+        lines.append(line)
+
+
+async def _run_checkout_with_retry(product: Product, checkout_type: str = "AUTO") -> bool:
     """
     Run checkout with retry logic and output analysis.
     Returns True if successful, False otherwise.
     """
     max_retries = getattr(config, 'AUTO_CHECKOUT_MAX_RETRIES', 3)
     retry_delay = getattr(config, 'AUTO_CHECKOUT_RETRY_DELAY_SECONDS', 30)
-    
-    cmd = [config.AUTO_CHECKOUT_NODE, config.AUTO_CHECKOUT_SCRIPT, product.page_url]
+
     cwd = Path(config.AUTO_CHECKOUT_DIR)
-    
+
     for attempt in range(max_retries + 1):  # +1 for initial attempt
         try:
             if attempt > 0:
                 log.info("🔄 Retry attempt %d/%d for %s (%s)", attempt, max_retries, product.name, product.id)
-                time.sleep(retry_delay)
+                await asyncio.sleep(retry_delay)
             else:
                 log.info("🚀 Starting %s checkout for %s (%s)", checkout_type, product.name, product.id)
-            
+
             env = _env_for_checkout(product.page_url)
-            
-            # Run with captured output for analysis
-            p = subprocess.Popen(
-                cmd,
+
+            # Spawn on the event loop; no OS thread blocks in communicate().
+            proc = await asyncio.create_subprocess_exec(
+                config.AUTO_CHECKOUT_NODE,
+                config.AUTO_CHECKOUT_SCRIPT,
+                product.page_url,
                 cwd=str(cwd),
                 env=env,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                universal_newlines=True
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+
+            log.info("🤖 Spawned %s checkout process pid=%s (attempt %d)", checkout_type, proc.pid, attempt + 1)
+
+            # Stream both pipes concurrently (logged line-by-line as it runs)
+            out_lines, err_lines = await asyncio.gather(
+                _pump_stream(proc.stdout, log.info, "CHECKOUT: %s"),
+                _pump_stream(proc.stderr, log.warning, "CHECKOUT ERROR: %s"),
             )
-            
-            log.info("🤖 Spawned %s checkout process pid=%s (attempt %d)", checkout_type, p.pid, attempt + 1)
-            
-            # Wait for completion and capture output
-            stdout, stderr = p.communicate()
-            rc = p.returncode
-            
-            # Also log the output in real-time style (for visibility)
-            if stdout:
-                for line in stdout.strip().split('\n'):
-                    if line.strip():
-                        log.info("CHECKOUT: %s", line.strip())
-            
-            if stderr:
-                for line in stderr.strip().split('\n'):
-                    if line.strip():
-                        log.warning("CHECKOUT ERROR: %s", line.strip())
-            
+            rc = await proc.wait()
+
+            stdout = "\n".join(out_lines)
+            stderr = "\n".join(err_lines)
+
             # Analyze output for success/failure
             success, reason = _analyze_checkout_output(stdout, stderr)
-            
-            log.info("📊 %s checkout pid=%s exited rc=%s, analysis: %s", 
-                    checkout_type, p.pid, rc, reason)
-            
+
+            log.info("📊 %s checkout pid=%s exited rc=%s, analysis: %s",
+                    checkout_type, proc.pid, rc, reason)
+
             if success:
-                log.info("✅ %s checkout SUCCESSFUL for %s after %d attempts", 
+                log.info("✅ %s checkout SUCCESSFUL for %s after %d attempts",
                         checkout_type, product.name, attempt + 1)
                 return True
             else:
                 if attempt < max_retries:
-                    log.warning("⚠️ %s checkout attempt %d FAILED for %s: %s (will retry in %ds)", 
+                    log.warning("⚠️ %s checkout attempt %d FAILED for %s: %s (will retry in %ds)",
                               checkout_type, attempt + 1, product.name, reason, retry_delay)
                 else:
-                    log.error("❌ %s checkout FAILED for %s after %d attempts: %s", 
+                    log.error("❌ %s checkout FAILED for %s after %d attempts: %s",
                             checkout_type, product.name, max_retries + 1, reason)
                     return False
-                    
-        except Exception as e:
+
+        except Exception:
             if attempt < max_retries:
-                log.exception("⚠️ %s checkout attempt %d crashed for %s (will retry in %ds)", 
+                log.exception("⚠️ %s checkout attempt %d crashed for %s (will retry in %ds)",
                             checkout_type, attempt + 1, product.name, retry_delay)
             else:
-                log.exception("❌ %s checkout crashed for %s after %d attempts", 
+                log.exception("❌ %s checkout crashed for %s after %d attempts",
                             checkout_type, product.name, max_retries + 1)
                 return False
-    
+
     return False
 
+
+async def _checkout_task(product: Product, checkout_type: str) -> None:
+    try:
+        async with _get_gate():
+            success = await _run_checkout_with_retry(product, checkout_type)
+            if success:
+                log.info("🎉 %s checkout completed successfully for %s", checkout_type, product.name)
+            else:
+                log.error("💥 %s checkout failed permanently for %s", checkout_type, product.name)
+    finally:
+        _release_inflight(product.id)
+
 def try_autocheckout(product: Product, event_type: str) -> None:
     """Automatically checkout predetermined keyword-based products only."""
+    # Cheapest gate first: skip SKUs we already submitted this run.
+    if product.id in _attempted:
+        return
+
     if not _should_attempt_auto(product, event_type):
         return
 
@@ -194,15 +460,12 @@ def try_autocheckout(product: Product, event_type: str) -> None:
         log.info("[AUTO-CHECKOUT DRY RUN] Would run checkout for %s", product.name)
         return
 
-    def _worker():
-        with _gate:
-            success = _run_checkout_with_retry(product, "AUTO")
-            if success:
-                log.info("🎉 AUTO checkout completed successfully for %s", product.name)
-            else:
-                log.error("💥 AUTO checkout failed permanently for %s", product.name)
+    if not _claim_inflight(product.id):
+        log.info("Auto checkout already in flight for %s; skipping duplicate", product.id)
+        return
 
-    threading.Thread(target=_worker, name=f"auto_checkout_{product.id}", daemon=True).start()
+    _attempted.add(product.id)
+    asyncio.run_coroutine_threadsafe(_checkout_task(product, "AUTO"), _get_loop())
 
 
 def should_offer_manual_checkout(product: Product, event_type: str) -> bool:
@@ -226,13 +489,13 @@ def try_manual_checkout(product: Product, force: bool = False) -> bool:
         log.info("[MANUAL CHECKOUT DRY RUN] Would run checkout for %s", product.name)
         return True
 
-    def _worker():
-        with _gate:
-            success = _run_checkout_with_retry(product, "MANUAL")
-            if success:
-                log.info("🎉 MANUAL checkout completed successfully for %s", product.name)
-            else:
-                log.error("💥 MANUAL checkout failed permanently for %s", product.name)
+    if force:
+        # Forced retries are allowed through, but still tracked for release.
+        with _inflight_lock:
+            _inflight.add(product.id)
+    elif not _claim_inflight(product.id):
+        log.info("Manual checkout already in flight for %s; skipping duplicate", product.id)
+        return False
 
-    threading.Thread(target=_worker, name=f"manual_checkout_{product.id}", daemon=True).start()
+    asyncio.run_coroutine_threadsafe(_checkout_task(product, "MANUAL"), _get_loop())
     return True
\ No newline at end of file
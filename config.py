@@ -1,11 +1,17 @@
 """Configuration loader.
 
 Reads environment variables and `.env` to configure the service.
+
+All values are parsed exactly once into a frozen :class:`Config` snapshot
+(memoized via ``lru_cache``); module-level access like ``config.BASE_URL``
+keeps working through PEP 562 ``__getattr__`` delegation.
 """
 
 from __future__ import annotations
 
 import os, shutil
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional, List
 from pathlib import Path
 
@@ -25,220 +31,331 @@ def _parse_bool(value: Optional[str], default: bool = False) -> bool:
     return value.lower() in ("1", "true", "yes")
 
 
-# ---- Core scraping config ----------------------------------------------------
-
-# Primary/legacy single category (kept for backward compatibility).
-# For Whiskey, FWGS uses Endeca node "4036262580".
-CATEGORY_ID: str = _get_env("CATEGORY_ID", "4036262580")
-# config.py
-import os
-
-ONLINE_EXCLUSIVE_CATEGORY_IDS = set(
-    (os.getenv("ONLINE_EXCLUSIVE_CATEGORY_IDS") or "3030473779")
-    .split(",")
-)
-
-# NEW: multiple Endeca category/node IDs to scrape in one pass.
-# Comma-separated list. If unset, we fall back to [CATEGORY_ID].
-_CATEGORY_IDS_RAW = _get_env("CATEGORY_IDS", "") or ""
-CATEGORY_IDS: List[str] = [
-    s.strip() for s in _CATEGORY_IDS_RAW.split(",") if s.strip()
-]
-if not CATEGORY_IDS:
-    CATEGORY_IDS = [CATEGORY_ID]
-
-# Interval in minutes between full catalog scrapes.
-try:
-    SCRAPE_INTERVAL_MINUTES: int = int(_get_env("SCRAPE_INTERVAL_MINUTES", "10"))
-except ValueError:
-    SCRAPE_INTERVAL_MINUTES = 10
-
-# Discord webhook URL. Required for sending notifications.
-DISCORD_WEBHOOK_URL: Optional[str] = _get_env("DISCORD_WEBHOOK_URL")
-
-# Base URL for the OCC API. Should not include a trailing slash.
-BASE_URL: str = _get_env("BASE_URL", "https://www.finewineandgoodspirits.com")
-
-# Path to SQLite database.
-SQLITE_DB_PATH: str = _get_env("SQLITE_DB_PATH", "monitor.db")
-
-# Logging level: DEBUG, INFO, WARNING, ERROR.
-LOG_LEVEL: str = _get_env("LOG_LEVEL", "INFO")
-
-# OSF assembler page size request (server may cap).
-try:
-    ASSEMBLER_NRPP: int = int(_get_env("ASSEMBLER_NRPP", "2000"))
-except ValueError:
-    ASSEMBLER_NRPP = 2000
-
-# Optional sort expression for assembler (Ns parameter). Leave blank for default.
-ASSEMBLER_NS: Optional[str] = _get_env("ASSEMBLER_NS")
-
-# Legacy v1/products fallback category slug.
-LEGACY_CATEGORY_ID: str = _get_env("LEGACY_CATEGORY_ID", "151")
-
-# ---- Feature flags & limits --------------------------------------------------
-
-# Emit removed events for products that disappear from the catalog.
-ENABLE_REMOVED_EVENTS: bool = _parse_bool(_get_env("ENABLE_REMOVED_EVENTS", "false"), False)
-
-# Emit available events when quantity transitions from 0 -> >0.
-ENABLE_STOCK_EVENTS: bool = _parse_bool(_get_env("ENABLE_STOCK_EVENTS", "true"), True)
-
-# If > 0, cap the number of product notifications per cycle (ingestion is unaffected).
-try:
-    MAX_NOTIFY: int = int(_get_env("MAX_NOTIFY", "0"))
-except ValueError:
-    MAX_NOTIFY = 0
-
-# ---- High-frequency watchlist loop ------------------------------------------
-
-ENABLE_WATCHLIST: bool = _parse_bool(_get_env("ENABLE_WATCHLIST", "false"), False)
-
-try:
-    WATCHLIST_INTERVAL_SECONDS: int = int(_get_env("WATCHLIST_INTERVAL_SECONDS", "5"))
-except ValueError:
-    WATCHLIST_INTERVAL_SECONDS = 5
-
-WATCHLIST_IDS_CSV: str = _get_env("WATCHLIST_IDS", "") or ""
-WATCHLIST_IDS: List[str] = [s.strip() for s in WATCHLIST_IDS_CSV.split(",") if s.strip()]
-
-# Optional simulator for local testing (forces a flip from 0→1 once).
-SIMULATE_WATCHLIST_FLIP: bool = _parse_bool(_get_env("SIMULATE_WATCHLIST_FLIP", "false"), False)
-
-# ---- Front-page scanner (optional) ------------------------------------------
-
-ENABLE_FRONT_PAGE_SCANNER: bool = _parse_bool(_get_env("ENABLE_FRONT_PAGE_SCANNER", "false"), False)
-
-try:
-    FRONT_PAGE_NRPP: int = int(_get_env("FRONT_PAGE_NRPP", "120"))
-except ValueError:
-    FRONT_PAGE_NRPP = 120
-
-# Optional sort expression specifically for "newest first" heuristic.
-ASSEMBLER_NS_NEW: Optional[str] = _get_env("ASSEMBLER_NS_NEW")
-
-# ---- Price/quantity enrichment (background) ---------------------------------
-
-PRICE_FIXER_ENABLED: bool = _parse_bool(_get_env("PRICE_FIXER_ENABLED", "false"), False)
-
-try:
-    ENRICHMENT_BATCH_SIZE: int = int(_get_env("ENRICHMENT_BATCH_SIZE", "10"))
-except ValueError:
-    ENRICHMENT_BATCH_SIZE = 10
-
-# Delay between per-product HTML requests (seconds)
-try:
-    ENRICHMENT_REQUEST_DELAY: float = float(_get_env("ENRICHMENT_REQUEST_DELAY", "1.5"))
-except ValueError:
-    ENRICHMENT_REQUEST_DELAY = 1.5
-
-# Wait time between enrichment batches (seconds)
-try:
-    ENRICHMENT_LOOP_INTERVAL_SECONDS: int = int(_get_env("ENRICHMENT_LOOP_INTERVAL_SECONDS", "60"))
-except ValueError:
-    ENRICHMENT_LOOP_INTERVAL_SECONDS = 60
-
-# Whether to upload images to Discord as attachments (most reliable).
-DISCORD_ATTACH_IMAGES: bool = _parse_bool(_get_env("DISCORD_ATTACH_IMAGES", "false"))
-
-# ---- Whiskey release browser fallback ---------------------------------------
-
 def _parse_int(value: Optional[str], default: int) -> int:
     try:
         return int(value) if value is not None else default
     except ValueError:
         return default
 
-RELEASE_USE_BROWSER: bool = _parse_bool(_get_env("RELEASE_USE_BROWSER", "false"), False)
-RELEASE_BROWSER_TIMEOUT_MS: int = _parse_int(_get_env("RELEASE_BROWSER_TIMEOUT_MS", "120000"), 120000)
 
-ENABLE_RELEASE_SCANNER: bool = _parse_bool(_get_env("ENABLE_RELEASE_SCANNER", "false"), False)
-RELEASE_PAGE_URL: Optional[str] = _get_env(
-    "RELEASE_PAGE_URL",
-    "https://www.finewineandgoodspirits.com/whiskey-release/whiskey-release",
-)
-RELEASE_CHECK_INTERVAL_SECONDS: int = _parse_int(_get_env("RELEASE_CHECK_INTERVAL_SECONDS", "15"), 15)
+def _parse_float(value: Optional[str], default: float) -> float:
+    try:
+        return float(value) if value is not None else default
+    except ValueError:
+        return default
+
+
+def _get_list(name: str) -> list[str]:
+    raw = _get_env(name, "") or ""
+    return [s.strip() for s in raw.split(",") if s.strip()]
+
+
+def _get_keywords(name: str, default: str = "") -> tuple[str, ...]:
+    raw = _get_env(name, default) or ""
+    return tuple(s.strip().lower() for s in raw.split(",") if s.strip())
+
+
+@dataclass(frozen=True)
+class Config:
+    """Immutable snapshot of every environment-derived setting."""
+
+    # ---- Core scraping config ----
+    CATEGORY_ID: str
+    ONLINE_EXCLUSIVE_CATEGORY_IDS: frozenset[str]
+    CATEGORY_IDS: List[str]
+    SCRAPE_INTERVAL_MINUTES: int
+    DISCORD_WEBHOOK_URL: Optional[str]
+    BASE_URL: str
+    SQLITE_DB_PATH: str
+    LOG_LEVEL: str
+    ASSEMBLER_NRPP: int
+    ASSEMBLER_NS: Optional[str]
+    LEGACY_CATEGORY_ID: str
+
+    # ---- Feature flags & limits ----
+    ENABLE_REMOVED_EVENTS: bool
+    ENABLE_STOCK_EVENTS: bool
+    ZERO_STOCK_SKIP_SECONDS: int
+    MAX_NOTIFY: int
+    NOTIFY_CONCURRENCY: int
+
+    # ---- High-frequency watchlist loop ----
+    ENABLE_WATCHLIST: bool
+    WATCHLIST_INTERVAL_SECONDS: int
+    WATCHLIST_IDS_CSV: str
+    WATCHLIST_IDS: List[str]
+    SIMULATE_WATCHLIST_FLIP: bool
+
+    # ---- Front-page scanner ----
+    ENABLE_FRONT_PAGE_SCANNER: bool
+    FRONT_PAGE_NRPP: int
+    ASSEMBLER_NS_NEW: Optional[str]
+
+    # ---- Price/quantity enrichment ----
+    PRICE_FIXER_ENABLED: bool
+    ENRICHMENT_BATCH_SIZE: int
+    ENRICHMENT_WORKERS: int
+    ENRICHMENT_REQUEST_DELAY: float
+    ENRICHMENT_LOOP_INTERVAL_SECONDS: int
+    DISCORD_ATTACH_IMAGES: bool
+    IMAGE_CACHE_DIR: str
+    HTML_CACHE_DIR: str
+    HTML_CACHE_TTL_SECONDS: int
+
+    # ---- Whiskey release scanner ----
+    RELEASE_USE_BROWSER: bool
+    RELEASE_BROWSER_TIMEOUT_MS: int
+    ENABLE_RELEASE_SCANNER: bool
+    RELEASE_PAGE_URL: Optional[str]
+    RELEASE_CHECK_INTERVAL_SECONDS: int
+    POLITE_DELAY_MS: int
+    SNIFF_CACHE_DIR: str
+
+    # ---- Email notifications ----
+    EMAIL_ENABLED: bool
+    EMAIL_SMTP_HOST: str
+    EMAIL_SMTP_PORT: int
+    EMAIL_USE_TLS: bool
+    EMAIL_USERNAME: Optional[str]
+    EMAIL_PASSWORD: Optional[str]
+    EMAIL_FROM: Optional[str]
+    EMAIL_TO: List[str]
+    EMAIL_SUBJECT_PREFIX: str
+
+    # ---- Auto checkout ----
+    AUTO_CHECKOUT_ENABLED: bool
+    AUTO_CHECKOUT_EVENTS: set[str]
+    AUTO_CHECKOUT_DRY_RUN: bool
+    AUTO_CHECKOUT_KEYWORDS_CSV: str
+    AUTO_CHECKOUT_KEYWORDS: List[str]
+    AUTO_CHECKOUT_MATCH_MODE: str
+    AUTO_CHECKOUT_SEARCH_FIELDS: tuple[str, ...]
+    AUTO_CHECKOUT_INCLUDE_KEYWORDS: list[str]
+    AUTO_CHECKOUT_EXCLUDE_KEYWORDS: list[str]
+    AUTO_CHECKOUT_MIN_QTY: int
+    AUTO_CHECKOUT_MAX_CONCURRENCY: int
+    AUTO_CHECKOUT_ASCII_MATCH: bool
+    AUTO_CHECKOUT_SUCCESS_PATTERNS: tuple[str, ...]
+    AUTO_CHECKOUT_FAILURE_PATTERNS: tuple[str, ...]
+    AUTO_CHECKOUT_DIR: str
+    AUTO_CHECKOUT_SCRIPT: str
+    AUTO_CHECKOUT_NODE: str
+
+    # Buyer info (only via env — don’t commit these)
+    CHECKOUT_FIRST_NAME: str
+    CHECKOUT_LAST_NAME: str
+    CHECKOUT_EMAIL: str
+    CHECKOUT_PHONE: str
+    CHECKOUT_ADDRESS: str
+    CHECKOUT_CITY: str
+    CHECKOUT_ZIP: str
+    CHECKOUT_CARDHOLDER_NAME: str
+    CHECKOUT_CARD_NUMBER: str
+    CHECKOUT_CVV: str
+    CHECKOUT_EXPIRY: str
+    CHECKOUT_HEADLESS: str
+    CHECKOUT_ENV_OVERLAY: dict[str, str]
+
+
+def _load_config() -> Config:
+    """Parse the environment into a Config. Runs once per process."""
+
+    # Primary/legacy single category (kept for backward compatibility).
+    # For Whiskey, FWGS uses Endeca node "4036262580".
+    category_id = _get_env("CATEGORY_ID", "4036262580")
+
+    # Multiple Endeca category/node IDs to scrape in one pass.
+    # Comma-separated list. If unset, we fall back to [CATEGORY_ID].
+    category_ids = _get_list("CATEGORY_IDS") or [category_id]
+
+    watchlist_ids_csv = _get_env("WATCHLIST_IDS", "") or ""
+
+    auto_checkout_keywords_csv = _get_env("AUTO_CHECKOUT_KEYWORDS", "") or ""
+
+    checkout_first_name = os.getenv("CHECKOUT_FIRST_NAME", "")
+    checkout_last_name  = os.getenv("CHECKOUT_LAST_NAME", "")
+    checkout_email      = os.getenv("CHECKOUT_EMAIL", "")
+    checkout_phone      = os.getenv("CHECKOUT_PHONE", "")
+    checkout_address    = os.getenv("CHECKOUT_ADDRESS", "")
+    checkout_city       = os.getenv("CHECKOUT_CITY", "")
+    checkout_zip        = os.getenv("CHECKOUT_ZIP", "")
+    checkout_cardholder = os.getenv("CHECKOUT_CARDHOLDER_NAME", "")
+    checkout_card       = os.getenv("CHECKOUT_CARD_NUMBER", "")
+    checkout_cvv        = os.getenv("CHECKOUT_CVV", "")
+    checkout_expiry     = os.getenv("CHECKOUT_EXPIRY", "")
+    checkout_headless   = os.getenv("CHECKOUT_HEADLESS", "true")
+
+    # Constant overlay passed to the Node checkout runner; built once so each
+    # checkout attempt only has to add PRODUCT_URL on top.
+    checkout_env_overlay = {
+        "CHECKOUT_FIRST_NAME": checkout_first_name,
+        "CHECKOUT_LAST_NAME":  checkout_last_name,
+        "CHECKOUT_EMAIL":      checkout_email,
+        "CHECKOUT_PHONE":      checkout_phone,
+        "CHECKOUT_ADDRESS":    checkout_address,
+        "CHECKOUT_CITY":       checkout_city,
+        "CHECKOUT_ZIP":        checkout_zip,
+        "CHECKOUT_CARDHOLDER_NAME": checkout_cardholder,
+        "CHECKOUT_CARD_NUMBER":     checkout_card,
+        "CHECKOUT_CVV":             checkout_cvv,
+        "CHECKOUT_EXPIRY":          checkout_expiry,
+        "CHECKOUT_HEADLESS":        checkout_headless,
+    }
+
+    return Config(
+        CATEGORY_ID=category_id,
+        ONLINE_EXCLUSIVE_CATEGORY_IDS=frozenset(
+            (os.getenv("ONLINE_EXCLUSIVE_CATEGORY_IDS") or "3030473779").split(",")
+        ),
+        CATEGORY_IDS=category_ids,
+        SCRAPE_INTERVAL_MINUTES=_parse_int(_get_env("SCRAPE_INTERVAL_MINUTES", "10"), 10),
+        DISCORD_WEBHOOK_URL=_get_env("DISCORD_WEBHOOK_URL"),
+        # Base URL for the OCC API. Should not include a trailing slash.
+        BASE_URL=_get_env("BASE_URL", "https://www.finewineandgoodspirits.com"),
+        SQLITE_DB_PATH=_get_env("SQLITE_DB_PATH", "monitor.db"),
+        LOG_LEVEL=_get_env("LOG_LEVEL", "INFO"),
+        # OSF assembler page size request (server may cap).
+        ASSEMBLER_NRPP=_parse_int(_get_env("ASSEMBLER_NRPP", "2000"), 2000),
+        # Optional sort expression for assembler (Ns parameter). Blank = default.
+        ASSEMBLER_NS=_get_env("ASSEMBLER_NS"),
+        # Legacy v1/products fallback category slug.
+        LEGACY_CATEGORY_ID=_get_env("LEGACY_CATEGORY_ID", "151"),
+        ENABLE_REMOVED_EVENTS=_parse_bool(_get_env("ENABLE_REMOVED_EVENTS", "false"), False),
+        ENABLE_STOCK_EVENTS=_parse_bool(_get_env("ENABLE_STOCK_EVENTS", "true"), True),
+        # Skip stock requests for SKUs that reported zero within this window
+        # (0 disables; skipping delays restock detection by up to the window).
+        ZERO_STOCK_SKIP_SECONDS=_parse_int(_get_env("ZERO_STOCK_SKIP_SECONDS", "0"), 0),
+        # If > 0, cap product notifications per cycle (ingestion unaffected).
+        MAX_NOTIFY=_parse_int(_get_env("MAX_NOTIFY", "0"), 0),
+        # Parallel webhook/image workers per notification burst (1 = serial).
+        NOTIFY_CONCURRENCY=max(1, _parse_int(_get_env("NOTIFY_CONCURRENCY", "8"), 8)),
+        ENABLE_WATCHLIST=_parse_bool(_get_env("ENABLE_WATCHLIST", "false"), False),
+        WATCHLIST_INTERVAL_SECONDS=_parse_int(_get_env("WATCHLIST_INTERVAL_SECONDS", "5"), 5),
+        WATCHLIST_IDS_CSV=watchlist_ids_csv,
+        WATCHLIST_IDS=[s.strip() for s in watchlist_ids_csv.split(",") if s.strip()],
+        # Optional simulator for local testing (forces a flip from 0→1 once).
+        SIMULATE_WATCHLIST_FLIP=_parse_bool(_get_env("SIMULATE_WATCHLIST_FLIP", "false"), False),
+        ENABLE_FRONT_PAGE_SCANNER=_parse_bool(_get_env("ENABLE_FRONT_PAGE_SCANNER", "false"), False),
+        FRONT_PAGE_NRPP=_parse_int(_get_env("FRONT_PAGE_NRPP", "120"), 120),
+        # Optional sort expression specifically for "newest first" heuristic.
+        ASSEMBLER_NS_NEW=_get_env("ASSEMBLER_NS_NEW"),
+        PRICE_FIXER_ENABLED=_parse_bool(_get_env("PRICE_FIXER_ENABLED", "false"), False),
+        ENRICHMENT_BATCH_SIZE=_parse_int(_get_env("ENRICHMENT_BATCH_SIZE", "10"), 10),
+        # Concurrent page fetches during enrichment (starts stay paced by
+        # ENRICHMENT_REQUEST_DELAY either way).
+        ENRICHMENT_WORKERS=_parse_int(_get_env("ENRICHMENT_WORKERS", "8"), 8),
+        # Delay between per-product HTML requests (seconds)
+        ENRICHMENT_REQUEST_DELAY=_parse_float(_get_env("ENRICHMENT_REQUEST_DELAY", "1.5"), 1.5),
+        # Wait time between enrichment batches (seconds)
+        ENRICHMENT_LOOP_INTERVAL_SECONDS=_parse_int(
+            _get_env("ENRICHMENT_LOOP_INTERVAL_SECONDS", "60"), 60
+        ),
+        # Whether to upload images to Discord as attachments (most reliable).
+        DISCORD_ATTACH_IMAGES=_parse_bool(_get_env("DISCORD_ATTACH_IMAGES", "false")),
+        # On-disk cache for notification images (empty string disables it).
+        IMAGE_CACHE_DIR=_get_env("IMAGE_CACHE_DIR", "image_cache"),
+        # Short-TTL cache for enrichment HTML (empty dir disables it).
+        HTML_CACHE_DIR=_get_env("HTML_CACHE_DIR", "html_cache"),
+        HTML_CACHE_TTL_SECONDS=_parse_int(_get_env("HTML_CACHE_TTL_SECONDS", "900"), 900),
+        RELEASE_USE_BROWSER=_parse_bool(_get_env("RELEASE_USE_BROWSER", "false"), False),
+        RELEASE_BROWSER_TIMEOUT_MS=_parse_int(_get_env("RELEASE_BROWSER_TIMEOUT_MS", "120000"), 120000),
+        ENABLE_RELEASE_SCANNER=_parse_bool(_get_env("ENABLE_RELEASE_SCANNER", "false"), False),
+        RELEASE_PAGE_URL=_get_env(
+            "RELEASE_PAGE_URL",
+            "https://www.finewineandgoodspirits.com/whiskey-release/whiskey-release",
+        ),
+        RELEASE_CHECK_INTERVAL_SECONDS=_parse_int(_get_env("RELEASE_CHECK_INTERVAL_SECONDS", "15"), 15),
+        # Minimum gap between release-page requests to the same host (0 disables).
+        POLITE_DELAY_MS=_parse_int(_get_env("POLITE_DELAY_MS", "150"), 150),
+        # On-disk cache for sniffed release JSON payloads (empty string disables it).
+        SNIFF_CACHE_DIR=_get_env("SNIFF_CACHE_DIR", "sniff_cache"),
+        EMAIL_ENABLED=_parse_bool(_get_env("EMAIL_ENABLED", "false"), False),
+        EMAIL_SMTP_HOST=_get_env("EMAIL_SMTP_HOST", "smtp.gmail.com"),
+        EMAIL_SMTP_PORT=_parse_int(_get_env("EMAIL_SMTP_PORT", "587"), 587),  # 587 (TLS) or 465 (SSL)
+        EMAIL_USE_TLS=_parse_bool(_get_env("EMAIL_USE_TLS", "true"), True),  # if False and port=465, SSL will be used
+        EMAIL_USERNAME=_get_env("EMAIL_USERNAME"),
+        EMAIL_PASSWORD=_get_env("EMAIL_PASSWORD"),  # app password if using Gmail
+        EMAIL_FROM=_get_env("EMAIL_FROM"),
+        EMAIL_TO=_get_list("EMAIL_TO"),  # comma-separated
+        EMAIL_SUBJECT_PREFIX=_get_env("EMAIL_SUBJECT_PREFIX", "[FWGS]"),
+        AUTO_CHECKOUT_ENABLED=(os.getenv("AUTO_CHECKOUT_ENABLED", "false").lower() == "true"),
+        AUTO_CHECKOUT_EVENTS=set(os.getenv("AUTO_CHECKOUT_EVENTS", "available,new").split(",")),
+        AUTO_CHECKOUT_DRY_RUN=(os.getenv("AUTO_CHECKOUT_DRY_RUN", "true").lower() == "true"),
+        # Keywords that trigger auto-checkout when found in product names
+        AUTO_CHECKOUT_KEYWORDS_CSV=auto_checkout_keywords_csv,
+        AUTO_CHECKOUT_KEYWORDS=[
+            s.strip().lower() for s in auto_checkout_keywords_csv.split(",") if s.strip()
+        ],
+        # any = product matches at least one keyword, all = must match every keyword
+        AUTO_CHECKOUT_MATCH_MODE=os.getenv("AUTO_CHECKOUT_MATCH_MODE", "any").strip().lower(),
+        # which fields to search for keywords (comma-separated: name,page_url,id)
+        AUTO_CHECKOUT_SEARCH_FIELDS=_get_keywords("AUTO_CHECKOUT_SEARCH_FIELDS", "name,page_url"),
+        AUTO_CHECKOUT_INCLUDE_KEYWORDS=list(_get_keywords("AUTO_CHECKOUT_INCLUDE_KEYWORDS")),
+        AUTO_CHECKOUT_EXCLUDE_KEYWORDS=list(_get_keywords("AUTO_CHECKOUT_EXCLUDE_KEYWORDS")),
+        AUTO_CHECKOUT_MIN_QTY=_parse_int(_get_env("AUTO_CHECKOUT_MIN_QTY", "1"), 1),
+        # Max simultaneous checkout runs; 1 keeps the fully-serialized behaviour.
+        AUTO_CHECKOUT_MAX_CONCURRENCY=max(
+            1, _parse_int(_get_env("AUTO_CHECKOUT_MAX_CONCURRENCY", "1"), 1)
+        ),
+        # Fold keyword haystacks to ASCII bytes (one C translate call) instead
+        # of Unicode-aware str.lower(); safe for FWGS product names/URLs.
+        AUTO_CHECKOUT_ASCII_MATCH=_parse_bool(_get_env("AUTO_CHECKOUT_ASCII_MATCH", "false"), False),
+        # Patterns used to classify the Node checkout script's output.
+        AUTO_CHECKOUT_SUCCESS_PATTERNS=_get_keywords(
+            "AUTO_CHECKOUT_SUCCESS_PATTERNS", "checkout completed,success: true"
+        ),
+        AUTO_CHECKOUT_FAILURE_PATTERNS=_get_keywords(
+            "AUTO_CHECKOUT_FAILURE_PATTERNS", "error,failed,timeout,declined"
+        ),
+        # Paths for the Node runner: DIR = repo root, SCRIPT = JS inside the package
+        AUTO_CHECKOUT_DIR=os.getenv("AUTO_CHECKOUT_DIR", str(Path(__file__).resolve().parents[1])),
+        AUTO_CHECKOUT_SCRIPT=os.getenv(
+            "AUTO_CHECKOUT_SCRIPT", "product_monitor_service/generalized_checkout.js"
+        ),
+        AUTO_CHECKOUT_NODE=os.getenv("AUTO_CHECKOUT_NODE", shutil.which("node") or "node"),
+        CHECKOUT_FIRST_NAME=checkout_first_name,
+        CHECKOUT_LAST_NAME=checkout_last_name,
+        CHECKOUT_EMAIL=checkout_email,
+        CHECKOUT_PHONE=checkout_phone,
+        CHECKOUT_ADDRESS=checkout_address,
+        CHECKOUT_CITY=checkout_city,
+        CHECKOUT_ZIP=checkout_zip,
+        CHECKOUT_CARDHOLDER_NAME=checkout_cardholder,
+        CHECKOUT_CARD_NUMBER=checkout_card,
+        CHECKOUT_CVV=checkout_cvv,
+        CHECKOUT_EXPIRY=checkout_expiry,
+        CHECKOUT_HEADLESS=checkout_headless,
+        CHECKOUT_ENV_OVERLAY=checkout_env_overlay,
+    )
+
+
+@lru_cache(maxsize=1)
+def get_config() -> Config:
+    """Return the process-wide configuration snapshot."""
+    return _load_config()
+
 
 # ---- Validation --------------------------------------------------------------
 
 def validate() -> None:
     """Validate required configuration parameters."""
-    if not DISCORD_WEBHOOK_URL:
+    if not get_config().DISCORD_WEBHOOK_URL:
         raise RuntimeError(
             "DISCORD_WEBHOOK_URL must be set. See .env.example for details."
         )
-# ---- Email notifications -----------------------------------------------------
 
-def _get_list(name: str) -> list[str]:
-    raw = _get_env(name, "") or ""
-    return [s.strip() for s in raw.split(",") if s.strip()]
 
-EMAIL_ENABLED: bool = _parse_bool(_get_env("EMAIL_ENABLED", "false"), False)
-EMAIL_SMTP_HOST: str = _get_env("EMAIL_SMTP_HOST", "smtp.gmail.com")
-EMAIL_SMTP_PORT: int = int(_get_env("EMAIL_SMTP_PORT", "587"))  # 587 (TLS) or 465 (SSL)
-EMAIL_USE_TLS: bool = _parse_bool(_get_env("EMAIL_USE_TLS", "true"), True)  # if False and port=465, SSL will be used
-EMAIL_USERNAME: str | None = _get_env("EMAIL_USERNAME")
-EMAIL_PASSWORD: str | None = _get_env("EMAIL_PASSWORD")  # app password if using Gmail
-EMAIL_FROM: str | None = _get_env("EMAIL_FROM")
-EMAIL_TO: list[str] = _get_list("EMAIL_TO")  # comma-separated
-EMAIL_SUBJECT_PREFIX: str = _get_env("EMAIL_SUBJECT_PREFIX", "[FWGS]")
-
-# ---- auto checkout -----------------------------------------------------
-
-AUTO_CHECKOUT_ENABLED = (os.getenv("AUTO_CHECKOUT_ENABLED","false").lower() == "true")
-AUTO_CHECKOUT_EVENTS  = set(os.getenv("AUTO_CHECKOUT_EVENTS","available,new").split(","))
-AUTO_CHECKOUT_DRY_RUN = (os.getenv("AUTO_CHECKOUT_DRY_RUN","true").lower() == "true")
-
-# Keywords that trigger auto-checkout when found in product names (comma-separated)
-AUTO_CHECKOUT_KEYWORDS_CSV: str = _get_env("AUTO_CHECKOUT_KEYWORDS", "") or ""
-AUTO_CHECKOUT_KEYWORDS: List[str] = [s.strip().lower() for s in AUTO_CHECKOUT_KEYWORDS_CSV.split(",") if s.strip()]
-
-# NEW: paths for the Node runner
-# DIR = repo root, SCRIPT = path to the JS inside the package
-AUTO_CHECKOUT_DIR    = os.getenv("AUTO_CHECKOUT_DIR", str(Path(__file__).resolve().parents[1]))
-AUTO_CHECKOUT_SCRIPT = os.getenv("AUTO_CHECKOUT_SCRIPT", "product_monitor_service/generalized_checkout.js")
-AUTO_CHECKOUT_NODE   = os.getenv("AUTO_CHECKOUT_NODE", shutil.which("node") or "node")
-
-# Buyer info (only via env — don’t commit these)
-CHECKOUT_FIRST_NAME = os.getenv("CHECKOUT_FIRST_NAME","")
-CHECKOUT_LAST_NAME  = os.getenv("CHECKOUT_LAST_NAME","")
-CHECKOUT_EMAIL      = os.getenv("CHECKOUT_EMAIL","")
-CHECKOUT_PHONE      = os.getenv("CHECKOUT_PHONE","")
-CHECKOUT_ADDRESS    = os.getenv("CHECKOUT_ADDRESS","")
-CHECKOUT_CITY       = os.getenv("CHECKOUT_CITY","")
-CHECKOUT_ZIP        = os.getenv("CHECKOUT_ZIP","")
-CHECKOUT_CARDHOLDER_NAME = os.getenv("CHECKOUT_CARDHOLDER_NAME","")
-CHECKOUT_CARD_NUMBER     = os.getenv("CHECKOUT_CARD_NUMBER","")
-CHECKOUT_CVV             = os.getenv("CHECKOUT_CVV","")
-CHECKOUT_EXPIRY          = os.getenv("CHECKOUT_EXPIRY","")
-CHECKOUT_HEADLESS        = os.getenv("CHECKOUT_HEADLESS","true")
-
-# ---- auto checkout -----------------------------------------------------
-
-AUTO_CHECKOUT_ENABLED = (os.getenv("AUTO_CHECKOUT_ENABLED","false").lower() == "true")
-AUTO_CHECKOUT_EVENTS  = set(os.getenv("AUTO_CHECKOUT_EVENTS","available,new").split(","))
-AUTO_CHECKOUT_DRY_RUN = (os.getenv("AUTO_CHECKOUT_DRY_RUN","true").lower() == "true")
-
-# NEW: keyword gating for auto-checkout
-_AUTO_CHECKOUT_KEYWORDS_RAW = os.getenv("AUTO_CHECKOUT_KEYWORDS", "") or ""
-AUTO_CHECKOUT_KEYWORDS: List[str] = [s.strip().lower() for s in _AUTO_CHECKOUT_KEYWORDS_RAW.split(",") if s.strip()]
-
-# any = product matches at least one keyword, all = product must match every keyword
-AUTO_CHECKOUT_MATCH_MODE = os.getenv("AUTO_CHECKOUT_MATCH_MODE", "any").strip().lower()  # "any" | "all"
-
-# which fields to search for keywords (comma-separated: name,page_url,id)
-_AUTO_CHECKOUT_SEARCH_FIELDS_RAW = os.getenv("AUTO_CHECKOUT_SEARCH_FIELDS", "name,page_url") or ""
-AUTO_CHECKOUT_SEARCH_FIELDS: List[str] = [s.strip().lower() for s in _AUTO_CHECKOUT_SEARCH_FIELDS_RAW.split(",") if s.strip()]
-_AUTO_INC = _get_env("AUTO_CHECKOUT_INCLUDE_KEYWORDS", "") or ""
-_AUTO_EXC = _get_env("AUTO_CHECKOUT_EXCLUDE_KEYWORDS", "") or ""
-AUTO_CHECKOUT_INCLUDE_KEYWORDS: list[str] = [s.strip().lower() for s in _AUTO_INC.split(",") if s.strip()]
-AUTO_CHECKOUT_EXCLUDE_KEYWORDS: list[str] = [s.strip().lower() for s in _AUTO_EXC.split(",") if s.strip()]
-
-try:
-    AUTO_CHECKOUT_MIN_QTY: int = int(_get_env("AUTO_CHECKOUT_MIN_QTY", "1"))
-except ValueError:
-    AUTO_CHECKOUT_MIN_QTY = 1
+def __getattr__(name: str):
+    # PEP 562: keep `config.FOO` / `from .config import FOO` call sites working
+    # against the cached snapshot without re-parsing the environment.
+    try:
+        return getattr(get_config(), name)
+    except AttributeError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | {f.name for f in Config.__dataclass_fields__.values()})
 
 
 __all__ = [
@@ -256,7 +373,9 @@ __all__ = [
     # Flags & limits
     "ENABLE_REMOVED_EVENTS",
     "ENABLE_STOCK_EVENTS",
+    "ZERO_STOCK_SKIP_SECONDS",
     "MAX_NOTIFY",
+    "NOTIFY_CONCURRENCY",
     # Watchlist
     "ENABLE_WATCHLIST",
     "WATCHLIST_INTERVAL_SECONDS",
@@ -269,32 +388,31 @@ __all__ = [
     # Enrichment
     "PRICE_FIXER_ENABLED",
     "ENRICHMENT_BATCH_SIZE",
+    "ENRICHMENT_WORKERS",
     "ENRICHMENT_REQUEST_DELAY",
     "ENRICHMENT_LOOP_INTERVAL_SECONDS",
     "DISCORD_ATTACH_IMAGES",
+    "IMAGE_CACHE_DIR",
+    "HTML_CACHE_DIR",
+    "HTML_CACHE_TTL_SECONDS",
     # Release page scanner
     "ENABLE_RELEASE_SCANNER",
     "RELEASE_PAGE_URL",
     "RELEASE_CHECK_INTERVAL_SECONDS",
     "RELEASE_USE_BROWSER",
     "RELEASE_BROWSER_TIMEOUT_MS",
+    "POLITE_DELAY_MS",
+    "SNIFF_CACHE_DIR",
     # Helpers
     "validate",
+    "get_config",
     "EMAIL_ENABLED", "EMAIL_SMTP_HOST", "EMAIL_SMTP_PORT", "EMAIL_USE_TLS",
     "EMAIL_USERNAME", "EMAIL_PASSWORD", "EMAIL_FROM", "EMAIL_TO", "EMAIL_SUBJECT_PREFIX",
     # Auto checkout
     "AUTO_CHECKOUT_ENABLED", "AUTO_CHECKOUT_EVENTS", "AUTO_CHECKOUT_DRY_RUN", "AUTO_CHECKOUT_KEYWORDS",
+    "AUTO_CHECKOUT_MATCH_MODE", "AUTO_CHECKOUT_SEARCH_FIELDS",
     "AUTO_CHECKOUT_DIR", "AUTO_CHECKOUT_SCRIPT", "AUTO_CHECKOUT_NODE",
     "CHECKOUT_FIRST_NAME", "CHECKOUT_LAST_NAME", "CHECKOUT_EMAIL", "CHECKOUT_PHONE",
     "CHECKOUT_ADDRESS", "CHECKOUT_CITY", "CHECKOUT_ZIP", "CHECKOUT_CARDHOLDER_NAME",
     "CHECKOUT_CARD_NUMBER", "CHECKOUT_CVV", "CHECKOUT_EXPIRY", "CHECKOUT_HEADLESS",
-    "AUTO_CHECKOUT_ENABLED",
-    "AUTO_CHECKOUT_EVENTS",
-    "AUTO_CHECKOUT_DRY_RUN",
-    "AUTO_CHECKOUT_KEYWORDS",
-    "AUTO_CHECKOUT_MATCH_MODE",
-    "AUTO_CHECKOUT_SEARCH_FIELDS",
-    "AUTO_CHECKOUT_DIR",
-    "AUTO_CHECKOUT_SCRIPT",
-    "AUTO_CHECKOUT_NODE",
 ]
@@ -3,27 +3,199 @@
 from __future__ import annotations
 
 import datetime as _dt
+import logging
 import sqlite3
+import threading
+import time
 from pathlib import Path
 from typing import Iterable, Mapping
 
 from .config import SQLITE_DB_PATH
 from .scraper import Product
 
+logger = logging.getLogger(__name__)
+
+# The maintenance thread wakes every 5 minutes for a PASSIVE WAL checkpoint;
+# every third cycle it runs a TRUNCATE checkpoint (reclaims the -wal file
+# during quiet windows) plus PRAGMA optimize for planner stats.
+_MAINTENANCE_INTERVAL_SECONDS = 5 * 60
+_DEEP_MAINTENANCE_EVERY = 3
+_maintenance_started = False
+
+# One connection per thread, opened lazily and kept for the life of the
+# thread. Opening a connection per call meant re-reading the schema and
+# re-applying pragmas on every query; WAL plus busy_timeout makes long-lived
+# connections safe across the scraper loops and the checkout server threads.
+_tls = threading.local()
+
+# Create the database directory once per process, not once per connection.
+_dir_ready = False
+
+def _ensure_db_dir() -> None:
+    global _dir_ready
+    if not _dir_ready:
+        Path(SQLITE_DB_PATH).parent.mkdir(parents=True, exist_ok=True)
+        _dir_ready = True
+
 def _get_connection() -> sqlite3.Connection:
-    Path(SQLITE_DB_PATH).parent.mkdir(parents=True, exist_ok=True)
-    conn = sqlite3.connect(SQLITE_DB_PATH)
+    conn = getattr(_tls, "conn", None)
+    if conn is not None:
+        return conn
+    _ensure_db_dir()
+    # isolation_level=None: we manage transactions explicitly (BEGIN IMMEDIATE
+    # in the bulk writers below) instead of relying on sqlite3's implicit ones.
+    conn = sqlite3.connect(SQLITE_DB_PATH, isolation_level=None)
     conn.execute("PRAGMA foreign_keys = ON")
+    # Session-level tuning (journal_mode=WAL itself is persistent and set in
+    # init_db): NORMAL sync halves fsyncs per commit under WAL, busy_timeout
+    # keeps concurrent readers/writers from failing fast, and the memory
+    # settings keep temp structures and hot pages off disk.
+    conn.execute("PRAGMA synchronous = NORMAL")
+    conn.execute("PRAGMA busy_timeout = 30000")
+    conn.execute("PRAGMA temp_store = MEMORY")
+    conn.execute("PRAGMA mmap_size = 268435456")
+    conn.execute("PRAGMA cache_size = -65536")
+    _tls.conn = conn
     return conn
 
+def _maintenance_loop() -> None:
+    """Periodically checkpoint the WAL and refresh planner statistics."""
+    cycle = 0
+    while True:
+        time.sleep(_MAINTENANCE_INTERVAL_SECONDS)
+        cycle += 1
+        try:
+            conn = _get_connection()
+            if cycle % _DEEP_MAINTENANCE_EVERY:
+                conn.execute("PRAGMA wal_checkpoint(PASSIVE)")
+            else:
+                conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+                conn.execute("PRAGMA optimize")
+        except sqlite3.Error:
+            logger.exception("SQLite maintenance pass failed")
+
+def _start_maintenance_thread() -> None:
+    global _maintenance_started
+    if _maintenance_started:
+        return
+    _maintenance_started = True
+    threading.Thread(target=_maintenance_loop, name="db-maintenance", daemon=True).start()
+
+# Hoisted SQL so sqlite3's per-connection statement cache gets identical
+# strings on every call.
+_SQL_MARK_SEEN = (
+    "INSERT OR IGNORE INTO seen_products (repository_id, first_seen) VALUES (?, ?)"
+)
+
+# Fast path: every incoming field is trusted (non-empty urls, price > 0), so
+# no CASE branches run in the VDBE per row.
+_SQL_UPSERT_FULL = """
+    INSERT INTO products (
+    repository_id, name, price, image_url, page_url,
+    quantity, first_seen, last_seen, removed, available,
+    is_online_exclusive
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(repository_id) DO UPDATE SET
+    name       = excluded.name,
+    image_url  = excluded.image_url,
+    page_url   = excluded.page_url,
+    quantity   = excluded.quantity,
+    last_seen  = excluded.last_seen,
+    removed    = excluded.removed,
+    available  = excluded.available,
+    is_online_exclusive = excluded.is_online_exclusive,
+    price      = excluded.price
+"""
+
+# Merge path: keeps existing price/urls when the incoming row is incomplete.
+_SQL_UPSERT_MERGE = """
+    INSERT INTO products (
+    repository_id, name, price, image_url, page_url,
+    quantity, first_seen, last_seen, removed, available,
+    is_online_exclusive
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(repository_id) DO UPDATE SET
+    name       = excluded.name,
+    image_url  = CASE
+                    WHEN excluded.image_url IS NOT NULL AND excluded.image_url <> '' THEN excluded.image_url
+                    ELSE products.image_url
+                END,
+    page_url   = CASE
+                    WHEN excluded.page_url  IS NOT NULL AND excluded.page_url  <> '' THEN excluded.page_url
+                    ELSE products.page_url
+                END,
+    quantity   = excluded.quantity,
+    last_seen  = excluded.last_seen,
+    removed    = excluded.removed,
+    available  = excluded.available,
+    is_online_exclusive = excluded.is_online_exclusive,
+    price      = CASE
+                    WHEN excluded.price IS NOT NULL AND excluded.price > 0
+                    THEN excluded.price
+                    ELSE products.price
+                END
+"""
+
+_SQL_MARK_REMOVED = """
+    UPDATE products
+       SET removed = 1,
+           available = 0,
+           last_seen = ?
+     WHERE repository_id = ?
+"""
+
+_SQL_ADD_WATCHLIST = (
+    "INSERT OR IGNORE INTO watchlist (repository_id, notes) VALUES (?, ?)"
+)
+
+_SQL_COMING_SOON_ACTIVE = """
+    INSERT INTO coming_soon (repository_id, first_seen, last_seen, active)
+    VALUES (?, ?, ?, 1)
+    ON CONFLICT(repository_id) DO UPDATE SET
+        last_seen=excluded.last_seen,
+        active=1
+"""
+
+_SQL_COMING_SOON_INACTIVE = """
+    UPDATE coming_soon
+    SET last_seen = ?, active = 0
+    WHERE repository_id = ?
+"""
+
+def _utc_now_iso() -> str:
+    # utcnow() is deprecated; aware UTC timestamps sort the same way.
+    return _dt.datetime.now(_dt.timezone.utc).isoformat()
+
+def _bulk_write(sql: str, rows: Iterable[tuple]) -> None:
+    """Run executemany over *rows* inside one explicit write transaction."""
+    conn = _get_connection()
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        conn.executemany(sql, rows)
+        conn.execute("COMMIT")
+    except Exception:
+        conn.rollback()
+        raise
+
 def init_db() -> None:
     """Create tables if they don't exist."""
     with _get_connection() as conn:
+        # WAL lets the checkout server's reads proceed concurrently with the
+        # scraper's writes; the mode persists in the database file.
+        conn.execute("PRAGMA journal_mode=WAL")
+        # Raise the autocheckpoint threshold so full-catalog upsert bursts
+        # don't hit a synchronous checkpoint mid-write; the maintenance
+        # thread checkpoints during idle windows instead.
+        conn.execute("PRAGMA wal_autocheckpoint=10000")
+        # repository_id stays TEXT: FWGS ids are zero-padded strings
+        # ("000008520"), so an INTEGER key would corrupt them. STRICT (SQLite
+        # 3.37+) at least disables per-insert type-affinity coercion; existing
+        # databases keep their old schema via IF NOT EXISTS.
         conn.execute("""
           CREATE TABLE IF NOT EXISTS seen_products (
             repository_id TEXT PRIMARY KEY,
             first_seen TEXT NOT NULL
-          )
+          ) STRICT
         """)
         conn.execute("""
           CREATE TABLE IF NOT EXISTS products (
@@ -38,13 +210,13 @@ def init_db() -> None:
             removed INTEGER NOT NULL DEFAULT 0,
             available INTEGER NOT NULL DEFAULT 1,
             is_online_exclusive INTEGER NOT NULL DEFAULT 0
-          )
+          ) STRICT
         """)
         conn.execute("""
          CREATE TABLE IF NOT EXISTS watchlist (
            repository_id TEXT PRIMARY KEY,
            notes TEXT
-         )
+         ) STRICT
         """)
         conn.execute("""
          CREATE TABLE IF NOT EXISTS coming_soon (
@@ -52,7 +224,7 @@ def init_db() -> None:
            first_seen TEXT NOT NULL,
            last_seen  TEXT NOT NULL,
            active     INTEGER NOT NULL DEFAULT 1
-         )
+         ) STRICT
         """)
 
         # --- Migration guard for older DBs (idempotent) ---
@@ -63,42 +235,119 @@ def init_db() -> None:
 
         # Helpful index if you filter on OE
         conn.execute("CREATE INDEX IF NOT EXISTS idx_products_is_oe ON products(is_online_exclusive)")
+        # Covers count_products(): both counts are answered from the partial
+        # index leaves without touching the main table.
+        conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_products_available_qty
+            ON products(available, quantity) WHERE removed = 0
+        """)
+        # Partial index matching get_candidates_for_enrichment's predicate and
+        # sort key: the poll scans only not-yet-priced rows instead of sorting
+        # the whole table.
+        conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_products_needs_enrich
+            ON products(last_seen) WHERE price IS NULL OR price <= 0
+        """)
         conn.commit()
+    _load_seen_cache()
+    _start_maintenance_thread()
+
+
+# seen_products is append-only and small, so the full id set lives in memory
+# once loaded; has_seen / has_seen_many become hash lookups with no I/O.
+_seen_cache: set[str] | None = None
+_seen_lock = threading.Lock()
 
+def _load_seen_cache() -> set[str]:
+    global _seen_cache
+    with _seen_lock:
+        if _seen_cache is None:
+            cur = _get_connection().execute("SELECT repository_id FROM seen_products")
+            _seen_cache = {row[0] for row in cur.fetchall()}
+        return _seen_cache
 
 def has_seen(product_id: str) -> bool:
-    with _get_connection() as conn:
-        cur = conn.execute(
-            "SELECT 1 FROM seen_products WHERE repository_id = ? LIMIT 1",
-            (product_id,),
-        )
-        return cur.fetchone() is not None
+    return str(product_id) in _load_seen_cache()
 
 def mark_seen(product_ids: Iterable[str]) -> None:
-    now = _dt.datetime.utcnow().isoformat()
-    with _get_connection() as conn:
-        conn.executemany(
-            "INSERT OR IGNORE INTO seen_products (repository_id, first_seen) VALUES (?, ?)",
-            [(str(pid), now) for pid in product_ids],
-        )
-        conn.commit()
+    ids = [str(pid) for pid in product_ids]
+    now = _utc_now_iso()
+    _bulk_write(_SQL_MARK_SEEN, ((pid, now) for pid in ids))
+    cache = _load_seen_cache()
+    with _seen_lock:
+        cache.update(ids)
+
+def has_seen_many(product_ids: Iterable[str]) -> set[str]:
+    """Return the subset of *product_ids* already present in seen_products."""
+    cache = _load_seen_cache()
+    return {pid for pid in map(str, product_ids) if pid in cache}
+
+def count_products() -> tuple[int, int]:
+    """Return (active, in-stock) product counts from the partial index."""
+    cur = _get_connection().execute(
+        "SELECT COUNT(*), COALESCE(SUM(quantity > 0), 0) FROM products WHERE removed = 0"
+    )
+    total, available = cur.fetchone()
+    return int(total), int(available)
+
+def _product_row(cursor, row) -> Product:
+    # Positional: (id, name, price, image_url, page_url, quantity). The REAL
+    # and INTEGER column types already give float/int — no Python casts.
+    return Product(row[0], row[1], row[2], row[3], row[4], row[5])
+
+def get_product(product_id: str) -> Product | None:
+    """Fetch a single product by repository_id, or None if absent."""
+    cur = _get_connection().execute(
+        "SELECT repository_id, name, price, image_url, page_url, quantity"
+        " FROM products WHERE repository_id = ?",
+        (str(product_id),),
+    )
+    cur.row_factory = _product_row
+    return cur.fetchone()
 
 def get_all_products() -> Mapping[str, Product]:
     """Fetch all products from the DB, keyed by repository_id."""
-    with _get_connection() as conn:
-        cur = conn.execute("SELECT repository_id, name, price, image_url, page_url, quantity FROM products")
-        result: dict[str, Product] = {}
-        for row in cur.fetchall():
-            pid, name, price, image_url, page_url, qty = row
-            result[pid] = Product(
-                id=pid,
-                name=name,
-                price=float(price),
-                image_url=image_url,
-                page_url=page_url,
-                quantity=int(qty),
-            )
-        return result
+    cur = _get_connection().execute(
+        "SELECT repository_id, name, price, image_url, page_url, quantity FROM products"
+    )
+    cur.row_factory = _product_row
+    return {p.id: p for p in cur}
+
+# SQLite's default variable limit is 999; stay comfortably below it.
+_IN_CHUNK = 500
+
+def existing_ids(product_ids: Iterable[str]) -> set[str]:
+    """Return the subset of the given ids that already exist in products."""
+    ids = [str(pid) for pid in product_ids]
+    conn = _get_connection()
+    found: set[str] = set()
+    for i in range(0, len(ids), _IN_CHUNK):
+        chunk = ids[i : i + _IN_CHUNK]
+        placeholders = ",".join("?" * len(chunk))
+        cur = conn.execute(
+            f"SELECT repository_id FROM products WHERE repository_id IN ({placeholders})",
+            chunk,
+        )
+        found.update(r[0] for r in cur)
+    return found
+
+def get_products_by_ids(product_ids: Iterable[str]) -> dict[str, Product]:
+    """Fetch only the given products, keyed by repository_id (absent ids omitted)."""
+    ids = [str(pid) for pid in product_ids]
+    conn = _get_connection()
+    out: dict[str, Product] = {}
+    for i in range(0, len(ids), _IN_CHUNK):
+        chunk = ids[i : i + _IN_CHUNK]
+        placeholders = ",".join("?" * len(chunk))
+        cur = conn.execute(
+            "SELECT repository_id, name, price, image_url, page_url, quantity"
+            f" FROM products WHERE repository_id IN ({placeholders})",
+            chunk,
+        )
+        cur.row_factory = _product_row
+        for p in cur:
+            out[p.id] = p
+    return out
 
 def upsert_products(products: Iterable[Product]) -> None:
     """
@@ -106,11 +355,11 @@ def upsert_products(products: Iterable[Product]) -> None:
     Updates last_seen, removed, available flags.
     IMPORTANT: Preserve existing non-zero price if incoming price <= 0.
     """
-    now = _dt.datetime.utcnow().isoformat()
-
-    rows = []
+    now = _utc_now_iso()
+    fast_rows: list[tuple] = []
+    merge_rows: list[tuple] = []
     for p in products:
-        rows.append((
+        row = (
             str(p.id),
             str(p.name),
             float(p.price if p.price is not None else 0.0),
@@ -122,64 +371,54 @@ def upsert_products(products: Iterable[Product]) -> None:
             0,     # removed
             1,     # available
             int(getattr(p, "is_online_exclusive", 0)),
-        ))
-
-    with _get_connection() as conn:
-        conn.executemany("""
-            INSERT INTO products (
-            repository_id, name, price, image_url, page_url,
-            quantity, first_seen, last_seen, removed, available,
-            is_online_exclusive
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ON CONFLICT(repository_id) DO UPDATE SET
-            name       = excluded.name,
-            image_url  = CASE
-                            WHEN excluded.image_url IS NOT NULL AND excluded.image_url <> '' THEN excluded.image_url
-                            ELSE products.image_url
-                        END,
-            page_url   = CASE
-                            WHEN excluded.page_url  IS NOT NULL AND excluded.page_url  <> '' THEN excluded.page_url
-                            ELSE products.page_url
-                        END,
-            quantity   = excluded.quantity,
-            last_seen  = excluded.last_seen,
-            removed    = excluded.removed,
-            available  = excluded.available,
-            is_online_exclusive = excluded.is_online_exclusive,
-            price      = CASE
-                            WHEN excluded.price IS NOT NULL AND excluded.price > 0
-                            THEN excluded.price
-                            ELSE products.price
-                        END
-        """, rows)
-        conn.commit()
+        )
+        # Complete rows (typical scrape output) take the CASE-free statement;
+        # partial rows go through the merge that preserves existing values.
+        if row[2] > 0 and row[3] and row[4]:
+            fast_rows.append(row)
+        else:
+            merge_rows.append(row)
 
+    conn = _get_connection()
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        if fast_rows:
+            conn.executemany(_SQL_UPSERT_FULL, fast_rows)
+        if merge_rows:
+            conn.executemany(_SQL_UPSERT_MERGE, merge_rows)
+        conn.execute("COMMIT")
+    except Exception:
+        conn.rollback()
+        raise
 
 
 def mark_removed(product_ids: Iterable[str]) -> None:
-    now = _dt.datetime.utcnow().isoformat()
-    with _get_connection() as conn:
-        conn.executemany("""
-            UPDATE products
-               SET removed = 1,
-                   available = 0,
-                   last_seen = ?
-             WHERE repository_id = ?
-        """, [(now, str(pid)) for pid in product_ids])
-        conn.commit()
+    now = _utc_now_iso()
+    _bulk_write(_SQL_MARK_REMOVED, ((now, str(pid)) for pid in product_ids))
+
+# The watchlist changes rarely but is read every watchlist tick (~1s), so
+# keep it cached in-process and invalidate on write. All writes go through
+# this module in a single process, so invalidation beats any TTL guess.
+_watchlist_cache: list[str] | None = None
+_watchlist_lock = threading.Lock()
 
 def add_to_watchlist(product_ids: Iterable[str], notes: str | None = None) -> None:
-    with _get_connection() as conn:
-        conn.executemany(
-            "INSERT OR IGNORE INTO watchlist (repository_id, notes) VALUES (?, ?)",
-            [(str(pid), notes or "") for pid in product_ids],
-        )
-        conn.commit()
+    global _watchlist_cache
+    _bulk_write(_SQL_ADD_WATCHLIST, ((str(pid), notes or "") for pid in product_ids))
+    with _watchlist_lock:
+        _watchlist_cache = None
 
 def get_watchlist_ids() -> list[str]:
+    global _watchlist_cache
+    with _watchlist_lock:
+        if _watchlist_cache is not None:
+            return list(_watchlist_cache)
     with _get_connection() as conn:
         cur = conn.execute("SELECT repository_id FROM watchlist")
-        return [r[0] for r in cur.fetchall()]
+        ids = [r[0] for r in cur.fetchall()]
+    with _watchlist_lock:
+        _watchlist_cache = ids
+    return list(ids)
 
 def get_candidates_for_enrichment(limit: int = 25) -> list[dict]:
     """
@@ -211,28 +450,56 @@ def get_candidates_for_enrichment(limit: int = 25) -> list[dict]:
         ]
 
 
-def update_product_price_qty(
-    product_id: str, *, price: float | None = None, quantity: int | None = None
+def update_products_price_qty(
+    items: Iterable[tuple[str, float | None, int | None]]
 ) -> None:
     """
-    Update price/quantity for a single product. Only sets fields provided (non-None).
+    Bulk-update price/quantity for many products in one transaction.
+    Each item is (product_id, price, quantity); None fields are left untouched.
     """
-    sets, params = [], []
-    if price is not None:
-        sets.append("price = ?")
-        params.append(float(price))
-    if quantity is not None:
-        sets.append("quantity = ?")
-        params.append(int(quantity))
-    if not sets:
+    both_rows, price_rows, qty_rows = [], [], []
+    for product_id, price, quantity in items:
+        pid = str(product_id)
+        if price is not None and quantity is not None:
+            both_rows.append((float(price), int(quantity), pid))
+        elif price is not None:
+            price_rows.append((float(price), pid))
+        elif quantity is not None:
+            qty_rows.append((int(quantity), pid))
+    if not (both_rows or price_rows or qty_rows):
         return
 
-    sql = f"UPDATE products SET {', '.join(sets)} WHERE repository_id = ?"
-    params.append(str(product_id))
+    conn = _get_connection()
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        if both_rows:
+            conn.executemany(
+                "UPDATE products SET price = ?, quantity = ? WHERE repository_id = ?",
+                both_rows,
+            )
+        if price_rows:
+            conn.executemany(
+                "UPDATE products SET price = ? WHERE repository_id = ?",
+                price_rows,
+            )
+        if qty_rows:
+            conn.executemany(
+                "UPDATE products SET quantity = ? WHERE repository_id = ?",
+                qty_rows,
+            )
+        conn.execute("COMMIT")
+    except Exception:
+        conn.rollback()
+        raise
 
-    with _get_connection() as conn:
-        conn.execute(sql, tuple(params))
-        conn.commit()
+
+def update_product_price_qty(
+    product_id: str, *, price: float | None = None, quantity: int | None = None
+) -> None:
+    """
+    Update price/quantity for a single product. Only sets fields provided (non-None).
+    """
+    update_products_price_qty([(product_id, price, quantity)])
 
 def get_active_coming_soon_ids() -> list[str]:
     with _get_connection() as conn:
@@ -240,36 +507,28 @@ def get_active_coming_soon_ids() -> list[str]:
         return [r[0] for r in cur.fetchall()]
 
 def mark_coming_soon(product_ids: Iterable[str], active: bool) -> None:
-    now = _dt.datetime.utcnow().isoformat()
-    with _get_connection() as conn:
-        if active:
-            rows = [(str(pid), now, now) for pid in product_ids]
-            conn.executemany("""
-                INSERT INTO coming_soon (repository_id, first_seen, last_seen, active)
-                VALUES (?, ?, ?, 1)
-                ON CONFLICT(repository_id) DO UPDATE SET
-                    last_seen=excluded.last_seen,
-                    active=1
-            """, rows)
-        else:
-            rows = [(now, str(pid)) for pid in product_ids]
-            conn.executemany("""
-                UPDATE coming_soon
-                SET last_seen = ?, active = 0
-                WHERE repository_id = ?
-            """, rows)
-        conn.commit()
+    now = _utc_now_iso()
+    if active:
+        _bulk_write(_SQL_COMING_SOON_ACTIVE, ((str(pid), now, now) for pid in product_ids))
+    else:
+        _bulk_write(_SQL_COMING_SOON_INACTIVE, ((now, str(pid)) for pid in product_ids))
 
 __all__ = [
     "init_db",
     "has_seen",
+    "has_seen_many",
     "mark_seen",
+    "count_products",
+    "get_product",
     "get_all_products",
+    "existing_ids",
+    "get_products_by_ids",
     "upsert_products",
     "mark_removed",
     "add_to_watchlist",
     "get_watchlist_ids",
     "get_candidates_for_enrichment",
+    "update_products_price_qty",
     "update_product_price_qty",
     "get_active_coming_soon_ids", 
     "mark_coming_soon",
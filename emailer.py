@@ -6,18 +6,71 @@ Supports STARTTLS (587) or SSL (465). Keep bodies short & link out.
 
 from __future__ import annotations
 
+import base64
 import logging
 import smtplib
 import ssl
+from email.header import Header
 from email.message import EmailMessage
 from typing import Iterable
 
 from . import config
-from . import autocheckout
 from .scraper import Product
 
 logger = logging.getLogger(__name__)
 
+# HTML skeleton built once at import; _build_bodies only fills the slots.
+_HTML_TMPL = (
+    "<html>"
+    "<body>"
+    "<h3>{heading}: {title}</h3>"
+    "<ul>{lis}</ul>"
+    '<p><a href="{url}">Open product page</a></p>'
+    "{img}"
+    "</body>"
+    "</html>"
+)
+_IMG_TMPL = '<p><img src="{}" alt="image" style="max-width:480px;"></p>'
+
+# Hand-formatted multipart/alternative skeleton used for burst sends so we
+# skip the email.policy machinery per message. A static boundary is safe:
+# base64 lines never start with "--". smtplib normalizes line endings.
+_MIME_BOUNDARY = "================fwgs-monitor=="
+_MIME_TMPL = (
+    "From: {frm}\n"
+    "To: {to}\n"
+    "Subject: {subject}\n"
+    "MIME-Version: 1.0\n"
+    'Content-Type: multipart/alternative; boundary="{b}"\n'
+    "\n"
+    "--{b}\n"
+    "Content-Type: text/plain; charset=utf-8\n"
+    "Content-Transfer-Encoding: base64\n"
+    "\n"
+    "{plain}"
+    "--{b}\n"
+    "Content-Type: text/html; charset=utf-8\n"
+    "Content-Transfer-Encoding: base64\n"
+    "\n"
+    "{html}"
+    "--{b}--\n"
+)
+
+
+def _encode_header(value: str) -> str:
+    return value if value.isascii() else Header(value, "utf-8").encode()
+
+
+def _format_raw_message(frm: str, subject: str, plain: str, html: str) -> str:
+    return _MIME_TMPL.format(
+        frm=_encode_header(frm),
+        to=_encode_header(", ".join(config.EMAIL_TO)),
+        subject=_encode_header(subject),
+        b=_MIME_BOUNDARY,
+        plain=base64.encodebytes(plain.encode("utf-8")).decode("ascii"),
+        html=base64.encodebytes(html.encode("utf-8")).decode("ascii"),
+    )
+
 
 def _build_subject(product: Product, event_type: str) -> str:
     tag = {"new": "New", "available": "Back in Stock", "removed": "Removed"}.get(event_type, "Update")
@@ -40,19 +93,25 @@ def _build_bodies(product: Product, event_type: str) -> tuple[str, str]:
         heading = "New Product"
         lines = [f"Price: {price}", f"Available quantity: {qty}"]
 
-    # Add checkout information
+    # Add checkout information (each helper called once, booleans reused).
+    # autocheckout is imported lazily so merely loading the emailer doesn't
+    # spin up the checkout machinery and its import graph.
     try:
-        if autocheckout._matches_keywords(product) and autocheckout._should_attempt_manual(product):
-            lines.append("")
-            lines.append("🤖 Auto-checkout enabled (keyword match)")
-        elif autocheckout.should_offer_manual_checkout(product, event_type):
-            lines.append("")
-            lines.append("👤 Manual checkout available")
-            lines.append(f"� Fast checkout: http://127.0.0.1:8888/checkout/{product.id}")
-            lines.append("⚡ Click the link above to instantly trigger checkout!")
+        from . import autocheckout
+
+        auto_match = autocheckout._matches_keywords(product) and autocheckout._should_attempt_manual(product)
+        manual_offer = not auto_match and autocheckout.should_offer_manual_checkout(product, event_type)
     except Exception:
         # Don't let checkout logic errors break notifications
-        pass
+        auto_match = manual_offer = False
+    if auto_match:
+        lines.append("")
+        lines.append("🤖 Auto-checkout enabled (keyword match)")
+    elif manual_offer:
+        lines.append("")
+        lines.append("👤 Manual checkout available")
+        lines.append(f"� Fast checkout: http://127.0.0.1:8888/checkout/{product.id}")
+        lines.append("⚡ Click the link above to instantly trigger checkout!")
 
     url = product.page_url or config.BASE_URL
     img = product.image_url or ""
@@ -66,61 +125,114 @@ def _build_bodies(product: Product, event_type: str) -> tuple[str, str]:
 
     # --- HTML body (avoid nested f-strings)
     li_html = "".join("<li>{}</li>".format(l) for l in lines)
-    img_html = '<p><img src="{}" alt="image" style="max-width:480px;"></p>'.format(img) if img else ""
-
-    html = (
-        "<html>"
-        "<body>"
-        "<h3>{heading}: {title}</h3>"
-        "<ul>{lis}</ul>"
-        '<p><a href="{url}">Open product page</a></p>'
-        "{img}"
-        "</body>"
-        "</html>"
-    ).format(heading=heading, title=title, lis=li_html, url=url, img=img_html)
+    img_html = _IMG_TMPL.format(img) if img else ""
+
+    html = _HTML_TMPL.format(heading=heading, title=title, lis=li_html, url=url, img=img_html)
 
     return plain, html
 
 
-def _send(msg: EmailMessage) -> None:
+def _open_smtp() -> smtplib.SMTP | None:
+    """Open and authenticate one SMTP session, or None if config is incomplete."""
     required = (config.EMAIL_USERNAME, config.EMAIL_PASSWORD, config.EMAIL_FROM, config.EMAIL_TO)
     if not all(required) or not config.EMAIL_TO:
         logger.error("Email config incomplete; set EMAIL_USERNAME, EMAIL_PASSWORD, EMAIL_FROM, EMAIL_TO")
-        return
+        return None
 
     host, port = config.EMAIL_SMTP_HOST, int(config.EMAIL_SMTP_PORT)
+    if config.EMAIL_USE_TLS and port == 587:
+        s = smtplib.SMTP(host, port, timeout=20)
+        s.ehlo()
+        s.starttls(context=ssl.create_default_context())
+        s.login(config.EMAIL_USERNAME, config.EMAIL_PASSWORD)
+    else:
+        s = smtplib.SMTP_SSL(host, port, context=ssl.create_default_context(), timeout=20)
+        s.login(config.EMAIL_USERNAME, config.EMAIL_PASSWORD)
+    return s
+
+
+def _send_via(s: smtplib.SMTP, msg: EmailMessage) -> None:
+    s.send_message(msg)
+    logger.info("Email sent to %s (subject=%s)", ", ".join(config.EMAIL_TO), msg.get("Subject"))
+
+
+def _send_raw_via(s: smtplib.SMTP, frm: str, subject: str, data: str) -> None:
+    s.sendmail(frm, list(config.EMAIL_TO), data)
+    logger.info("Email sent to %s (subject=%s)", ", ".join(config.EMAIL_TO), subject)
+
+
+def _send(msg: EmailMessage) -> None:
     try:
-        if config.EMAIL_USE_TLS and port == 587:
-            with smtplib.SMTP(host, port, timeout=20) as s:
-                s.ehlo()
-                s.starttls(context=ssl.create_default_context())
-                s.login(config.EMAIL_USERNAME, config.EMAIL_PASSWORD)
-                s.send_message(msg)
-        else:
-            with smtplib.SMTP_SSL(host, port, context=ssl.create_default_context(), timeout=20) as s:
-                s.login(config.EMAIL_USERNAME, config.EMAIL_PASSWORD)
-                s.send_message(msg)
-        logger.info("Email sent to %s (subject=%s)", ", ".join(config.EMAIL_TO), msg.get("Subject"))
+        s = _open_smtp()
+        if s is None:
+            return
+        try:
+            _send_via(s, msg)
+        finally:
+            s.quit()
     except Exception:
         logger.exception("Failed to send email")
 
 
-def send_product_event(product: Product, event_type: str = "new") -> None:
-    if not config.EMAIL_ENABLED or not config.EMAIL_TO:
-        return
-
-    subject = _build_subject(product, event_type)
-    plain, html = _build_bodies(product, event_type)
-
+def _build_message(product: Product, event_type: str) -> EmailMessage:
     msg = EmailMessage()
-    msg["Subject"] = subject
+    msg["Subject"] = _build_subject(product, event_type)
     msg["From"] = config.EMAIL_FROM or (config.EMAIL_USERNAME or "")
     msg["To"] = ", ".join(config.EMAIL_TO)
+    plain, html = _build_bodies(product, event_type)
     msg.set_content(plain)
     msg.add_alternative(html, subtype="html")
-    _send(msg)
+    return msg
+
+
+def send_product_event(product: Product, event_type: str = "new") -> None:
+    if not config.EMAIL_ENABLED or not config.EMAIL_TO:
+        return
+    _send(_build_message(product, event_type))
 
 
 def send_notifications(products: Iterable[Product]) -> None:
-    for p in products:
-        send_product_event(p, event_type="new")
+    """Send 'new' emails for a burst of products over one SMTP session.
+
+    One EHLO/STARTTLS/LOGIN handshake covers the whole batch instead of
+    one per product; a mid-burst failure reconnects once per message.
+    """
+    if not config.EMAIL_ENABLED or not config.EMAIL_TO:
+        return
+    frm = config.EMAIL_FROM or (config.EMAIL_USERNAME or "")
+    s = None
+    try:
+        for p in products:
+            subject = _build_subject(p, "new")
+            plain, html = _build_bodies(p, "new")
+            raw = _format_raw_message(frm, subject, plain, html)
+            try:
+                if s is None:
+                    s = _open_smtp()
+                    if s is None:
+                        return
+                _send_raw_via(s, frm, subject, raw)
+            except smtplib.SMTPException:
+                logger.exception("SMTP send failed; reconnecting")
+                if s is not None:
+                    try:
+                        s.quit()
+                    except Exception:
+                        pass
+                    s = None
+                try:
+                    s = _open_smtp()
+                    if s is None:
+                        return
+                    _send_raw_via(s, frm, subject, raw)
+                except Exception:
+                    logger.exception("Failed to send email after reconnect")
+                    s = None
+    except Exception:
+        logger.exception("Failed to send email batch")
+    finally:
+        if s is not None:
+            try:
+                s.quit()
+            except Exception:
+                pass
@@ -8,8 +8,8 @@ Designed for speed - checkout starts in <1 second from notification click.
 import logging
 import threading
 import time
-from http.server import HTTPServer, BaseHTTPRequestHandler
-from urllib.parse import urlparse, parse_qs
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import parse_qs
 from typing import Dict, Optional
 import json
 
@@ -20,47 +20,66 @@ logger = logging.getLogger(__name__)
 
 class FastCheckoutHandler(BaseHTTPRequestHandler):
     """Ultra-lightweight HTTP handler for instant checkout triggers."""
-    
+
+    protocol_version = "HTTP/1.1"
+    # Tiny responses: don't let Nagle hold the final segment back.
+    disable_nagle_algorithm = True
+
     def log_message(self, format, *args):
         """Override to use Python logging instead of stderr."""
         logger.info(f"{self.address_string()} - {format % args}")
+
+    def _respond(self, code: int, reason: str, content_type: str, body: bytes = b"") -> None:
+        """Send status line, headers and body in one socket write.
+
+        The stdlib send_response/send_header/end_headers dance issues several
+        tiny writes on the unbuffered wfile; one coalesced write keeps the
+        checkout click to a single TCP segment.
+        """
+        head = (
+            f"HTTP/1.1 {code} {reason}\r\n"
+            f"Content-Type: {content_type}\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            "Connection: close\r\n"
+            "\r\n"
+        ).encode("ascii")
+        self.wfile.write(head + body)
+        self.wfile.flush()
+        self.close_connection = True
     
     def do_GET(self):
         """Handle GET requests for checkout triggers."""
         try:
-            # Parse URL and query parameters
-            parsed = urlparse(self.path)
-            params = parse_qs(parsed.query)
-            
-            if parsed.path == "/checkout":
-                product_id = params.get('id', [None])[0]
-                if product_id:
-                    success = self._trigger_checkout(product_id)
-                    self._send_response(success, product_id)
-                else:
-                    self._send_error("Missing product ID")
-                    
-            elif parsed.path == "/checkout-url":
-                product_url = params.get('url', [None])[0]
-                if product_url:
-                    success = self._trigger_checkout_by_url(product_url)
-                    self._send_response(success, f"URL: {product_url}")
-                else:
-                    self._send_error("Missing product URL")
-                    
-            elif parsed.path == "/status":
-                self._send_status()
-                
-            elif parsed.path == "/" or parsed.path == "/health":
-                self._send_health()
-                
-            else:
+            # Split once and dispatch via the route table; only the checkout
+            # routes pay for parse_qs.
+            path, _, qs = self.path.partition("?")
+            handler = self._ROUTES.get(path)
+            if handler is None:
                 self._send_404()
-                
+            else:
+                handler(self, qs)
+
         except Exception as e:
             logger.exception("Error handling request")
             self._send_error(f"Server error: {str(e)}")
-    
+
+    def _handle_checkout(self, qs: str):
+        product_id = parse_qs(qs).get('id', [None])[0]
+        if product_id:
+            success = self._trigger_checkout(product_id)
+            self._send_response(success, product_id)
+        else:
+            self._send_error("Missing product ID")
+
+    def _handle_checkout_url(self, qs: str):
+        product_url = parse_qs(qs).get('url', [None])[0]
+        if product_url:
+            success = self._trigger_checkout_by_url(product_url)
+            self._send_response(success, f"URL: {product_url}")
+        else:
+            self._send_error("Missing product URL")
+
+
     def _trigger_checkout(self, product_id: str) -> bool:
         """Trigger checkout for a specific product ID."""
         logger.info("🚀 Fast checkout requested for product ID: %s", product_id)
@@ -110,16 +129,11 @@ class FastCheckoutHandler(BaseHTTPRequestHandler):
         """Send minimal response and close immediately."""
         if success:
             # Send 204 No Content - triggers checkout but no page display
-            self.send_response(204)
-            self.send_header('Content-type', 'text/plain')
-            self.end_headers()
+            self._respond(204, "No Content", "text/plain")
             logger.info("✅ Fast checkout triggered for %s - minimal response sent", product_info)
         else:
             # Send minimal error response
-            self.send_response(200)
-            self.send_header('Content-type', 'text/plain')
-            self.end_headers()
-            self.wfile.write(f"Checkout failed: {product_info}".encode())
+            self._respond(200, "OK", "text/plain", f"Checkout failed: {product_info}".encode())
             logger.warning("❌ Fast checkout failed for %s", product_info)
     
     def _send_error(self, message: str):
@@ -131,30 +145,23 @@ class FastCheckoutHandler(BaseHTTPRequestHandler):
             <p>{message}</p>
         </body></html>
         """
-        self.send_response(400)
-        self.send_header('Content-type', 'text/html')
-        self.end_headers()
-        self.wfile.write(html.encode())
-    
+        self._respond(400, "Bad Request", "text/html", html.encode())
+
     def _send_status(self):
         """Send server status as JSON."""
         try:
-            products = db.get_all_products()
-            available_count = sum(1 for p in products.values() if p.quantity and p.quantity > 0)
-            
+            total_count, available_count = db.count_products()
+
             status = {
                 "status": "running",
-                "total_products": len(products),
+                "total_products": total_count,
                 "available_products": available_count,
                 "auto_checkout_enabled": config.AUTO_CHECKOUT_ENABLED,
                 "timestamp": time.time()
             }
             
-            self.send_response(200)
-            self.send_header('Content-type', 'application/json')
-            self.end_headers()
-            self.wfile.write(json.dumps(status).encode())
-            
+            self._respond(200, "OK", "application/json", json.dumps(status).encode())
+
         except Exception as e:
             self._send_error(f"Status error: {str(e)}")
     
@@ -174,17 +181,19 @@ class FastCheckoutHandler(BaseHTTPRequestHandler):
             </ul>
         </body></html>
         """
-        self.send_response(200)
-        self.send_header('Content-type', 'text/html')
-        self.end_headers()
-        self.wfile.write(html.encode())
-    
+        self._respond(200, "OK", "text/html", html.encode())
+
     def _send_404(self):
         """Send 404 response."""
-        self.send_response(404)
-        self.send_header('Content-type', 'text/html')
-        self.end_headers()
-        self.wfile.write(b"<h1>404 Not Found</h1>")
+        self._respond(404, "Not Found", "text/html", b"<h1>404 Not Found</h1>")
+
+    _ROUTES = {
+        "/checkout": _handle_checkout,
+        "/checkout-url": _handle_checkout_url,
+        "/status": lambda self, qs: self._send_status(),
+        "/": lambda self, qs: self._send_health(),
+        "/health": lambda self, qs: self._send_health(),
+    }
 
 
 class FastCheckoutServer:
@@ -193,7 +202,7 @@ class FastCheckoutServer:
     def __init__(self, host: str = "127.0.0.1", port: int = 8888):
         self.host = host
         self.port = port
-        self.server: Optional[HTTPServer] = None
+        self.server: Optional[ThreadingHTTPServer] = None
         self.server_thread: Optional[threading.Thread] = None
         self.running = False
     
@@ -203,7 +212,10 @@ class FastCheckoutServer:
             return f"http://{self.host}:{self.port}"
         
         try:
-            self.server = HTTPServer((self.host, self.port), FastCheckoutHandler)
+            # Threading server so concurrent notification clicks don't queue
+            # behind each other while a slow checkout trigger is in flight.
+            self.server = ThreadingHTTPServer((self.host, self.port), FastCheckoutHandler)
+            self.server.daemon_threads = True
             self.server_thread = threading.Thread(target=self.server.serve_forever, daemon=True)
             self.server_thread.start()
             self.running = True
@@ -478,15 +478,26 @@ if (require.main === module) {
         process.exit(1);
     }
     
+    // Machine-readable status line consumed by the Python monitor
+    // (autocheckout._analyze_checkout_output); must be the last stdout line.
+    const emitStatus = (status, reason) => {
+        console.log(JSON.stringify({ status, reason }));
+    };
+
     const checkout = new FWGSCheckout({
         productUrl,
         onComplete: async (result) => {
             console.log('🎉 Checkout completed:', result);
+            emitStatus('success', result && result.message ? result.message : 'checkout completed');
         },
         onError: async (error) => {
             console.error('❌ Checkout failed:', error);
+            emitStatus('failure', error && error.error ? error.error : 'checkout failed');
         }
     });
-    
-    checkout.executeCheckout().catch(console.error);
+
+    checkout.executeCheckout().catch((error) => {
+        console.error(error);
+        emitStatus('failure', error && error.message ? error.message : 'unhandled error');
+    });
 }
\ No newline at end of file
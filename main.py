@@ -1,14 +1,88 @@
 from __future__ import annotations
 
 import logging
+import queue
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Set
 
-from . import config, db, notifier, scraper
+from . import config, db, notifier, scraper, utils
 from . import emailer  # NEW
 from . import fast_checkout  # NEW (USED FOR MANUAL CHECKOUT PROCESS VIA NOTIF)
 
+# Producer/consumer split between the scraper loops and Discord: scrapers
+# enqueue (product, event_type) jobs and keep their polling cadence; a single
+# worker drains the queue in small batches and pays the webhook latency.
+_NOTIFY_QUEUE: "queue.Queue[tuple[scraper.Product, str]]" = queue.Queue(maxsize=1024)
+_NOTIFY_BATCH_MAX = 10          # Discord embed limit per webhook call
+_NOTIFY_BATCH_WINDOW = 0.25     # seconds to wait for more jobs before sending
+
+def _enqueue_notifications(products: List[scraper.Product], event_type: str = "new") -> None:
+    """Queue products for the notifier worker; drop (and log) when full.
+
+    Dropping preserves scraper cadence: a wedged Discord API must not
+    back-pressure the polling loops.
+    """
+    logger = logging.getLogger(__name__)
+    for p in products:
+        try:
+            _NOTIFY_QUEUE.put_nowait((p, event_type))
+        except queue.Full:
+            logger.warning(
+                "Notify queue full; dropping %s event for %s (id=%s)",
+                event_type, p.name, p.id,
+            )
+
+def _notifier_worker() -> None:
+    """Drain the notify queue in batches (up to 10 jobs or 250 ms)."""
+    logger = logging.getLogger(__name__)
+    session = utils.get_http_session()
+    while True:
+        batch = [_NOTIFY_QUEUE.get()]
+        deadline = time.monotonic() + _NOTIFY_BATCH_WINDOW
+        while len(batch) < _NOTIFY_BATCH_MAX:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(_NOTIFY_QUEUE.get(timeout=remaining))
+            except queue.Empty:
+                break
+
+        # One send per event type, preserving arrival order within each.
+        grouped: dict[str, List[scraper.Product]] = {}
+        for p, ev in batch:
+            grouped.setdefault(ev, []).append(p)
+        for ev, prods in grouped.items():
+            try:
+                notifier.send_notifications(
+                    prods,
+                    webhook_url=config.DISCORD_WEBHOOK_URL,
+                    session=session,
+                    event_type=ev,
+                )
+            except Exception:
+                logger.exception("Notifier worker failed sending %d %s events", len(prods), ev)
+        for _ in batch:
+            _NOTIFY_QUEUE.task_done()
+
+# Cap for the exponential backoff the loops apply after an exception.
+_BACKOFF_MAX = 300.0
+
+def _tick(next_ts: float, interval: float) -> float:
+    """Sleep until the *next_ts* deadline, then return the deadline after it.
+
+    Deadlines advance on the schedule rather than from the end of the
+    previous iteration, so a slow tick does not permanently shift every
+    later one; a fully overrun deadline reschedules from now instead of
+    bursting to catch up.
+    """
+    now = time.monotonic()
+    if next_ts > now:
+        time.sleep(next_ts - now)
+    return max(now, next_ts) + interval
+
 def setup_logging() -> None:
     level = getattr(logging, config.LOG_LEVEL.upper(), logging.INFO)
     logging.basicConfig(
@@ -20,15 +94,18 @@ def scrape_once(category_id: str) -> None:
     """Perform one scrape-and-notify cycle for a single Endeca node (category)."""
     logger = logging.getLogger(__name__)
     logger.info("Starting scrape for category N=%s…", category_id)
+    products: List[scraper.Product] = []
+    # One session per sweep: every fetch below reuses the same connection pool.
+    session = utils.get_http_session()
     try:
         # 1) Fetch the FULL catalog via the OSF assembler endpoint (no in-stock filter).
-        orig_ns = config.ASSEMBLER_NS
-        config.ASSEMBLER_NS = None
+        # Ns is disabled explicitly per call; categories may run concurrently.
         items = scraper.fetch_all_product_items(
             category_id=category_id,
             base_url=config.BASE_URL,
+            session=session,
+            assembler_ns=None,
         )
-        config.ASSEMBLER_NS = orig_ns
 
         total = len(items)
         logger.info("Fetched %d total products (full catalog) for N=%s", total, category_id)
@@ -38,32 +115,34 @@ def scrape_once(category_id: str) -> None:
 
         # 2) Fetch stock quantities (out-of-stock → quantity=0)
         ids = [str(it["repositoryId"]) for it in items if it.get("repositoryId")]
-        stock = scraper.fetch_stock_quantities(ids, base_url=config.BASE_URL)
+        stock = scraper.fetch_stock_quantities(ids, base_url=config.BASE_URL, session=session)
 
         # 3) Build Product dataclasses
         products = scraper.build_products(items, stock, base_url=config.BASE_URL)
 
-        # 4) Upsert ALL products into the DB
+        # 4) Upsert ALL products into the DB. Prior state is fetched only for
+        # the ids in this scrape (indexed IN lookup) rather than loading the
+        # whole catalog; the id diff doubles as new-product detection.
         logger.info("Upserting %d products into the database (N=%s)", len(products), category_id)
-        prior_map = db.get_all_products()
+        existing = db.existing_ids([p.id for p in products])
+        prior_map = db.get_products_by_ids(existing)
         db.upsert_products(products)
 
+        # 5+6) Single fused pass: new-product detection, price back-fill and
+        # restock detection share one walk over products (and one prior_map
+        # lookup per item) instead of three.
+        new_products: List[scraper.Product] = []
+        restocked: List[scraper.Product] = []
+        stock_events = config.ENABLE_STOCK_EVENTS
         for p in products:
             prev = prior_map.get(p.id)
-            if prev and (p.price is None or p.price <= 0):
-                p.price = float(prev.price or 0.0)
-
-        # 5) Detect new products
-        prior_ids = set(prior_map.keys())
-        new_products: List[scraper.Product] = [p for p in products if p.id not in prior_ids]
-
-        # 6) Detect restocks
-        restocked: List[scraper.Product] = []
-        if config.ENABLE_STOCK_EVENTS:
-            for p in products:
-                prev = prior_map.get(p.id)
-                if prev and prev.quantity == 0 and p.quantity > 0:
-                    restocked.append(p)
+            if prev is None:
+                new_products.append(p)
+                continue
+            if (p.price is None or p.price <= 0) and prev.price:
+                p.price = float(prev.price)
+            if stock_events and prev.quantity == 0 and p.quantity > 0:
+                restocked.append(p)
 
         # Respect MAX_NOTIFY only for notifications (not ingestion)
         if config.MAX_NOTIFY > 0:
@@ -76,37 +155,36 @@ def scrape_once(category_id: str) -> None:
         to_notify.extend(restocked)
         if to_notify:
             try:
-                scraper.enrich_products_for_notifications(to_notify)
+                scraper.enrich_products_for_notifications(to_notify, session=session)
             except AttributeError:
                 pass
 
-        # 7) Send notifications
+        # 7) Hand off notifications to the worker; the sweep thread never
+        # waits on Discord.
         if new_products:
-            notifier.send_notifications(new_products, webhook_url=config.DISCORD_WEBHOOK_URL)
+            _enqueue_notifications(new_products)
             if config.EMAIL_ENABLED:
                 emailer.send_notifications(new_products)
             db.mark_seen([p.id for p in new_products])
-            logger.info("Notified about %d new products for N=%s.", len(new_products), category_id)
+            logger.info("Queued %d new products for notification (N=%s).", len(new_products), category_id)
 
-        for p in restocked:
-            notifier.send_product_event(
-                p,
-                event_type="available",
-                webhook_url=config.DISCORD_WEBHOOK_URL,
-            )
-            # NEW: email too
-            if config.EMAIL_ENABLED:
-                emailer.send_product_event(p, event_type="available")
-
-            logger.info("Notified restock for product %s (id=%s) N=%s", p.name, p.id, category_id)
+        if restocked:
+            _enqueue_notifications(restocked, "available")
+            for p in restocked:
+                # NEW: email too
+                if config.EMAIL_ENABLED:
+                    emailer.send_product_event(p, event_type="available")
+                logger.info("Queued restock for product %s (id=%s) N=%s", p.name, p.id, category_id)
 
         if not (new_products or restocked):
             logger.info("No product changes detected this cycle for N=%s.", category_id)
 
     except Exception:
         logger.exception("Unexpected error during scrape for N=%s.", category_id)
+    finally:
+        session.close()
 
-    if 'products' in locals() and products:
+    if products and logger.isEnabledFor(logging.INFO):
         logger.info("First 5 products this cycle (N=%s):", category_id)
         for p in products[:5]:
             logger.info("%s | $%.2f | qty=%d", p.name[:48], p.price, p.quantity)
@@ -118,41 +196,59 @@ def fast_watchlist_loop() -> None:
         db.add_to_watchlist(config.WATCHLIST_IDS, notes="seeded from env")
 
     last_qty: dict[str, int] = {}
+    session = utils.get_http_session()  # lives as long as the thread
     logger.info("Starting high-frequency watchlist loop (interval=%ss)", config.WATCHLIST_INTERVAL_SECONDS)
 
+    interval = float(config.WATCHLIST_INTERVAL_SECONDS)
+    backoff = interval
+    # First iteration runs immediately; _tick then sleeps to this deadline.
+    next_ts = time.monotonic() + interval
     while True:
         try:
             watch_ids = db.get_watchlist_ids()
             if not watch_ids:
-                time.sleep(config.WATCHLIST_INTERVAL_SECONDS)
+                next_ts = _tick(next_ts, interval)
                 continue
 
-            quantities = scraper.fetch_stock_quantities(watch_ids, base_url=config.BASE_URL)
+            quantities = scraper.fetch_stock_quantities(watch_ids, base_url=config.BASE_URL, session=session)
 
             if config.SIMULATE_WATCHLIST_FLIP:
                 for pid in list(quantities.keys()):
                     if last_qty.get(pid, 0) == 0:
                         quantities[pid] = 1
 
+            flips: list[tuple[str, int, scraper.Product]] = []
             for pid in watch_ids:
                 q = int(quantities.get(pid, 0))
                 prev = last_qty.get(pid, 0)
                 if prev == 0 and q > 0:
-                    prod_map = db.get_all_products()
-                    p = prod_map.get(pid)
+                    # Targeted lookup: no full-table load per flip
+                    p = db.get_product(pid)
                     if not p:
                         p = scraper.Product(
                             id=pid, name=f"Product {pid}", price=0.0,
                             image_url="", page_url=config.BASE_URL, quantity=q
                         )
-                    notifier.send_product_event(p, event_type="available", webhook_url=config.DISCORD_WEBHOOK_URL)
-                    logger.info("Watchlist: %s is now available (qty=%d)", pid, q)
-                last_qty[pid] = q
-
+                    flips.append((pid, q, p))
+                else:
+                    last_qty[pid] = q
+
+            if flips:
+                # Hand the batch to the notifier worker; the poll cadence
+                # never blocks on Discord latency.
+                _enqueue_notifications([p for _, _, p in flips], "available")
+                info_enabled = logger.isEnabledFor(logging.INFO)
+                for pid, q, _ in flips:
+                    if info_enabled:
+                        logger.info("Watchlist: %s is now available (qty=%d)", pid, q)
+                    last_qty[pid] = q
+
+            backoff = interval
         except Exception:
             logger.exception("Error in fast_watchlist_loop")
-        finally:
-            time.sleep(config.WATCHLIST_INTERVAL_SECONDS)
+            backoff = min(backoff * 2, _BACKOFF_MAX)
+            next_ts = time.monotonic() + backoff
+        next_ts = _tick(next_ts, interval)
 
 def front_page_loop() -> None:
     """Poll only the first assembler page to detect brand-new products fast (uses first CATEGORY_ID)."""
@@ -161,10 +257,15 @@ def front_page_loop() -> None:
     # Use the first configured category for the fast scanner
     primary_category = (config.CATEGORY_IDS[0] if config.CATEGORY_IDS else config.CATEGORY_ID)
     ns = config.ASSEMBLER_NS_NEW if config.ASSEMBLER_NS_NEW is not None else config.ASSEMBLER_NS
+    session = utils.get_http_session()  # lives as long as the thread
     logger.info(
         "Starting front-page scanner for N=%s (nrpp=%d, ns=%s)",
         primary_category, config.FRONT_PAGE_NRPP, "custom" if ns else "default"
     )
+    interval = 2.0
+    backoff = interval
+    # First iteration runs immediately; _tick then sleeps to this deadline.
+    next_ts = time.monotonic() + interval
     while True:
         try:
             items = scraper.fetch_front_page_items(
@@ -172,25 +273,39 @@ def front_page_loop() -> None:
                 base_url=config.BASE_URL,
                 nrpp=config.FRONT_PAGE_NRPP,
                 ns_override=ns,
+                session=session,
             )
+            # Two passes: collect every new pid first, then one batched
+            # stock request for the lot. On a page reveal with K new items
+            # this is 1 HTTP call instead of K.
+            new_items = []
+            info_enabled = logger.isEnabledFor(logging.INFO)
             for it in items:
                 pid = str(it.get("repositoryId") or "")
-                if not pid:
-                    continue
-                if pid not in seen:
-                    logger.info("Front page discovered new repositoryId=%s (before slow sweep)", pid)
-                    stock = scraper.fetch_stock_quantities([pid], base_url=config.BASE_URL)
-                    products = scraper.build_products([it], stock, base_url=config.BASE_URL)
-                    if products:
-                        db.upsert_products(products)
-                        db.mark_seen([p.id for p in products])
-                        scraper.enrich_products_for_notifications(products)
-                        notifier.send_notifications(products, webhook_url=config.DISCORD_WEBHOOK_URL)
-                    seen.add(pid)
+                if pid and pid not in seen:
+                    if info_enabled:
+                        logger.info("Front page discovered new repositoryId=%s (before slow sweep)", pid)
+                    new_items.append((pid, it))
+
+            if new_items:
+                stock = scraper.fetch_stock_quantities(
+                    [pid for pid, _ in new_items], base_url=config.BASE_URL, session=session
+                )
+                products = scraper.build_products(
+                    [it for _, it in new_items], stock, base_url=config.BASE_URL
+                )
+                if products:
+                    db.upsert_products(products)
+                    db.mark_seen([p.id for p in products])
+                    scraper.enrich_products_for_notifications(products, session=session)
+                    _enqueue_notifications(products)
+                seen.update(pid for pid, _ in new_items)
+            backoff = interval
         except Exception:
             logger.exception("Error in front_page_loop")
-        finally:
-            time.sleep(2)
+            backoff = min(backoff * 2, _BACKOFF_MAX)
+            next_ts = time.monotonic() + backoff
+        next_ts = _tick(next_ts, interval)
 
 def release_page_loop() -> None:
     """
@@ -210,53 +325,86 @@ def release_page_loop() -> None:
         config.RELEASE_CHECK_INTERVAL_SECONDS,
         config.RELEASE_PAGE_URL,
     )
+    session = utils.get_http_session()  # lives as long as the thread
 
+    interval = float(max(3, int(config.RELEASE_CHECK_INTERVAL_SECONDS)))
+    backoff = interval
+    # First iteration runs immediately; _tick then sleeps to this deadline.
+    next_ts = time.monotonic() + interval
     while True:
         try:
             cards = scraper.fetch_release_cards(
                 config.RELEASE_PAGE_URL,
                 base_url=config.BASE_URL,
+                session=session,
             )
             if not cards:
                 logger.info("Release scanner: no cards (blocked/empty) at %s", config.RELEASE_PAGE_URL)
-                time.sleep(max(5, int(config.RELEASE_CHECK_INTERVAL_SECONDS)))
+                next_ts = _tick(next_ts, interval)
                 continue
 
-            for c in cards:
-                if not db.has_seen(c.key):
-                    notifier.send_release_event(
-                        c,
-                        event_type="release",
-                        webhook_url=config.DISCORD_WEBHOOK_URL,
-                    )
-                    db.mark_seen([c.key])
-
-                if (c.status or "").lower() == "live":
-                    live_key = f"release_live:{c.key}"
-                    if not db.has_seen(live_key):
+            # Membership is a pure in-process set lookup (db keeps the seen
+            # cache warm); one batched check covers card + live keys.
+            seen_keys = db.has_seen_many(
+                [c.key for c in cards] + [f"release_live:{c.key}" for c in cards]
+            )
+            newly_seen: list[str] = []
+            try:
+                for c in cards:
+                    if c.key not in seen_keys:
                         notifier.send_release_event(
                             c,
-                            event_type="live",
+                            event_type="release",
                             webhook_url=config.DISCORD_WEBHOOK_URL,
+                            session=session,
                         )
-                        db.mark_seen([live_key])
-
+                        newly_seen.append(c.key)
+
+                    if (c.status or "").lower() == "live":
+                        live_key = f"release_live:{c.key}"
+                        if live_key not in seen_keys:
+                            notifier.send_release_event(
+                                c,
+                                event_type="live",
+                                webhook_url=config.DISCORD_WEBHOOK_URL,
+                                session=session,
+                            )
+                            newly_seen.append(live_key)
+            finally:
+                # One write per cycle; flushed even on a mid-loop failure so
+                # already-sent cards are not re-notified next tick.
+                if newly_seen:
+                    db.mark_seen(newly_seen)
+
+            backoff = interval
         except Exception:
             logger.exception("Error in release_page_loop")
-        finally:
-            time.sleep(max(3, int(config.RELEASE_CHECK_INTERVAL_SECONDS)))
+            backoff = min(backoff * 2, _BACKOFF_MAX)
+            next_ts = time.monotonic() + backoff
+        next_ts = _tick(next_ts, interval)
 
 def _slow_loop_wrapper() -> None:
     """Wrap the scrape_once() in the original sleep loop, iterating all CATEGORY_IDS."""
     logger = logging.getLogger(__name__)
+    interval = float(config.SCRAPE_INTERVAL_MINUTES * 60)
+    next_ts = time.monotonic() + interval
     while True:
-        for cid in config.CATEGORY_IDS:
-            scrape_once(cid)
+        # Each category sweep is >99% network wait, so run them concurrently;
+        # scrape_once only touches thread-safe db/scraper entry points.
+        if len(config.CATEGORY_IDS) > 1:
+            with ThreadPoolExecutor(
+                max_workers=min(8, len(config.CATEGORY_IDS)),
+                thread_name_prefix="slow-sweep",
+            ) as ex:
+                list(ex.map(scrape_once, config.CATEGORY_IDS))
+        else:
+            for cid in config.CATEGORY_IDS:
+                scrape_once(cid)
         logger.info(
             "Sleeping for %d minutes before next slow sweep over %d categories.",
             config.SCRAPE_INTERVAL_MINUTES, len(config.CATEGORY_IDS)
         )
-        time.sleep(config.SCRAPE_INTERVAL_MINUTES * 60)
+        next_ts = _tick(next_ts, interval)
 
 def enrichment_loop() -> None:
     """
@@ -270,15 +418,20 @@ def enrichment_loop() -> None:
         config.ENRICHMENT_REQUEST_DELAY,
         config.ENRICHMENT_LOOP_INTERVAL_SECONDS,
     )
+    session = utils.get_http_session()  # lives as long as the thread
+    interval = float(config.ENRICHMENT_LOOP_INTERVAL_SECONDS)
+    backoff = interval
+    # First iteration runs immediately; _tick then sleeps to this deadline.
+    next_ts = time.monotonic() + interval
     while True:
         try:
             candidates = db.get_candidates_for_enrichment(limit=config.ENRICHMENT_BATCH_SIZE)
             if not candidates:
-                time.sleep(config.ENRICHMENT_LOOP_INTERVAL_SECONDS)
+                next_ts = _tick(next_ts, interval)
                 continue
 
             ids = [c["id"] for c in candidates]
-            qty_map = scraper.fetch_stock_quantities(ids, base_url=config.BASE_URL)
+            qty_map = scraper.fetch_stock_quantities(ids, base_url=config.BASE_URL, session=session)
 
             prods: List[scraper.Product] = []
             for c in candidates:
@@ -298,19 +451,21 @@ def enrichment_loop() -> None:
                 scraper.enrich_products_for_notifications(
                     prods,
                     delay_seconds=config.ENRICHMENT_REQUEST_DELAY,
+                    session=session,
                 )
             except AttributeError:
                 pass
 
-            for p in prods:
-                db.update_product_price_qty(p.id, price=p.price, quantity=p.quantity)
+            db.update_products_price_qty((p.id, p.price, p.quantity) for p in prods)
 
             logger.info("Enrichment: updated %d products", len(prods))
 
+            backoff = interval
         except Exception:
             logger.exception("Error in enrichment_loop")
-
-        time.sleep(config.ENRICHMENT_LOOP_INTERVAL_SECONDS)
+            backoff = min(backoff * 2, _BACKOFF_MAX)
+            next_ts = time.monotonic() + backoff
+        next_ts = _tick(next_ts, interval)
 
 def main() -> None:
     """Initialise and run the monitoring loops."""
@@ -335,6 +490,11 @@ def main() -> None:
         config.SCRAPE_INTERVAL_MINUTES,
     )
 
+    # Notifier worker: drains the shared queue so scraper threads never
+    # block on Discord.
+    t_notify = threading.Thread(target=_notifier_worker, name="notifier", daemon=True)
+    t_notify.start()
+
     # Slow, thorough sweep over all configured Endeca nodes
     t_slow = threading.Thread(target=_slow_loop_wrapper, name="slow-sweep", daemon=True)
     t_slow.start()
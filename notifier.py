@@ -6,41 +6,155 @@ and referenced via attachment://, which bypasses hotlink issues.
 """
 from __future__ import annotations
 
-import io
+import hashlib
 import json
 import logging
-import mimetypes
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from typing import Iterable, Optional
-from urllib.parse import urlparse
 
 import requests
 
-from .config import BASE_URL, DISCORD_WEBHOOK_URL, DISCORD_ATTACH_IMAGES
+from .config import (
+    AUTO_CHECKOUT_ENABLED,
+    BASE_URL,
+    DISCORD_WEBHOOK_URL,
+    DISCORD_ATTACH_IMAGES,
+    IMAGE_CACHE_DIR,
+    NOTIFY_CONCURRENCY,
+)
 from .scraper import Product
 from .utils import get_http_session, retryable_request
 from . import autocheckout
 from . import fast_checkout
-from . import autocheckout
 
 logger = logging.getLogger(__name__)
 
+# One persistent pooled session per thread. Opening (and closing) a session
+# per notification threw away the keep-alive connection to discord.com and
+# the image CDN, paying a fresh TCP+TLS handshake every time. Retries stay
+# with @retryable_request, so the adapter itself never retries.
+_session_local = threading.local()
+
+
+def _get_session() -> requests.Session:
+    s = getattr(_session_local, "session", None)
+    if s is None:
+        s = get_http_session()
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=32, pool_maxsize=32, max_retries=0
+        )
+        s.mount("https://", adapter)
+        s.mount("http://", adapter)
+        _session_local.session = s
+    return s
+
 
 @retryable_request
 def _post(session: requests.Session, url: str, **kwargs) -> requests.Response:
     return session.post(url, **kwargs)
 
 
+# Discord only needs a handful of image types; a static map beats loading
+# the system MIME database via mimetypes for every attachment.
+_EXT_MIME = {
+    "jpg": "image/jpeg",
+    "jpeg": "image/jpeg",
+    "png": "image/png",
+    "webp": "image/webp",
+    "gif": "image/gif",
+}
+
+
 def _guess_filename_and_mime(url: str, fallback_name: str = "image") -> tuple[str, str]:
     """
     Guess a safe filename and mime type from a URL.
     Defaults to .jpg if unknown.
     """
-    parsed = urlparse(url)
-    name = (parsed.path.rsplit("/", 1)[-1] or fallback_name).split("?")[0].split("#")[0]
-    if "." not in name:
-        name += ".jpg"
-    mime = mimetypes.guess_type(name)[0] or "image/jpeg"
-    return name, mime
+    name = url.split("?", 1)[0].split("#", 1)[0]
+    slash = name.rfind("/")
+    if slash != -1:
+        name = name[slash + 1 :]
+    if not name:
+        name = fallback_name
+    dot = name.rfind(".")
+    if dot == -1:
+        return name + ".jpg", "image/jpeg"
+    ext = name[dot + 1 :].lower()
+    return name, _EXT_MIME.get(ext, "image/jpeg")
+
+
+class _ImageCache:
+    """Bounded LRU of downloaded image bytes, persisted on disk.
+
+    Product art rarely changes, so repeat notifications revalidate with
+    If-None-Match / If-Modified-Since instead of re-downloading; a 304
+    costs headers only. Entries without validators are not served stale —
+    those URLs fall back to a full fetch.
+    """
+
+    def __init__(self, max_entries: int = 128, max_total_bytes: int = 64 * 1024 * 1024):
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, tuple[bytes, str, str, dict]] = OrderedDict()
+        self._total = 0
+        self._max_entries = max_entries
+        self._max_total_bytes = max_total_bytes
+        self._dir = Path(IMAGE_CACHE_DIR) if IMAGE_CACHE_DIR else None
+
+    def _disk_path(self, url: str) -> Path:
+        return self._dir / hashlib.sha1(url.encode("utf-8")).hexdigest()
+
+    def get(self, url: str) -> tuple[bytes, str, str, dict] | None:
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is not None:
+                self._entries.move_to_end(url)
+                return entry
+        if self._dir is None:
+            return None
+        try:
+            path = self._disk_path(url)
+            meta_path = path.with_suffix(".meta")
+            if not (path.exists() and meta_path.exists()):
+                return None
+            meta = json.loads(meta_path.read_text())
+            data = path.read_bytes()
+        except Exception:
+            return None
+        entry = (data, meta.get("filename", "image.jpg"), meta.get("mime", "image/jpeg"), meta)
+        self._remember(url, entry)
+        return entry
+
+    def put(self, url: str, data: bytes, filename: str, mime: str, validators: dict) -> None:
+        meta = {"filename": filename, "mime": mime, **validators}
+        self._remember(url, (data, filename, mime, meta))
+        if self._dir is None:
+            return
+        try:
+            self._dir.mkdir(parents=True, exist_ok=True)
+            path = self._disk_path(url)
+            path.write_bytes(data)
+            path.with_suffix(".meta").write_text(json.dumps(meta))
+        except Exception:
+            logger.debug("Could not persist image cache entry for %s", url, exc_info=True)
+
+    def _remember(self, url: str, entry: tuple[bytes, str, str, dict]) -> None:
+        with self._lock:
+            old = self._entries.pop(url, None)
+            if old is not None:
+                self._total -= len(old[0])
+            self._entries[url] = entry
+            self._total += len(entry[0])
+            while self._entries and (
+                len(self._entries) > self._max_entries or self._total > self._max_total_bytes
+            ):
+                _, evicted = self._entries.popitem(last=False)
+                self._total -= len(evicted[0])
+
+
+_IMAGE_CACHE = _ImageCache()
 
 
 def _download_image_bytes(session: requests.Session, url: str, *, max_bytes: int = 8 * 1024 * 1024) -> tuple[bytes, str, str] | None:
@@ -48,77 +162,155 @@ def _download_image_bytes(session: requests.Session, url: str, *, max_bytes: int
     Fetch image bytes (capped) and return (bytes, filename, mime).
     Returns None on failure.
     """
+    cached = _IMAGE_CACHE.get(url)
     try:
         headers = {
             # Pretend to be a regular browser to avoid basic hotlink blocks
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
                           "(KHTML, like Gecko) Chrome/124.0 Safari/537.36"
         }
+        if cached:
+            meta = cached[3]
+            if meta.get("etag"):
+                headers["If-None-Match"] = meta["etag"]
+            if meta.get("last_modified"):
+                headers["If-Modified-Since"] = meta["last_modified"]
         with session.get(url, headers=headers, timeout=20, stream=True) as resp:
+            if resp.status_code == 304 and cached:
+                logger.debug("Image cache revalidated (304): %s", url)
+                return cached[0], cached[1], cached[2]
             if resp.status_code != 200:
                 logger.debug("Image download failed (%s): HTTP %s", url, resp.status_code)
                 return None
-            data = io.BytesIO()
-            total = 0
-            for chunk in resp.iter_content(8192):
-                if not chunk:
-                    continue
-                total += len(chunk)
-                if total > max_bytes:
-                    logger.debug("Image too large (> %d bytes): %s", max_bytes, url)
-                    return None
-                data.write(chunk)
-            b = data.getvalue()
+            try:
+                declared = int(resp.headers.get("Content-Length") or 0)
+            except (TypeError, ValueError):
+                declared = 0
+            if declared > max_bytes:
+                logger.debug("Image too large (> %d bytes): %s", max_bytes, url)
+                return None
+            if declared:
+                # Size is known and within the cap: read in one go.
+                b = resp.content
+            else:
+                # Accumulate into a bytearray — no BytesIO + getvalue() double
+                # copy — with 64 KiB chunks to keep iteration count low.
+                buf = bytearray()
+                for chunk in resp.iter_content(65536):
+                    if not chunk:
+                        continue
+                    buf.extend(chunk)
+                    if len(buf) > max_bytes:
+                        logger.debug("Image too large (> %d bytes): %s", max_bytes, url)
+                        return None
+                b = bytes(buf)
+            if len(b) > max_bytes:
+                logger.debug("Image too large (> %d bytes): %s", max_bytes, url)
+                return None
+            validators = {
+                "etag": resp.headers.get("ETag"),
+                "last_modified": resp.headers.get("Last-Modified"),
+            }
         filename, mime = _guess_filename_and_mime(url)
+        if validators["etag"] or validators["last_modified"]:
+            _IMAGE_CACHE.put(url, b, filename, mime, validators)
         return b, filename, mime
     except Exception:
+        if cached:
+            logger.debug("Image fetch failed; serving cached copy: %s", url)
+            return cached[0], cached[1], cached[2]
         logger.exception("Failed to download image: %s", url)
         return None
 
 
-def _build_embed(product: Product, event_type: str = "new", *, use_attachment: bool = False, attachment_name: str | None = None) -> dict:
-    title = product.name or "Unknown product"
-    desc_lines: list[str] = []
-
-    if event_type == "removed":
-        title = f"Removed: {product.name}"
-        desc_lines.append("This product is no longer listed on the site.")
-    elif event_type == "available":
-        title = f"Back in Stock: {product.name}"
-        desc_lines.append(f"Price: ${float(product.price or 0):.2f}")
-        desc_lines.append(f"Current quantity: {int(product.quantity or 0)}")
-    elif event_type == "coming_soon":
-        title = f"Coming Soon: {product.name}"
-        # price may or may not be present; show if known
-        if (product.price or 0) > 0:
-            desc_lines.append(f"Expected price: ${float(product.price or 0):.2f}")
-        desc_lines.append("Watch this page for when it goes live.")
-    else:
-        desc_lines.append(f"Price: ${float(product.price or 0):.2f}")
-        desc_lines.append(f"Available quantity: {int(product.quantity or 0)}")
+# Constant embed fragments, allocated once instead of per product.
+_AUTO_SUFFIX = "\n\n🤖 **Auto-checkout enabled** (keyword match)"
+_MANUAL_SUFFIX = "\n\n👤 **Manual checkout available**"
+_FAST_URL_SUFFIX = "\n🔗 **[⚡ INSTANT CHECKOUT]({url})**\n↑ Click above for instant checkout ↑"
+_REMOVED_DESC = "This product is no longer listed on the site."
+_COMING_SOON_DESC = "Watch this page for when it goes live."
+
+
+def _checkout_suffix(product: Product, event_type: str) -> str:
+    """Description suffix advertising auto/manual checkout for a product.
 
-    # Add checkout information
+    Split out of the embed builders so batch sends can compute eligibility
+    once per product up front; the keyword matchers themselves are compiled
+    once at import in autocheckout.
+    """
+    # Checkout entirely disabled: skip the matcher calls and try frame.
+    if not AUTO_CHECKOUT_ENABLED:
+        return ""
     try:
-        if autocheckout._matches_keywords(product) and autocheckout._should_attempt_manual(product):
-            desc_lines.append("")
-            desc_lines.append("🤖 **Auto-checkout enabled** (keyword match)")
-        elif autocheckout.should_offer_manual_checkout(product, event_type):
-            desc_lines.append("")
-            desc_lines.append("👤 **Manual checkout available**")
-            
-            # Add fast checkout URL
+        # One keyword scan decides both branches: a viable keyword match gets
+        # the auto banner, a viable non-match gets the manual offer (the same
+        # outcome should_offer_manual_checkout computes, minus a rescan).
+        if autocheckout._should_attempt_manual(product):
+            if autocheckout._matches_keywords(product):
+                return _AUTO_SUFFIX
             fast_url = fast_checkout.get_checkout_url(product.id)
             if fast_url:
-                desc_lines.append(f"🔗 **[⚡ INSTANT CHECKOUT]({fast_url})**")
-                desc_lines.append("↑ Click above for instant checkout ↑")
+                return _MANUAL_SUFFIX + _FAST_URL_SUFFIX.format(url=fast_url)
+            return _MANUAL_SUFFIX
     except Exception:
         # Don't let checkout logic errors break notifications
         pass
+    return ""
+
+
+def _embed_new(product: Product) -> tuple[str, str]:
+    return (
+        product.name or "Unknown product",
+        f"Price: ${float(product.price or 0):.2f}\nAvailable quantity: {int(product.quantity or 0)}",
+    )
+
+
+def _embed_available(product: Product) -> tuple[str, str]:
+    return (
+        f"Back in Stock: {product.name}",
+        f"Price: ${float(product.price or 0):.2f}\nCurrent quantity: {int(product.quantity or 0)}",
+    )
+
+
+def _embed_removed(product: Product) -> tuple[str, str]:
+    return f"Removed: {product.name}", _REMOVED_DESC
+
+
+def _embed_coming_soon(product: Product) -> tuple[str, str]:
+    # price may or may not be present; show if known
+    if (product.price or 0) > 0:
+        desc = f"Expected price: ${float(product.price or 0):.2f}\n{_COMING_SOON_DESC}"
+    else:
+        desc = _COMING_SOON_DESC
+    return f"Coming Soon: {product.name}", desc
+
+
+_BUILDERS = {
+    "new": _embed_new,
+    "available": _embed_available,
+    "removed": _embed_removed,
+    "coming_soon": _embed_coming_soon,
+}
+
+
+def _build_embed(
+    product: Product,
+    event_type: str = "new",
+    *,
+    use_attachment: bool = False,
+    attachment_name: str | None = None,
+    checkout_suffix: str | None = None,
+) -> dict:
+    title, desc = _BUILDERS.get(event_type, _embed_new)(product)
+
+    # Add checkout information (precomputed by batch senders)
+    if checkout_suffix is None:
+        checkout_suffix = _checkout_suffix(product, event_type)
 
     embed = {
         "title": title,
         "url": product.page_url,
-        "description": "\n".join(desc_lines),
+        "description": desc + checkout_suffix,
     }
 
     img_url = (product.image_url or "").strip()
@@ -142,57 +334,132 @@ def send_product_event(
         logger.error("Discord webhook URL is not configured. Cannot send notification.")
         return
 
-    close_session = False
     if session is None:
-        session = get_http_session()
-        close_session = True
-
+        session = _get_session()
+
+    # Try attachment route if enabled and we have a URL to fetch
+    if DISCORD_ATTACH_IMAGES and product.image_url:
+        dl = _download_image_bytes(session, product.image_url)
+        if dl:
+            data, filename, mime = dl
+            embed = _build_embed(product, event_type, use_attachment=True, attachment_name=filename)
+            payload = {"embeds": [embed]}
+            files = { "files[0]": (filename, data, mime) }
+            logger.info("Sending %s notification (with attachment) for %s (id=%s)", event_type, product.name, product.id)
+            _post(session, webhook_url, data={"payload_json": json.dumps(payload)}, files=files)
+            return
+        else:
+            logger.debug("Falling back to direct image URL for %s", product.id)
+
+    # Fallback: regular embed with direct URL
+    payload = {"embeds": [_build_embed(product, event_type)]}
+    logger.info("Sending %s notification for product %s (id=%s)", event_type, product.name, product.id)
+    _post(session, webhook_url, json=payload)
+
+            # ⬇️ NEW: kick off auto-checkout (honors your config flags)
     try:
-        # Try attachment route if enabled and we have a URL to fetch
-        if DISCORD_ATTACH_IMAGES and product.image_url:
-            dl = _download_image_bytes(session, product.image_url)
-            if dl:
-                data, filename, mime = dl
-                embed = _build_embed(product, event_type, use_attachment=True, attachment_name=filename)
-                payload = {"embeds": [embed]}
-                files = { "files[0]": (filename, data, mime) }
-                logger.info("Sending %s notification (with attachment) for %s (id=%s)", event_type, product.name, product.id)
-                _post(session, webhook_url, data={"payload_json": json.dumps(payload)}, files=files)
-                return
-            else:
-                logger.debug("Falling back to direct image URL for %s", product.id)
-
-        # Fallback: regular embed with direct URL
-        payload = {"embeds": [_build_embed(product, event_type)]}
-        logger.info("Sending %s notification for product %s (id=%s)", event_type, product.name, product.id)
-        _post(session, webhook_url, json=payload)
-
-                # ⬇️ NEW: kick off auto-checkout (honors your config flags)
-        try:
-            autocheckout.try_autocheckout(product, event_type)
-        except Exception:
-            logger.exception("Auto-checkout hook failed for %s (%s)", product.name, event_type)
-
-    finally:
-        if close_session:
-            session.close()
+        autocheckout.try_autocheckout(product, event_type)
+    except Exception:
+        logger.exception("Auto-checkout hook failed for %s (%s)", product.name, event_type)
 
 
 def send_notifications(
     products: Iterable[Product],
     webhook_url: Optional[str] = None,
     session: Optional[requests.Session] = None,
+    event_type: str = "new",
 ) -> None:
-    close_session = False
+    products = list(products)
+    if not products:
+        return
+    if webhook_url is None:
+        webhook_url = DISCORD_WEBHOOK_URL
+    if not webhook_url:
+        logger.error("Discord webhook URL is not configured. Cannot send notification.")
+        return
+
     if session is None:
-        session = get_http_session()
-        close_session = True
-    try:
-        for product in products:
-            send_product_event(product, event_type="new", webhook_url=webhook_url, session=session)
-    finally:
-        if close_session:
-            session.close()
+        session = _get_session()
+    # Discord accepts up to 10 embeds per webhook request, so a burst of
+    # N products costs ceil(N/10) posts instead of N.
+    for batch in _chunks(products, 10):
+        try:
+            _send_batch(session, webhook_url, batch, event_type)
+        except Exception:
+            logger.exception(
+                "Failed to send notification batch (%d products)", len(batch)
+            )
+
+
+def _chunks(seq: list, n: int):
+    for i in range(0, len(seq), n):
+        yield seq[i : i + n]
+
+
+def _send_batch(
+    session: requests.Session,
+    webhook_url: str,
+    batch: list[Product],
+    event_type: str = "new",
+) -> None:
+    """Post one multi-embed webhook for up to 10 products."""
+    downloads: list[tuple[bytes, str, str] | None] = [None] * len(batch)
+    if DISCORD_ATTACH_IMAGES:
+        targets = [(i, p.image_url) for i, p in enumerate(batch) if p.image_url]
+        if len(targets) > 1 and NOTIFY_CONCURRENCY > 1:
+            with ThreadPoolExecutor(
+                max_workers=min(NOTIFY_CONCURRENCY, len(targets)),
+                thread_name_prefix="notify-img",
+            ) as ex:
+                futures = {
+                    ex.submit(lambda u: _download_image_bytes(_get_session(), u), url): i
+                    for i, url in targets
+                }
+                for f, i in futures.items():
+                    try:
+                        downloads[i] = f.result()
+                    except Exception:
+                        logger.exception("Image download worker failed")
+        else:
+            for i, url in targets:
+                downloads[i] = _download_image_bytes(session, url)
+
+    # Checkout eligibility is computed once per product, outside the embed
+    # builder, so a failure in checkout logic is isolated up front.
+    checkout = [_checkout_suffix(p, event_type) for p in batch]
+
+    embeds = []
+    files: dict[str, tuple[str, bytes, str]] = {}
+    for idx, p in enumerate(batch):
+        dl = downloads[idx]
+        if dl:
+            data, filename, mime = dl
+            # Prefix with the embed index so names stay unique per request.
+            name = f"{idx}_{filename}"
+            files[f"files[{idx}]"] = (name, data, mime)
+            embeds.append(
+                _build_embed(
+                    p, event_type,
+                    use_attachment=True, attachment_name=name,
+                    checkout_suffix=checkout[idx],
+                )
+            )
+        else:
+            embeds.append(_build_embed(p, event_type, checkout_suffix=checkout[idx]))
+
+    payload = {"embeds": embeds}
+    logger.info("Sending batched notification for %d products", len(batch))
+    if files:
+        _post(session, webhook_url, data={"payload_json": json.dumps(payload)}, files=files)
+    else:
+        _post(session, webhook_url, json=payload)
+
+    # Auto-checkout side effects still fire per product, after the post.
+    for p in batch:
+        try:
+            autocheckout.try_autocheckout(p, event_type)
+        except Exception:
+            logger.exception("Auto-checkout hook failed for %s (%s)", p.name, event_type)
 
 def _absolute_url(u: Optional[str]) -> Optional[str]:
     if not u:
@@ -216,45 +483,39 @@ def send_release_event(
         logger.error("Discord webhook URL not configured.")
         return
 
-    close_session = False
     if session is None:
-        session = get_http_session()
-        close_session = True
-
-    try:
-        title_prefix = "Now Live" if event_type == "live" else "New Release Posted"
-        title = f"{title_prefix}: {getattr(card, 'title', '') or 'Release'}"
-        desc = f"Status: {getattr(card, 'status', '') or 'n/a'}"
-        url = getattr(card, 'url', None)
-
-        # Normalize image (and allow attachments, like product events)
-        img_url = _absolute_url(getattr(card, 'image_url', None))
-
-        embed = {"title": title, "description": desc}
-        if url:
-            embed["url"] = url
-
-        if DISCORD_ATTACH_IMAGES and img_url:
-            dl = _download_image_bytes(session, img_url)
-            if dl:
-                data, filename, mime = dl
-                embed["image"] = {"url": f"attachment://{filename}"}
-                payload = {"embeds": [embed]}
-                files = {"files[0]": (filename, data, mime)}
-                logger.info("Sending %s release notification (with attachment): %s", event_type, title)
-                _post(session, webhook_url, data={"payload_json": json.dumps(payload)}, files=files)
-                return
-            else:
-                logger.debug("Release: image download failed; falling back to direct URL.")
-
-        if img_url:
-            embed["image"] = {"url": img_url}
+        session = _get_session()
+
+    title_prefix = "Now Live" if event_type == "live" else "New Release Posted"
+    title = f"{title_prefix}: {getattr(card, 'title', '') or 'Release'}"
+    desc = f"Status: {getattr(card, 'status', '') or 'n/a'}"
+    url = getattr(card, 'url', None)
+
+    # Normalize image (and allow attachments, like product events)
+    img_url = _absolute_url(getattr(card, 'image_url', None))
+
+    embed = {"title": title, "description": desc}
+    if url:
+        embed["url"] = url
+
+    if DISCORD_ATTACH_IMAGES and img_url:
+        dl = _download_image_bytes(session, img_url)
+        if dl:
+            data, filename, mime = dl
+            embed["image"] = {"url": f"attachment://{filename}"}
+            payload = {"embeds": [embed]}
+            files = {"files[0]": (filename, data, mime)}
+            logger.info("Sending %s release notification (with attachment): %s", event_type, title)
+            _post(session, webhook_url, data={"payload_json": json.dumps(payload)}, files=files)
+            return
+        else:
+            logger.debug("Release: image download failed; falling back to direct URL.")
+
+    if img_url:
+        embed["image"] = {"url": img_url}
 
-        payload = {"embeds": [embed]}
-        logger.info("Sending %s release notification: %s", event_type, title)
-        _post(session, webhook_url, json=payload)
-    finally:
-        if close_session:
-            session.close()
+    payload = {"embeds": [embed]}
+    logger.info("Sending %s release notification: %s", event_type, title)
+    _post(session, webhook_url, json=payload)
 
 __all__ = ["send_notifications", "send_product_event", "send_release_event"]
@@ -1,10 +1,17 @@
 from __future__ import annotations
 
+import atexit
 import json
 import logging
+from collections import OrderedDict
+from pathlib import Path
 import re
+import sys
+import threading
 import time
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Dict, Iterable, List, Optional, Sequence
 from bs4.element import Tag
 import random
@@ -20,9 +27,20 @@ from .config import (
     LEGACY_CATEGORY_ID,
     RELEASE_USE_BROWSER,
     RELEASE_BROWSER_TIMEOUT_MS,
+    ENRICHMENT_WORKERS,
+    ZERO_STOCK_SKIP_SECONDS,
+    HTML_CACHE_DIR,
+    HTML_CACHE_TTL_SECONDS,
+    POLITE_DELAY_MS,
+    SNIFF_CACHE_DIR,
 )
 # scraper.py
 from .config import ONLINE_EXCLUSIVE_CATEGORY_IDS
+from .config import AUTO_CHECKOUT_SEARCH_FIELDS
+
+# Fields joined into Product.match_blob; frozen at import so the haystack
+# builder never re-reads config.
+_MATCH_BLOB_FIELDS: tuple[str, ...] = tuple(AUTO_CHECKOUT_SEARCH_FIELDS) or ("name", "page_url")
 
 # COMING_SOON_NS is optional in config; provide a safe fallback if not defined.
 try:
@@ -36,12 +54,221 @@ except Exception:
     _PLAYWRIGHT_AVAILABLE = False
     PWTimeoutError = Exception  # type: ignore
 
+# Optional fast HTML parser (Modest engine, ~10x html.parser on big pages).
+# The release-page parse falls back to BeautifulSoup when it is missing.
+try:
+    from selectolax.parser import HTMLParser as _SelectolaxParser
+    _SELECTOLAX_AVAILABLE = True
+except Exception:
+    _SelectolaxParser = None  # type: ignore
+    _SELECTOLAX_AVAILABLE = False
+
 from .utils import get_http_session, retryable_request
 
 logger = logging.getLogger(__name__)
 
+_PW_UA = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/124.0 Safari/537.36"
+)
+
+# Shared headless browser: launching Chromium costs seconds and ~100 MB per
+# call, and the release loop may fall back to it every few seconds. Launch
+# once, reuse the context, and let callers open/close their own pages.
+_pw_lock = threading.Lock()
+_pw = None
+_pw_browser = None
+_pw_ctx = None
+_pw_warmed: set[str] = set()  # hosts whose base page this context already visited
+
+
+def _get_browser_context():
+    """Return the shared Playwright BrowserContext, launching it on first use."""
+    global _pw, _pw_browser, _pw_ctx
+    with _pw_lock:
+        if _pw_ctx is not None:
+            try:
+                if _pw_browser.is_connected():
+                    return _pw_ctx
+            except Exception:
+                pass
+            # Browser died underneath us; relaunch below.
+            _pw_ctx = _pw_browser = None
+        if _pw is None:
+            _pw = sync_playwright().start()
+        _pw_browser = _pw.chromium.launch(headless=True)
+        _pw_ctx = _pw_browser.new_context(user_agent=_PW_UA, locale="en-US")
+        _pw_warmed.clear()
+        return _pw_ctx
+
+
+def _shutdown_browser() -> None:
+    global _pw, _pw_browser, _pw_ctx
+    with _pw_lock:
+        for obj, stop in ((_pw_ctx, "close"), (_pw_browser, "close"), (_pw, "stop")):
+            try:
+                if obj is not None:
+                    getattr(obj, stop)()
+            except Exception:
+                pass
+        _pw = _pw_browser = _pw_ctx = None
+
+
+atexit.register(_shutdown_browser)
+
+
+class _SniffCache:
+    """Disk cache for sniffed OCC JSON payloads, keyed by URL + ETag.
+
+    Same shape as the notifier image cache: an in-memory LRU index plus one
+    JSON file per entry. The release page barely changes between scheduled
+    runs, so the next run can mine yesterday's network payloads straight
+    from disk instead of re-rendering and re-parsing them. Entries expire
+    after a day and the cache is bounded by entry count.
+    """
+
+    _MAX_ENTRIES = 256
+    _TTL = 86400.0
+
+    def __init__(self, cache_dir: str):
+        self._dir: Optional[Path] = Path(cache_dir) if cache_dir else None
+        self._lock = threading.Lock()
+        self._index: "OrderedDict[str, list]" = OrderedDict()  # url -> [etag, ts]
+        if self._dir is not None:
+            try:
+                self._dir.mkdir(parents=True, exist_ok=True)
+                idx = json.loads((self._dir / "index.json").read_text("utf-8"))
+                now = time.time()
+                for url, (etag, ts) in idx.items():
+                    if now - ts < self._TTL:
+                        self._index[url] = [etag, ts]
+            except FileNotFoundError:
+                pass
+            except Exception:
+                logger.debug("Sniff cache unusable; disabling.", exc_info=True)
+                self._dir = None
+
+    def _path_for(self, url: str) -> Path:
+        return self._dir / (hashlib.sha1(url.encode("utf-8")).hexdigest() + ".json")
+
+    def _save_index(self) -> None:
+        tmp = self._dir / "index.json.tmp"
+        tmp.write_text(json.dumps(dict(self._index)), "utf-8")
+        tmp.replace(self._dir / "index.json")
+
+    def set(self, url: str, etag: str, payload) -> None:
+        if self._dir is None:
+            return
+        try:
+            with self._lock:
+                cur = self._index.get(url)
+                if cur is not None and cur[0] == etag:
+                    cur[1] = time.time()
+                    self._index.move_to_end(url)
+                else:
+                    self._path_for(url).write_text(json.dumps(payload), "utf-8")
+                    self._index[url] = [etag, time.time()]
+                    self._index.move_to_end(url)
+                    while len(self._index) > self._MAX_ENTRIES:
+                        old, _ = self._index.popitem(last=False)
+                        self._path_for(old).unlink(missing_ok=True)
+                self._save_index()
+        except Exception:
+            logger.debug("Sniff cache write failed for %s", url, exc_info=True)
+
+    def payloads_for_host(self, host: str) -> list:
+        """Return the fresh cached payloads whose URL points at *host*."""
+        if self._dir is None or not host:
+            return []
+        now = time.time()
+        with self._lock:
+            urls = [
+                u for u, (_, ts) in self._index.items()
+                if now - ts < self._TTL and urlparse(u).netloc == host
+            ]
+        out: list = []
+        for u in urls:
+            try:
+                out.append(json.loads(self._path_for(u).read_text("utf-8")))
+            except Exception:
+                continue
+        return out
+
+
+_SNIFF_CACHE = _SniffCache(SNIFF_CACHE_DIR)
+
+
+class _HtmlCache:
+    """Short-TTL disk cache for enrichment HTML, keyed by URL.
+
+    Same shape as _SniffCache: an in-memory LRU index plus one file per
+    entry. Product pages change rarely compared to how often the
+    enrichment loop revisits them, so repeat fetches within the TTL are
+    answered from disk and never leave the process.
+    """
+
+    _MAX_ENTRIES = 512
+
+    def __init__(self, cache_dir: str, ttl: float):
+        self._ttl = float(ttl)
+        self._dir: Optional[Path] = Path(cache_dir) if cache_dir and ttl > 0 else None
+        self._lock = threading.Lock()
+        self._index: "OrderedDict[str, float]" = OrderedDict()  # url -> ts
+        if self._dir is not None:
+            try:
+                self._dir.mkdir(parents=True, exist_ok=True)
+                idx = json.loads((self._dir / "index.json").read_text("utf-8"))
+                now = time.time()
+                for url, ts in idx.items():
+                    if now - ts < self._ttl:
+                        self._index[url] = ts
+            except FileNotFoundError:
+                pass
+            except Exception:
+                logger.debug("HTML cache unusable; disabling.", exc_info=True)
+                self._dir = None
+
+    def _path_for(self, url: str) -> Path:
+        return self._dir / (hashlib.sha1(url.encode("utf-8")).hexdigest() + ".html")
+
+    def _save_index(self) -> None:
+        tmp = self._dir / "index.json.tmp"
+        tmp.write_text(json.dumps(dict(self._index)), "utf-8")
+        tmp.replace(self._dir / "index.json")
+
+    def get(self, url: str) -> Optional[str]:
+        if self._dir is None:
+            return None
+        with self._lock:
+            ts = self._index.get(url)
+            if ts is None or time.time() - ts >= self._ttl:
+                return None
+            self._index.move_to_end(url)
+        try:
+            return self._path_for(url).read_text("utf-8")
+        except Exception:
+            return None
+
+    def set(self, url: str, html: str) -> None:
+        if self._dir is None or not html:
+            return
+        try:
+            with self._lock:
+                self._path_for(url).write_text(html, "utf-8")
+                self._index[url] = time.time()
+                self._index.move_to_end(url)
+                while len(self._index) > self._MAX_ENTRIES:
+                    old, _ = self._index.popitem(last=False)
+                    self._path_for(old).unlink(missing_ok=True)
+                self._save_index()
+        except Exception:
+            logger.debug("HTML cache write failed for %s", url, exc_info=True)
+
 
-@dataclass
+_HTML_CACHE = _HtmlCache(HTML_CACHE_DIR, HTML_CACHE_TTL_SECONDS)
+
+
+@dataclass(slots=True)
 class Product:
     id: str
     name: str
@@ -50,11 +277,26 @@ class Product:
     page_url: str
     quantity: int
     is_online_exclusive: int = 0
-    
+    # Backing slot for match_blob; cached_property needs the __dict__ that
+    # slots=True removes, so the cache lives in an explicit slot instead.
+    _match_blob: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def match_blob(self) -> str:
+        """Lowercased keyword haystack, built once per product and reused by
+        every matching predicate instead of re-joining/lowercasing per call."""
+        blob = self._match_blob
+        if blob is None:
+            blob = " ".join(
+                str(getattr(self, f, "") or "") for f in _MATCH_BLOB_FIELDS
+            ).lower()
+            self._match_blob = blob
+        return blob
+
 
 import hashlib
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ReleaseCard:
     key: str           # stable key derived from URL/title
     title: str
@@ -73,13 +315,135 @@ def _build_products_endpoint(base_url: str) -> str:
 def _build_stock_status_endpoint(base_url: str) -> str:
     return f"{base_url.rstrip('/')}/ccstore/v1/stockStatus"
 
+
+class _ZeroStockFilter:
+    """Two-generation set of SKUs that recently reported zero stock.
+
+    When enabled (ZERO_STOCK_SKIP_SECONDS > 0), fetch_stock_quantities skips
+    SKUs seen at zero within the window, cutting request volume on repeat
+    polls; callers treat missing ids as quantity 0 anyway. Two generations
+    rotated every `ttl` seconds give each entry a lifetime between ttl and
+    2*ttl, so a restocked SKU is re-checked within at most two windows.
+    Off by default: skipping delays restock detection by up to the window.
+    """
+
+    def __init__(self, ttl: float):
+        self._ttl = ttl
+        self._lock = threading.Lock()
+        self._cur: set[str] = set()
+        self._prev: set[str] = set()
+        self._rotated = time.monotonic()
+
+    def _maybe_rotate(self, now: float) -> None:
+        if now - self._rotated >= self._ttl:
+            self._prev = self._cur
+            self._cur = set()
+            self._rotated = now
+
+    def add(self, pid: str) -> None:
+        with self._lock:
+            self._maybe_rotate(time.monotonic())
+            self._cur.add(pid)
+
+    def skip(self, pid: str) -> bool:
+        with self._lock:
+            self._maybe_rotate(time.monotonic())
+            return pid in self._cur or pid in self._prev
+
+
+_ZERO_STOCK_TTL = max(0, int(ZERO_STOCK_SKIP_SECONDS))
+_ZERO_STOCK = _ZeroStockFilter(_ZERO_STOCK_TTL) if _ZERO_STOCK_TTL > 0 else None
+
+# Optional streaming JSON parser for multi-megabyte inline OCC bundles; the
+# buffered json.loads path remains for small blobs and as the fallback.
+try:
+    import ijson
+    _IJSON_AVAILABLE = True
+except Exception:
+    _IJSON_AVAILABLE = False
+
+# Optional non-crypto hash for dedup keys; 5-20x faster than SHA-1 on the
+# short URL strings we feed it. SHA-1 remains the fallback.
+try:
+    import xxhash
+    _XXHASH_AVAILABLE = True
+except Exception:
+    _XXHASH_AVAILABLE = False
+
+# Optional fast JSON decoder for API payloads and inline page JSON; returns
+# the same dict/list structures as stdlib json.
+try:
+    import orjson
+    _ORJSON_AVAILABLE = True
+except Exception:
+    _ORJSON_AVAILABLE = False
+
+
+def _json_loads(raw):
+    """Decode JSON from str or bytes with orjson when installed."""
+    if _ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
 def _stable_key_from(text: str) -> str:
-    t = (text or "").strip().lower()
-    return hashlib.sha1(t.encode("utf-8", errors="ignore")).hexdigest()[:16]
+    t = (text or "").strip().lower().encode("utf-8", errors="ignore")
+    if _XXHASH_AVAILABLE:
+        # "v2:" marks the xxhash key format so it can never be confused with
+        # an old truncated-SHA-1 key already persisted in the seen table.
+        return "v2:" + xxhash.xxh64(t).hexdigest()
+    return hashlib.sha1(t).hexdigest()[:16]
+
+
+# Status detection for release-card text. With pyahocorasick installed (the
+# same optional dependency autocheckout uses) the phrases compile into one
+# automaton and each block text costs a single linear scan instead of one
+# `in` scan per phrase. The in-page JS collector already loops a precomputed
+# keyword array for the same reason.
+try:
+    import ahocorasick  # type: ignore
+    _AHOCORASICK_AVAILABLE = True
+except Exception:
+    _AHOCORASICK_AVAILABLE = False
+
+_STATUS_KEYWORDS = {
+    "shop now": "live",
+    "add to cart": "live",
+    "buy": "live",
+    "coming soon": "coming soon",
+    "sold out": "sold out",
+    "out of stock": "sold out",
+}
+# Tie-break when several phrases appear in one block ("sold out" promo copy
+# next to a live Add to Cart button): live wins, then coming soon.
+_STATUS_PRIORITY = {"live": 0, "coming soon": 1, "sold out": 2}
+
+
+def _build_status_automaton():
+    if not _AHOCORASICK_AVAILABLE:
+        return None
+    auto = ahocorasick.Automaton()
+    for kw, tag in _STATUS_KEYWORDS.items():
+        auto.add_word(kw, tag)
+    auto.make_automaton()
+    return auto
+
+
+_STATUS_AC = _build_status_automaton()
 
 
 def _release_status_from_text(txt: str) -> str:
     t = (txt or "").lower()
+    if _STATUS_AC is not None:
+        best = ""
+        best_rank = len(_STATUS_PRIORITY)
+        for _, tag in _STATUS_AC.iter(t):
+            rank = _STATUS_PRIORITY[tag]
+            if rank < best_rank:
+                best, best_rank = tag, rank
+                if rank == 0:
+                    break
+        return best
     if "shop now" in t or "add to cart" in t or "buy" in t:
         return "live"
     if "coming soon" in t:
@@ -89,6 +453,246 @@ def _release_status_from_text(txt: str) -> str:
     return ""
 
 
+# Absolute-URL sniff shared by the route/image normalizers; a tuple argument
+# makes startswith a single C-level pass instead of two calls.
+_HTTP_PREFIXES = ("http://", "https://")
+
+
+@lru_cache(maxsize=8)
+def _base_slash(base_url: str) -> str:
+    """base_url with exactly one trailing slash.
+
+    Cached so the per-anchor/per-item loops stop re-running rstrip and a
+    string concat for the same handful of base URLs.
+    """
+    return base_url.rstrip("/") + "/"
+
+
+@lru_cache(maxsize=8)
+def _assembler_endpoint(base_url: str) -> str:
+    """Assembler catalog endpoint for base_url, built once per base."""
+    return f"{base_url.rstrip('/')}/ccstore/v1/assembler/pages/Default/osf/catalog"
+
+
+# Default coming-soon sort, resolved once at import instead of per scan.
+_COMING_SOON_SORT = COMING_SOON_NS or "B2CProduct.b2c_comingSoon|1"
+
+# Tile-ish container classes shared by the bs4 and selectolax card parsers.
+_TILE_CLASSES = ("card", "teaser", "tile", "grid__item", "c-card", "cc-card", "cc-tile")
+
+# Selector strings used on every fetched release page, built once here so the
+# hot parse path never re-assembles them per call.
+_PRODUCT_A_SEL = 'a[href*="/product/"]'
+_TILE_SEL = "article, " + ", ".join("." + c for c in _TILE_CLASSES)
+_OG_IMG_SEL = 'meta[property="og:image"], meta[name="og:image"]'
+_HEADING_SEL = "h1, h2, h3, h4"
+
+# Fragment matcher for the inline-JSON rescue, compiled once instead of per
+# script tag.
+_FRAG_RE = re.compile(
+    r'\{[^{}]*?"(?:product\.)?repositoryId"\s*:\s*"(.*?)"[^{}]*\}', re.DOTALL
+)
+
+# In-page collector for the browser fallback: one evaluate round-trip covers
+# the main document, every same-origin frame, and any shadow roots found along
+# the way. Each root costs a single iterative TreeWalker pass instead of
+# querySelectorAll("*") plus recursion, which matters on component-heavy OCC
+# pages, and folding the frames in here avoids a CDP round-trip per frame.
+# Status is reported as the first matched keyword; _release_status_from_text
+# maps it to the canonical label on the Python side.
+_COLLECT_FN_JS = r"""
+(() => {
+  const results = []; const seen = new Set();
+  const KEYWORDS = ["shop now", "add to cart", "buy",
+                    "coming soon", "sold out", "out of stock"];
+  const statusWord = (t) => {
+    const s = (t || "").toLowerCase();
+    for (const k of KEYWORDS) { if (s.includes(k)) return k; }
+    return "";
+  };
+  const handle = (a) => {
+    const href = a.href;
+    if (!href || href.indexOf("/product/") === -1 || seen.has(href)) return;
+    seen.add(href);
+    const container = a.closest('article, .card, .teaser, .tile, .grid__item, .c-card, .cc-card, .cc-tile') || a;
+    const titleEl = container.querySelector("h1,h2,h3,h4") || a;
+    const title = (titleEl.textContent || a.getAttribute("aria-label") || a.getAttribute("title") || href).trim();
+    const imgEl = container.querySelector("img");
+    results.push({
+      href, title,
+      img: imgEl && imgEl.src ? imgEl.src : null,
+      status: statusWord(container.textContent || ""),
+    });
+  };
+  const collect = (doc) => {
+    const roots = [doc];
+    while (roots.length) {
+      const root = roots.pop();
+      const owner = root.ownerDocument || root;
+      const walker = owner.createTreeWalker(root, NodeFilter.SHOW_ELEMENT);
+      let node = walker.currentNode;
+      while (node) {
+        if (node.nodeType === 1) {
+          if (node.tagName === "A") handle(node);
+          if (node.shadowRoot) roots.push(node.shadowRoot);
+        }
+        node = walker.nextNode();
+      }
+    }
+  };
+  const wins = [window];
+  while (wins.length) {
+    const w = wins.pop();
+    try {
+      collect(w.document);
+      for (let i = 0; i < w.frames.length; i++) wins.push(w.frames[i]);
+    } catch (e) { /* cross-origin frame */ }
+  }
+  return results;
+})
+"""
+
+_COLLECT_ALL_JS = _COLLECT_FN_JS + "()"
+
+# Lazy grids only render on scroll; doing the scroll and the collection in
+# the same evaluate saves a CDP round-trip and starts collecting the instant
+# the last scroll step settles.
+_SCROLL_AND_COLLECT_JS = (
+    "async () => {\n"
+    "  const step = (y) => new Promise(r => { window.scrollBy(0, y); "
+    "requestAnimationFrame(() => setTimeout(r, 150)); });\n"
+    "  for (let i = 0; i < 12; i++) { await step(800); }\n"
+    "  window.scrollTo(0, 0);\n"
+    "  return (" + _COLLECT_FN_JS + ")();\n"
+    "}"
+)
+
+
+def _parse_release_cards_selectolax(html: str, base_url: str) -> List[ReleaseCard]:
+    """selectolax twin of the BeautifulSoup card parser in fetch_release_cards.
+
+    Same extraction order (anchors, tiles, inline-JSON rescue), roughly an
+    order of magnitude faster on the 100 KB+ release pages. Callers fall
+    back to the bs4 path if this raises.
+    """
+    tree = _SelectolaxParser(html)
+
+    h1 = tree.css_first("h1, h2")
+    if h1:
+        logger.info("Release page heading: %s", h1.text(strip=True)[:120])
+    logger.info("Release page length: %d chars", len(html))
+
+    candidates: list[ReleaseCard] = []
+    seen_keys: set[str] = set()
+
+    def add_card(url: str, title: str, img: Optional[str], status: str) -> None:
+        abs_url = urljoin(_base_slash(base_url), url.lstrip("/"))
+        key = "release:" + _stable_key_from(abs_url)
+        if key in seen_keys:
+            return
+        seen_keys.add(key)
+        candidates.append(
+            ReleaseCard(
+                key=key,
+                title=title or abs_url,
+                url=abs_url,
+                image_url=_normalize_image_url(img, base_url) if img else None,
+                status=status or "",
+            )
+        )
+
+    def container_of(node):
+        cur = node.parent
+        while cur is not None and cur.tag not in ("html", "body", None):
+            if cur.tag == "article":
+                return cur
+            cls = (cur.attributes.get("class") or "").split()
+            if any(c in _TILE_CLASSES for c in cls):
+                return cur
+            cur = cur.parent
+        return None
+
+    # og:image is page-level; resolve it once, not per anchor.
+    meta = tree.css_first(_OG_IMG_SEL)
+    meta_img = meta.attributes.get("content") if meta else None
+
+    # 1+2) Direct anchors and CMS-ish tiles in one fused walk. The separate
+    # css() passes each traversed every node; one traversal classifies each
+    # element as product anchor or tile, and add_card's key dedup means a
+    # tile whose anchor was already recorded costs nothing extra.
+    tile_set = frozenset(_TILE_CLASSES)
+    n_anchors = 0
+    n_tiles = 0
+    for node in tree.root.traverse(include_text=False):
+        tag = node.tag
+        if tag == "a":
+            href = (node.attributes.get("href") or "").strip()
+            if "/product/" not in href:
+                continue
+            n_anchors += 1
+            if n_anchors > 200:
+                continue
+            container = container_of(node)
+            title_el = container.css_first(_HEADING_SEL) if container else None
+            title = (
+                (title_el or node).text(strip=True)
+                or node.attributes.get("aria-label")
+                or node.attributes.get("title")
+                or href
+            )
+            img_el = (container or node).css_first("img")
+            img = meta_img or (img_el.attributes.get("src") if img_el else None)
+            block_text = " ".join([
+                node.text(separator=" ", strip=True) or "",
+                (container.text(separator=" ", strip=True) if container else ""),
+            ])
+            add_card(href, title, img, _release_status_from_text(block_text))
+        else:
+            cls = node.attributes.get("class") if node.attributes else None
+            if tag != "article" and not (cls and not tile_set.isdisjoint(cls.split())):
+                continue
+            n_tiles += 1
+            a = node.css_first("a[href]")
+            if a and "/product/" in (a.attributes.get("href") or ""):
+                href = a.attributes.get("href") or ""
+                title_el = node.css_first(_HEADING_SEL) or a
+                title = title_el.text(strip=True) or href
+                img_el = node.css_first("img")
+                img = img_el.attributes.get("src") if img_el else None
+                status = _release_status_from_text(node.text(separator=" ", strip=True))
+                add_card(href, title, img, status)
+    logger.info(
+        "Release: explicit product links found: %d; tile-like blocks: %d",
+        n_anchors, n_tiles,
+    )
+
+    # 3) Inline JSON rescue
+    if not candidates:
+        json_cards = _cards_from_script_texts(
+            (
+                n.text()
+                for n in tree.css("script")
+                if (n.attributes.get("type") or "").lower() in _SCRIPT_SCAN_TYPES
+            ),
+            base_url,
+        )
+        if json_cards:
+            logger.info("Release: recovered %d candidates from inline JSON.", len(json_cards))
+            candidates = json_cards
+
+    # Dedup by URL
+    out: list[ReleaseCard] = []
+    seen_urls: set[str] = set()
+    for c in candidates:
+        ukey = (c.url or "").lower()
+        if ukey and ukey not in seen_urls:
+            seen_urls.add(ukey)
+            out.append(c)
+
+    logger.info("Release: candidates parsed: %d", len(out))
+    return out
+
+
 def fetch_release_cards(
     page_url: str,
     *,
@@ -112,6 +716,11 @@ def fetch_release_cards(
     # ---------- helpers ----------
 
     def _parse_cards_from_html(html: str, base_url: str) -> List[ReleaseCard]:
+        if _SELECTOLAX_AVAILABLE:
+            try:
+                return _parse_release_cards_selectolax(html, base_url)
+            except Exception:
+                logger.debug("selectolax parse failed; falling back to bs4", exc_info=True)
         soup = BeautifulSoup(html, "html.parser")
 
         h1 = soup.find(["h1", "h2"])
@@ -123,7 +732,7 @@ def fetch_release_cards(
         seen_keys: set[str] = set()
 
         def add_card(url: str, title: str, img: Optional[str], status: str) -> None:
-            abs_url = urljoin(base_url.rstrip("/") + "/", url.lstrip("/"))
+            abs_url = urljoin(_base_slash(base_url), url.lstrip("/"))
             key = "release:" + _stable_key_from(abs_url)
             if key in seen_keys:
                 return
@@ -139,7 +748,10 @@ def fetch_release_cards(
             )
 
         # 1) Direct anchors
-        product_links = soup.select('a[href*="/product/"]')
+        meta_el = soup.select_one(_OG_IMG_SEL)
+        meta_img = meta_el.get("content") if meta_el else None
+
+        product_links = soup.select(_PRODUCT_A_SEL)
         logger.info("Release: explicit product links found: %d", len(product_links))
         for a in product_links[:200]:
             href = (a.get("href") or "").strip()
@@ -156,8 +768,7 @@ def fetch_release_cards(
                 or href
             )
             img_el = (container or a).find("img") if container else a.find("img")
-            meta_img = soup.select_one('meta[property="og:image"], meta[name="og:image"]')
-            img = (meta_img.get("content") if meta_img else None) or (img_el.get("src") if img_el else None)
+            img = meta_img or (img_el.get("src") if img_el else None)
             block_text = " ".join([
                 a.get_text(" ", strip=True) or "",
                 (container.get_text(" ", strip=True) if container else "")
@@ -166,7 +777,7 @@ def fetch_release_cards(
             add_card(href, title, img, status)
 
         # 2) CMS-ish tiles
-        tiles = soup.select("article, .card, .teaser, .tile, .grid__item, .c-card, .cc-card, .cc-tile")
+        tiles = soup.select(_TILE_SEL)
         logger.info("Release: tile-like blocks found: %d", len(tiles))
         for b in tiles:
             a = b.find("a", href=True)
@@ -208,9 +819,9 @@ def fetch_release_cards(
             u = u.strip()
             if not u:
                 return None
-            if u.startswith("http://") or u.startswith("https://"):
+            if u.startswith(_HTTP_PREFIXES):
                 return u
-            return urljoin(base_url.rstrip("/") + "/", u.lstrip("/"))
+            return urljoin(_base_slash(base_url), u.lstrip("/"))
 
         for it in items:
             url = norm_url(it.get("route") or it.get("seoUrl") or it.get("href") or it.get("url"))
@@ -234,74 +845,15 @@ def fetch_release_cards(
             )
         return out
 
-    def _collect_links_via_shadow_dom(page, base_url: str) -> List[ReleaseCard]:
-        """Walk shadow roots in the main document to collect anchors."""
-        js = r"""
-        (() => {
-          const results = []; const seen = new Set();
-          const statusFromText = (t) => {
-            const s = (t || "").toLowerCase();
-            if (s.includes("shop now") || s.includes("add to cart") || s.includes("buy")) return "live";
-            if (s.includes("coming soon")) return "coming soon";
-            if (s.includes("sold out") || s.includes("out of stock")) return "sold out";
-            return "";
-          };
-          const walk = (root) => {
-            root.querySelectorAll('a[href*="/product/"]').forEach(a => {
-              const href = a.href;
-              if (!href || seen.has(href)) return;
-              seen.add(href);
-              const container = a.closest('article, .card, .teaser, .tile, .grid__item, .c-card, .cc-card, .cc-tile') || a;
-              const titleEl = (container.querySelector("h1,h2,h3,h4") || a);
-              const title = (titleEl.textContent || a.getAttribute("aria-label") || a.getAttribute("title") || href).trim();
-              let img = null;
-              const imgEl = container.querySelector("img");
-              if (imgEl && imgEl.src) img = imgEl.src;
-              const status = statusFromText(container.textContent || "");
-              results.push({ href, title, img, status });
-            });
-            root.querySelectorAll("*").forEach(el => { if (el.shadowRoot) walk(el.shadowRoot); });
-          };
-          walk(document);
-          return results;
-        })()
+    def _collect_links_in_page(page, base_url: str) -> List[ReleaseCard]:
+        """Collect anchors from the document, its frames, and shadow roots.
+
+        One evaluate round-trip: the in-page script iterates same-origin
+        frames itself instead of paying a CDP call per frame.
         """
-        items = page.evaluate(js) or []
+        items = page.evaluate(_COLLECT_ALL_JS) or []
         return _cards_from_simple_dicts(items, base_url)
 
-    def _collect_links_from_all_frames(page, base_url: str) -> List[ReleaseCard]:
-        """Run the same shadow-DOM collector in every frame/iframe."""
-        cards: list[ReleaseCard] = []
-        seen: set[str] = set()
-
-        for fr in page.frames:
-            try:
-                items = fr.evaluate(
-                    """(() => {
-                        const out=[]; const seen=new Set();
-                        const walk=(root)=>{
-                          root.querySelectorAll('a[href*="/product/"]').forEach(a=>{
-                            const href=a.href; if(!href||seen.has(href)) return; seen.add(href);
-                            const c=a.closest('article, .card, .teaser, .tile, .grid__item, .c-card, .cc-card, .cc-tile')||a;
-                            const tEl=(c.querySelector("h1,h2,h3,h4")||a);
-                            const title=(tEl.textContent||a.getAttribute("aria-label")||a.getAttribute("title")||href).trim();
-                            let img=null; const imgEl=c.querySelector("img"); if(imgEl&&imgEl.src) img=imgEl.src;
-                            out.push({href, title, img, status:c.textContent||""});
-                          });
-                          root.querySelectorAll("*").forEach(el=>{ if(el.shadowRoot) walk(el.shadowRoot); });
-                        };
-                        walk(document);
-                        return out;
-                    })()"""
-                ) or []
-                for c in _cards_from_simple_dicts(items, base_url):
-                    if c.key not in seen:
-                        seen.add(c.key)
-                        cards.append(c)
-            except Exception:
-                continue
-        return cards
-
     def _sniff_links_from_network(sniffed: list[dict], base_url: str) -> List[ReleaseCard]:
         """Convert sniffed JSON blobs to cards."""
         return _cards_from_simple_dicts(sniffed, base_url)
@@ -312,13 +864,25 @@ def fetch_release_cards(
         variants.append(page_url.replace("/whiskey%20release/", "/whiskey-release/"))
     if "/whiskey-release/" in page_url:
         variants.append(page_url.replace("/whiskey-release/", "/whiskey%20release/"))
+    # The replaces can hand back the original string; don't fetch it twice.
+    variants = list(dict.fromkeys(variants))
 
     try:
-        for idx, url in enumerate(variants, 1):
+        # Fetch every variant concurrently up front, then parse in preference
+        # order: when the first variant comes back empty, the second's fetch
+        # has already overlapped with the first's download and parse.
+        if len(variants) > 1:
+            with ThreadPoolExecutor(
+                max_workers=len(variants), thread_name_prefix="release-fetch"
+            ) as ex:
+                htmls = list(ex.map(lambda u: _fetch_html(session, u), variants))
+        else:
+            htmls = [_fetch_html(session, variants[0])]
+
+        for idx, (url, html) in enumerate(zip(variants, htmls), 1):
             logger.info("Release: fetching variant %d/%d -> %s", idx, len(variants), url)
 
-            # --- 1) plain requests path
-            html = _fetch_html(session, url)
+            # --- 1) plain requests path (HTML prefetched above)
             cards: List[ReleaseCard] = []
             if html:
                 parsed = _parse_cards_from_html(html, base_url)
@@ -330,8 +894,8 @@ def fetch_release_cards(
                 logger.info("Release: trying browser fallback for %s", url)
                 if _PLAYWRIGHT_AVAILABLE:
                     try:
-                        from playwright.sync_api import sync_playwright
                         sniffed_items: list[dict] = []
+                        sniffed_routes: set[str] = set()
 
                         def _try_parse_json(resp):
                             try:
@@ -348,24 +912,14 @@ def fetch_release_cards(
                                     # light heuristic: only attempt if it looks like JSON
                                     if (t.lstrip().startswith("{") and t.rstrip().endswith("}")) or \
                                        (t.lstrip().startswith("[") and t.rstrip().endswith("]")):
-                                        import json as _json
-                                        return _json.loads(t)
+                                        return _json_loads(t)
                                 except Exception:
                                     return None
                                 return None
 
                         def _mine_for_products(obj):
-                            """Yield tiny dicts with route/title/image/status if present."""
-                            def _iter(o):
-                                if isinstance(o, dict):
-                                    yield o
-                                    for v in o.values():
-                                        yield from _iter(v)
-                                elif isinstance(o, list):
-                                    for v in o:
-                                        yield from _iter(v)
-
-                            for d in _iter(obj):
+                            """Collect tiny dicts with route/title/image if present."""
+                            for d in _iter_dicts(obj):
                                 rid = d.get("repositoryId") or \
                                       (isinstance(d.get("product"), dict) and d["product"].get("repositoryId")) or \
                                       (isinstance(d.get("sku"), dict) and d["sku"].get("repositoryId"))
@@ -378,16 +932,23 @@ def fetch_release_cards(
                                 img = d.get("primaryMediumImageURL") or d.get("primaryLargeImageURL") or \
                                       (isinstance(d.get("sku"), dict) and (d["sku"].get("primaryMediumImageURL") or d["sku"].get("primaryLargeImageURL")))
                                 if (rid or route) and (route and "/product/" in str(route)):
+                                    # The same route shows up in many sniffed
+                                    # payloads; keep the first sighting only.
+                                    r = str(route)
+                                    if r in sniffed_routes:
+                                        continue
+                                    sniffed_routes.add(r)
                                     sniffed_items.append({"route": route, "displayName": title, "img": img})
 
-                        with sync_playwright() as p:
-                            browser = p.chromium.launch(headless=True)
-                            ctx = browser.new_context(
-                                user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0 Safari/537.36",
-                                locale="en-US",
-                            )
+                        # Seed from payloads cached on earlier runs; anything
+                        # the endpoints re-serve unchanged is mined for free.
+                        for cached in _SNIFF_CACHE.payloads_for_host(urlparse(base_url).netloc):
+                            _mine_for_products(cached)
 
-                            # Attach network sniffer
+                        page = _get_browser_context().new_page()
+                        try:
+                            # Attach the network sniffer to the page, not the
+                            # shared context, so the handler dies with the page.
                             def _on_response(resp):
                                 try:
                                     u = (resp.url or "").lower()
@@ -396,17 +957,22 @@ def fetch_release_cards(
                                         js = _try_parse_json(resp)
                                         if js is not None:
                                             _mine_for_products(js)
+                                            etag = resp.headers.get("etag")
+                                            if etag:
+                                                _SNIFF_CACHE.set(resp.url, etag, js)
                                 except Exception:
                                     pass
 
-                            ctx.on("response", _on_response)
+                            page.on("response", _on_response)
 
-                            page = ctx.new_page()
+                            host = urlparse(base_url).netloc
                             try:
+                                _polite(host)
                                 page.goto(base_url.rstrip("/") + "/", wait_until="domcontentloaded", timeout=15000)
                             except Exception:
                                 pass
 
+                            _polite(host)
                             page.goto(url, wait_until="domcontentloaded", timeout=RELEASE_BROWSER_TIMEOUT_MS // 2)
 
                             # give the page time to load widgets / slots
@@ -415,37 +981,28 @@ def fetch_release_cards(
                             except Exception:
                                 pass
 
-                            # gentle auto-scroll to trigger lazy rendering
+                            # Gentle auto-scroll (triggers lazy rendering) and
+                            # DOM collection fused into one round-trip.
                             try:
-                                page.evaluate("""async () => {
-                                  const s = (y) => new Promise(r => { window.scrollBy(0,y); requestAnimationFrame(()=>setTimeout(r,150)); });
-                                  for (let i=0;i<12;i++) { await s(800); }
-                                  window.scrollTo(0,0);
-                                }""")
+                                items = page.evaluate(_SCROLL_AND_COLLECT_JS) or []
+                                page_cards = _cards_from_simple_dicts(items, base_url)
                             except Exception:
-                                pass
-
-                            # Collect via DOM (main doc)
-                            dom_cards = _collect_links_via_shadow_dom(page, base_url)
-
-                            # Collect via all frames (iframes)
-                            frame_cards = _collect_links_from_all_frames(page, base_url)
+                                logger.debug("scroll+collect failed; collecting without scroll", exc_info=True)
+                                page_cards = _collect_links_in_page(page, base_url)
 
                             # Convert sniffed JSON → cards
                             sniff_cards = _sniff_links_from_network(sniffed_items, base_url)
 
                             # Merge + dedupe
                             by_key: dict[str, ReleaseCard] = {}
-                            for coll, tag in ((dom_cards, "DOM"),
-                                              (frame_cards, "IFRAME"),
-                                              (sniff_cards, "NET")):
+                            for coll in (page_cards, sniff_cards):
                                 for c in coll:
                                     by_key[c.key] = c
                             cards = list(by_key.values())
 
                             logger.info(
-                                "Release (browser): DOM=%d, IFRAME=%d, NET=%d, total unique=%d",
-                                len(dom_cards), len(frame_cards), len(sniff_cards), len(cards)
+                                "Release (browser): DOM=%d, NET=%d, total unique=%d",
+                                len(page_cards), len(sniff_cards), len(cards)
                             )
 
                             # If still nothing, one tiny retry after a pause
@@ -454,17 +1011,16 @@ def fetch_release_cards(
                                     page.wait_for_timeout(1500)
                                 except Exception:
                                     pass
-                                dom_cards2 = _collect_links_via_shadow_dom(page, base_url)
-                                frame_cards2 = _collect_links_from_all_frames(page, base_url)
-                                by_key2 = {c.key: c for c in (cards + dom_cards2 + frame_cards2)}
+                                page_cards2 = _collect_links_in_page(page, base_url)
+                                by_key2 = {c.key: c for c in (cards + page_cards2)}
                                 cards = list(by_key2.values())
                                 logger.info(
-                                    "Release (browser): retry DOM+IFRAME found=%d (total unique=%d)",
-                                    len(dom_cards2) + len(frame_cards2), len(cards)
+                                    "Release (browser): retry DOM found=%d (total unique=%d)",
+                                    len(page_cards2), len(cards)
                                 )
 
-                            ctx.close()
-                            browser.close()
+                        finally:
+                            page.close()
                     except Exception:
                         logger.info("Release: Playwright fallback failed.", exc_info=True)
                 else:
@@ -503,188 +1059,262 @@ def _normalize_image_url(src: str, base_url: str) -> str:
     Example:
       /ccstore/v1/images/?source=/file/v123/products/000008520_F1.jpg&width=300
     ->  /file/v123/products/000008520_F1.jpg
+
+    Cached: pages repeat a small set of image-service URLs (the JSON walker
+    can yield the same one under product, sku and top-level keys), and each
+    miss costs a urljoin/urlparse/parse_qs round.
     """
     if not src:
         return ""
+    return _normalize_image_url_cached(str(src), base_url)
+
+
+@lru_cache(maxsize=4096)
+def _normalize_image_url_cached(src: str, base_url: str) -> str:
     # Make absolute for parsing
-    abs_url = urljoin(base_url.rstrip("/") + "/", src.lstrip("/"))
+    abs_url = urljoin(_base_slash(base_url), src.lstrip("/"))
     parsed = urlparse(abs_url)
     if parsed.path.rstrip("/").endswith("/ccstore/v1/images"):
         qs = parse_qs(parsed.query or "")
         inner = qs.get("source", [None])[0]
         if inner:
-            return urljoin(base_url.rstrip("/") + "/", inner.lstrip("/"))
+            return urljoin(_base_slash(base_url), inner.lstrip("/"))
     return abs_url
 def _iter_dicts(o):
-    """Yield all dicts inside arbitrary JSON (list/dict scalars)."""
-    if isinstance(o, dict):
-        yield o
-        for v in o.values():
-            yield from _iter_dicts(v)
-    elif isinstance(o, list):
-        for v in o:
-            yield from _iter_dicts(v)
-
-def _first_nonempty(*vals) -> Optional[str]:
-    for v in vals:
-        if v:
-            s = str(v).strip()
-            if s:
-                return s
-    return None
+    """Yield all dicts inside arbitrary JSON, iteratively.
+
+    An explicit stack instead of recursion: no generator frame per level and
+    no RecursionError on deeply nested OCC bundles. Children are pushed
+    reversed so dicts still come out in document order (first occurrence wins
+    the URL dedup downstream). The exact type() checks are safe because
+    json.loads only ever produces plain dicts/lists.
+    """
+    stack = [o]
+    while stack:
+        cur = stack.pop()
+        if type(cur) is dict:
+            yield cur
+            stack.extend(reversed(list(cur.values())))
+        elif type(cur) is list:
+            stack.extend(reversed(cur))
 
 def _to_abs_route(route: Optional[str], base_url: str) -> Optional[str]:
+    # Same bounded-cache treatment as _normalize_image_url: routes repeat
+    # heavily inside one page's JSON.
     if not route:
         return None
-    r = str(route)
-    if r.startswith("http://") or r.startswith("https://"):
+    return _to_abs_route_cached(str(route), base_url)
+
+
+@lru_cache(maxsize=4096)
+def _to_abs_route_cached(r: str, base_url: str) -> str:
+    if r.startswith(_HTTP_PREFIXES):
         return r
     if not r.startswith("/"):
         r = "/" + r
     return base_url.rstrip("/") + r
 
+
+def _mine_product_dict(d: dict):
+    """Pull (rid, title, route, img) out of one product-ish dict.
+
+    Single pass with the nested product/sku dicts fetched once, instead of
+    the old ~10 repeated .get() probes per field. Returns None when the dict
+    carries no repositoryId.
+    """
+    prod = d.get("product")
+    if type(prod) is not dict:
+        prod = None
+    sku = d.get("sku")
+    if type(sku) is not dict:
+        sku = None
+
+    rid = (
+        d.get("repositoryId")
+        or d.get("product.repositoryId")
+        or d.get("sku.repositoryId")
+        or (prod.get("repositoryId") if prod else None)
+        or (sku.get("repositoryId") if sku else None)
+    )
+    if not rid:
+        return None
+
+    title = (
+        d.get("displayName")
+        or (prod.get("displayName") if prod else None)
+        or (sku.get("displayName") if sku else None)
+    )
+    route = (
+        d.get("route")
+        or d.get("seoUrl")
+        or d.get("seoUrlSlugDerived")
+        or (prod.get("route") if prod else None)
+        or (sku.get("route") if sku else None)
+    )
+    img = (
+        d.get("primaryMediumImageURL")
+        or d.get("primaryLargeImageURL")
+        or d.get("primaryFullImageURL")
+        or d.get("sku.primaryMediumImageURL")
+        or d.get("sku.primaryLargeImageURL")
+        or d.get("sku.primaryFullImageURL")
+    )
+    return rid, title, route, img
+
+
+# Below this size the interpreter overhead of event-based parsing exceeds
+# the win over a plain json.loads.
+_IJSON_MIN_BYTES = 32_000
+
+# Leaf keys worth keeping while streaming; everything else in the bundle
+# (layout config, metadata) is dropped as it parses.
+_MINE_KEYS = frozenset((
+    "repositoryId", "product.repositoryId", "sku.repositoryId",
+    "displayName", "route", "seoUrl", "seoUrlSlugDerived",
+    "primaryMediumImageURL", "primaryLargeImageURL", "primaryFullImageURL",
+    "sku.primaryMediumImageURL", "sku.primaryLargeImageURL",
+    "sku.primaryFullImageURL",
+))
+
+
+def _mine_cards_streaming(raw: str, cards: List["ReleaseCard"], seen_urls: set, base_url: str) -> None:
+    """ijson twin of _mine_cards for multi-megabyte script blobs.
+
+    Keeps one scratch dict of interesting keys per open JSON object instead
+    of materializing the whole tree, and mines each object as it closes, so
+    peak memory stays flat regardless of bundle size.
+    """
+    import io
+
+    stack: list[list] = []  # [scratch_dict, pending_key] per open object
+    for event, value in ijson.basic_parse(io.StringIO(raw)):
+        if event == "map_key":
+            stack[-1][1] = value
+        elif event == "start_map":
+            stack.append([{}, None])
+        elif event == "end_map":
+            d, _ = stack.pop()
+            if stack:
+                key = stack[-1][1]
+                if key in ("product", "sku"):
+                    stack[-1][0][key] = d
+                stack[-1][1] = None
+            mined = _mine_product_dict(d)
+            if mined is not None:
+                _append_card(mined, cards, seen_urls, base_url)
+        elif event == "start_array":
+            if stack:
+                stack[-1][1] = None
+        elif event != "end_array" and stack:
+            # scalar value (string/number/boolean/null)
+            key = stack[-1][1]
+            if key is not None:
+                if key in _MINE_KEYS:
+                    stack[-1][0][key] = value
+                stack[-1][1] = None
+
+
+def _append_card(mined, cards: List["ReleaseCard"], seen_urls: set, base_url: str) -> None:
+    """Turn one (rid, title, route, img) tuple into a ReleaseCard, URL-deduped."""
+    rid, title, route, img = mined
+
+    url = _to_abs_route(route, base_url) or None
+    if url:
+        low = url.lower()
+        if low in seen_urls:
+            return
+        seen_urls.add(low)
+
+    cards.append(ReleaseCard(
+        key="release:" + _stable_key_from(url or str(rid)),
+        title=str(title).strip() if title else f"Product {rid}",
+        url=url or _base_slash(base_url),
+        image_url=_normalize_image_url(str(img), base_url) if img else None,
+        status="",   # unknown from JSON; UI text will set later if needed
+    ))
+
+
+def _mine_cards(parsed, cards: List["ReleaseCard"], seen_urls: set, base_url: str) -> None:
+    """Walk parsed JSON and append a ReleaseCard per product-ish dict found."""
+    for d in _iter_dicts(parsed):
+        mined = _mine_product_dict(d)
+        if mined is not None:
+            _append_card(mined, cards, seen_urls, base_url)
+
+# Script types worth scanning for inline product JSON; anything else that
+# declares a type (templates and the like) is skipped before its text is read.
+_SCRIPT_SCAN_TYPES = frozenset((
+    "", "application/json", "application/ld+json",
+    "text/javascript", "application/javascript", "module",
+))
+
+
 def _extract_cards_from_inline_json(soup: BeautifulSoup, base_url: str) -> List["ReleaseCard"]:
     """
     Scan inline script tags for JSON blobs that contain product-ish objects and
     build ReleaseCard entries from them.
     """
+    return _cards_from_script_texts(
+        (
+            tag.string or ""
+            for tag in soup.find_all("script")
+            if (tag.get("type") or "").lower() in _SCRIPT_SCAN_TYPES
+        ),
+        base_url,
+    )
+
+
+def _cards_from_script_texts(texts: Iterable[str], base_url: str) -> List["ReleaseCard"]:
+    """Parser-agnostic core of the inline-JSON rescue: takes raw script text."""
     cards: list[ReleaseCard] = []
     seen_urls: set[str] = set()
     # Be liberal in what we accept
-    script_tags = soup.find_all("script")
-    for tag in script_tags:
-        raw = tag.string or ""
-        raw = raw.strip()
+    for raw in texts:
+        raw = (raw or "").strip()
         if not raw:
             continue
+        # Nothing minable without this key; the substring test is ~free next
+        # to json.loads or the fragment regex, and rules out framework
+        # bundles (jQuery and friends) that dominate script bytes.
+        if "repositoryId" not in raw:
+            continue
+
+        first, last = raw[0], raw[-1]
+        looks_like_json = (first == "{" and last == "}") or (first == "[" and last == "]")
+
+        # Big bundles: stream with ijson so the full object tree is never
+        # materialized. Buffered parse stays for small blobs (less overhead)
+        # and for environments without ijson.
+        if _IJSON_AVAILABLE and looks_like_json and len(raw) >= _IJSON_MIN_BYTES:
+            try:
+                _mine_cards_streaming(raw, cards, seen_urls, base_url)
+                continue
+            except Exception:
+                logger.debug("ijson scan failed; falling back to json.loads", exc_info=True)
 
         parsed = None
-        # Quick sanity: only try to json.loads strings that look like JSON
-        if (raw.startswith("{") and raw.endswith("}")) or (raw.startswith("[") and raw.endswith("]")):
+        # Quick sanity: only try to json.loads strings that look like JSON,
+        # and never multi-megabyte ones (the fragment regex handles those).
+        if looks_like_json and len(raw) <= 2_000_000:
             try:
-                parsed = json.loads(raw)
+                parsed = _json_loads(raw)
             except Exception:
                 parsed = None
 
         if parsed is None:
             # Fallback: look for small JSON fragments inside the JS by brute regex
             # This catches {"repositoryId":"100012345", ...} chunks embedded in larger scripts.
-            for m in re.finditer(r'\{[^{}]*?"(?:product\.)?repositoryId"\s*:\s*"(.*?)"[^{}]*\}', raw, flags=re.DOTALL):
+            for m in _FRAG_RE.finditer(raw):
                 try:
-                    frag = json.loads(m.group(0))
+                    frag = _json_loads(m.group(0))
                 except Exception:
                     continue
-                parsed = frag
-                # Treat this fragment alone
-                for d in _iter_dicts(parsed):
-                    rid = _first_nonempty(
-                        d.get("repositoryId"),
-                        d.get("product.repositoryId"),
-                        d.get("sku.repositoryId"),
-                        d.get("product", {}).get("repositoryId") if isinstance(d.get("product"), dict) else None,
-                        d.get("sku", {}).get("repositoryId") if isinstance(d.get("sku"), dict) else None,
-                    )
-                    if not rid:
-                        continue
-
-                    title = _first_nonempty(
-                        d.get("displayName"),
-                        d.get("product.displayName") if isinstance(d.get("product"), dict) else None,
-                        d.get("sku.displayName") if isinstance(d.get("sku"), dict) else None,
-                    ) or f"Product {rid}"
-
-                    route = _first_nonempty(
-                        d.get("route"),
-                        d.get("seoUrl"),
-                        d.get("seoUrlSlugDerived"),
-                        d.get("product", {}).get("route") if isinstance(d.get("product"), dict) else None,
-                        d.get("sku", {}).get("route") if isinstance(d.get("sku"), dict) else None,
-                    )
-                    url = _to_abs_route(route, base_url) or None
-
-                    img = _first_nonempty(
-                        d.get("primaryMediumImageURL"),
-                        d.get("primaryLargeImageURL"),
-                        d.get("primaryFullImageURL"),
-                        d.get("sku.primaryMediumImageURL"),
-                        d.get("sku.primaryLargeImageURL"),
-                        d.get("sku.primaryFullImageURL"),
-                    )
-                    if img:
-                        img = _normalize_image_url(img, base_url)
-
-                    # Build key using URL if present, else repositoryId
-                    key_src = (url or rid)
-                    key = "release:" + _stable_key_from(key_src)
-
-                    if url and url.lower() in seen_urls:
-                        continue
-                    if url:
-                        seen_urls.add(url.lower())
-
-                    cards.append(ReleaseCard(
-                        key=key,
-                        title=title,
-                        url=url or (base_url.rstrip("/") + "/"),
-                        image_url=img,
-                        status="",   # unknown from JSON; UI text will set later if needed
-                    ))
+                _mine_cards(frag, cards, seen_urls, base_url)
             # Done with regex fallback for this tag
             continue
 
         # If we have parsed JSON (dict/list), walk it for product dicts
-        for d in _iter_dicts(parsed):
-            rid = _first_nonempty(
-                d.get("repositoryId"),
-                d.get("product.repositoryId"),
-                d.get("sku.repositoryId"),
-                d.get("product", {}).get("repositoryId") if isinstance(d.get("product"), dict) else None,
-                d.get("sku", {}).get("repositoryId") if isinstance(d.get("sku"), dict) else None,
-            )
-            if not rid:
-                continue
-
-            title = _first_nonempty(
-                d.get("displayName"),
-                d.get("product.displayName") if isinstance(d.get("product"), dict) else None,
-                d.get("sku.displayName") if isinstance(d.get("sku"), dict) else None,
-            ) or f"Product {rid}"
-
-            route = _first_nonempty(
-                d.get("route"),
-                d.get("seoUrl"),
-                d.get("seoUrlSlugDerived"),
-                d.get("product", {}).get("route") if isinstance(d.get("product"), dict) else None,
-                d.get("sku", {}).get("route") if isinstance(d.get("sku"), dict) else None,
-            )
-            url = _to_abs_route(route, base_url) or None
-
-            img = _first_nonempty(
-                d.get("primaryMediumImageURL"),
-                d.get("primaryLargeImageURL"),
-                d.get("primaryFullImageURL"),
-                d.get("sku.primaryMediumImageURL"),
-                d.get("sku.primaryLargeImageURL"),
-                d.get("sku.primaryFullImageURL"),
-            )
-            if img:
-                img = _normalize_image_url(img, base_url)
-
-            key_src = (url or rid)
-            key = "release:" + _stable_key_from(key_src)
-
-            if url and url.lower() in seen_urls:
-                continue
-            if url:
-                seen_urls.add(url.lower())
-
-            cards.append(ReleaseCard(
-                key=key,
-                title=title,
-                url=url or (base_url.rstrip("/") + "/"),
-                image_url=img,
-                status="",
-            ))
+        _mine_cards(parsed, cards, seen_urls, base_url)
 
     return cards
 
@@ -712,13 +1342,14 @@ def _parse_page_url(item: dict, base_url: str) -> str:
     route = str(route or "")
     if not route:
         return base_url.rstrip("/")
-    if route.startswith("http://") or route.startswith("https://"):
+    if route.startswith(_HTTP_PREFIXES):
         return route
     if not route.startswith("/"):
         route = "/" + route
     return base_url.rstrip("/") + route
 
-ONLINE_EXCLUSIVE_CATEGORY_IDS = {"3030473779"}  # Online Exclusives
+# Interned so membership tests against interned item ids hit pointer equality.
+ONLINE_EXCLUSIVE_CATEGORY_IDS = frozenset(sys.intern(x) for x in ("3030473779",))  # Online Exclusives
 # Extra hints used if category ids are missing (common on some tenants)
 _ONLINE_EXCLUSIVE_ROUTE_HINTS = (
     "online-exclusive",
@@ -729,6 +1360,30 @@ _ONLINE_EXCLUSIVE_ROUTE_HINTS = (
     "web_exclusive",
 )
 
+
+def _build_oe_route_automaton():
+    if not _AHOCORASICK_AVAILABLE:
+        return None
+    auto = ahocorasick.Automaton()
+    for hint in _ONLINE_EXCLUSIVE_ROUTE_HINTS:
+        auto.add_word(hint, hint)
+    auto.make_automaton()
+    return auto
+
+
+# One pass over the route string instead of one `in` scan per hint, so the
+# cost stays O(len(text)) even if tenants grow the hint list: pyahocorasick
+# builds a proper trie with failure links, and the fallback regex alternation
+# is a single C-level scan as well. Both are built once at import.
+_OE_ROUTE_AC = _build_oe_route_automaton()
+_OE_ROUTE_RE = re.compile("|".join(map(re.escape, _ONLINE_EXCLUSIVE_ROUTE_HINTS)))
+
+
+def _route_has_oe_hint(route_bits: str) -> bool:
+    if _OE_ROUTE_AC is not None:
+        return next(_OE_ROUTE_AC.iter(route_bits), None) is not None
+    return _OE_ROUTE_RE.search(route_bits) is not None
+
 def _extract_category_ids_from_item(item: dict) -> set[str]:
     """
     Normalize category ids from various OCC/assembler shapes into a set of strings.
@@ -742,25 +1397,15 @@ def _extract_category_ids_from_item(item: dict) -> set[str]:
     """
     ids: set[str] = set()
 
-    def _add(v):
-        if v is None:
-            return
-        if isinstance(v, (list, tuple, set)):
-            for x in v:
-                _add(x)
-            return
-        s = str(v).strip()
-        if s:
-            ids.add(s)
-
-    # direct
-    _add(item.get("categoryId"))
-    _add(item.get("categoryIds"))  # allow callers to stuff a list here
+    # Gather candidate values first, then flatten with an explicit stack —
+    # no per-item closure allocation or recursion (feeds are rarely more
+    # than one level deep anyway).
+    pending = [item.get("categoryId"), item.get("categoryIds")]
 
     # nested .category.repositoryId
-    cat = item.get("category") or {}
+    cat = item.get("category")
     if isinstance(cat, dict):
-        _add(cat.get("repositoryId"))
+        pending.append(cat.get("repositoryId"))
 
     # parentCategories / ancestorCategories arrays of dicts
     for key in ("parentCategories", "ancestorCategories"):
@@ -768,7 +1413,22 @@ def _extract_category_ids_from_item(item: dict) -> set[str]:
         if isinstance(arr, list):
             for c in arr:
                 if isinstance(c, dict):
-                    _add(c.get("repositoryId"))
+                    pending.append(c.get("repositoryId"))
+
+    while pending:
+        v = pending.pop()
+        if v is None:
+            continue
+        # Exact-type checks, like _iter_dicts: feed values are plain
+        # json types, and `type(x) is` skips the MRO walk isinstance pays.
+        t = type(v)
+        if t is list or t is tuple or t is set:
+            pending.extend(v)
+            continue
+        s = str(v).strip()
+        if s:
+            # Intern: the same category ids repeat across thousands of items.
+            ids.add(sys.intern(s))
 
     return ids
 def _extract_parent_categories(attrs: dict) -> list[dict]:
@@ -778,22 +1438,23 @@ def _extract_parent_categories(attrs: dict) -> list[dict]:
     """
     out: list[dict] = []
 
-    def _add_repo_id(x):
+    # Common shapes we’ve seen; flattened iteratively like
+    # _extract_category_ids_from_item.
+    pending = [
+        attrs.get(key)
+        for key in ("parentCategory", "categories", "ancestorCategories", "parentCategories")
+    ]
+    while pending:
+        x = pending.pop()
         if not x:
-            return
-        if isinstance(x, dict):
+            continue
+        t = type(x)
+        if t is dict:
             rid = x.get("repositoryId") or x.get("id")
             if rid:
-                out.append({"repositoryId": str(rid)})
-        elif isinstance(x, (list, tuple)):
-            for y in x:
-                _add_repo_id(y)
-
-    # Common shapes we’ve seen:
-    for key in ("parentCategories", "ancestorCategories", "categories", "parentCategory"):
-        val = attrs.get(key)
-        if val is not None:
-            _add_repo_id(val)
+                out.append({"repositoryId": sys.intern(str(rid))})
+        elif t is list or t is tuple:
+            pending.extend(reversed(x))
 
     # Some feeds provide just a single categoryId
     cat_id = attrs.get("categoryId")
@@ -823,10 +1484,9 @@ def build_products(items: Iterable[dict], stock: Dict[str, int], base_url: str)
         # If caller already marked it, honor that.
         if "is_online_exclusive" in item:
             is_oe = 1 if item.get("is_online_exclusive") else 0
+        elif not _extract_category_ids_from_item(item).isdisjoint(ONLINE_EXCLUSIVE_CATEGORY_IDS):
+            is_oe = 1
         else:
-            cat_ids = _extract_category_ids_from_item(item)
-            by_cat = any(cid in ONLINE_EXCLUSIVE_CATEGORY_IDS for cid in cat_ids)
-
             # Fallback: infer from route (and, very conservatively, name)
             route_bits = " ".join(str(x or "") for x in (
                 item.get("route"),
@@ -834,10 +1494,10 @@ def build_products(items: Iterable[dict], stock: Dict[str, int], base_url: str)
                 item.get("seoUrlSlugDerived"),
                 item.get("relativeURL"),
             )).lower()
-            by_route = any(h in route_bits for h in _ONLINE_EXCLUSIVE_ROUTE_HINTS)
+            by_route = _route_has_oe_hint(route_bits)
             name_hit = "online exclusive" in str(item.get("displayName") or "").lower()
 
-            is_oe = 1 if (by_cat or by_route or name_hit) else 0
+            is_oe = 1 if (by_route or name_hit) else 0
 
         products.append(
             Product(
@@ -869,25 +1529,59 @@ def fetch_stock_quantities(
     quantities: Dict[str, int] = {}
     url = _build_stock_status_endpoint(base_url)
 
-    try:
-        for i in range(0, len(product_ids), chunk_size):
-            chunk = product_ids[i : i + chunk_size]
-            params = {
+    if _ZERO_STOCK is not None:
+        skipped = [pid for pid in product_ids if _ZERO_STOCK.skip(pid)]
+        if skipped:
+            logger.debug("Stock: skipping %d recently-zero SKUs", len(skipped))
+            product_ids = [pid for pid in product_ids if not _ZERO_STOCK.skip(pid)]
+
+    # Build every chunk's params up front so the requests can overlap instead
+    # of paying one RTT per chunk in sequence.
+    param_sets: List[dict] = []
+    for i in range(0, len(product_ids), chunk_size):
+        chunk = product_ids[i : i + chunk_size]
+        param_sets.append(
+            {
                 "products": ",".join(chunk),
                 "expandStockDetails": "true",
                 "actualStockStatus": "true",
                 "locationIds": "null",
             }
-            logger.debug("Fetching stock for %s items", len(chunk))
-            resp = _get(session, url, params=params)
-            data = resp.json()
+        )
+
+    def _fetch_chunk(params: dict) -> dict:
+        logger.debug("Fetching stock for %s items", params["products"].count(",") + 1)
+        resp = _get(session, url, params=params)
+        return _json_loads(resp.content)
+
+    try:
+        if len(param_sets) <= 1:
+            payloads = [_fetch_chunk(p) for p in param_sets]
+        else:
+            with ThreadPoolExecutor(
+                max_workers=min(8, len(param_sets)), thread_name_prefix="stock"
+            ) as pool:
+                payloads = list(pool.map(_fetch_chunk, param_sets))
+        for data in payloads:
             for itm in data.get("items", []):
                 inv = itm.get("productSkuInventoryStatus") or {}
-                for pid, qty in inv.items():
-                    try:
-                        quantities[pid] = int(qty)
-                    except (ValueError, TypeError):
-                        quantities[pid] = 0
+                # One comprehension per chunk; the isdigit gate keeps string
+                # quantities off the ValueError path some tenants trigger.
+                quantities.update(
+                    {
+                        pid: qty
+                        if isinstance(qty, int)
+                        else int(qty)
+                        if isinstance(qty, float)
+                        or (isinstance(qty, str) and qty.lstrip("-").isdigit())
+                        else 0
+                        for pid, qty in inv.items()
+                    }
+                )
+        if _ZERO_STOCK is not None:
+            for pid, qty in quantities.items():
+                if qty <= 0:
+                    _ZERO_STOCK.add(pid)
     finally:
         if close_session:
             session.close()
@@ -916,44 +1610,85 @@ _HTML_IMAGE_SELECTORS = [
     "div.card__image img",
 ]
 
+# Comma unions let one tree walk match every alternative; results come back
+# in document order, and since a page carries only one theme's markup the
+# first parseable hit is the same one the per-selector loop found.
+_HTML_PRICE_SELECTOR_UNION = ", ".join(_HTML_PRICE_SELECTORS)
+_HTML_IMAGE_SELECTOR_UNION = ", ".join(_HTML_IMAGE_SELECTORS)
+
+# Compiled once at import; these run per product page during enrichment and
+# the re-module cache lookup adds up across a sweep.
+_RE_PRICE_STRIP = re.compile(r"[^0-9\.,]")
+_RE_DOLLAR = re.compile(r"\$\s*([0-9]+\.[0-9]{2})")
+_RE_QTY = re.compile(r"\b(\d+)\b")
+_RE_PRODUCT_HREF = re.compile(r"/product/(\d{6,})")
+
 def _parse_price_number(text: str) -> float | None:
     if not text:
         return None
     t = str(text).strip()
-    if re.fullmatch(r"\d+(\.\d+)?", t):
-        try:
-            return float(t)
-        except ValueError:
-            pass
-    t = re.sub(r"[^0-9\.,]", "", t).replace(",", "")
+    if not t:
+        return None
+    # Fast path: assembler prices arrive as plain "12.99" strings that
+    # float() takes directly; only messy text pays for the regex strip.
+    try:
+        return float(t)
+    except ValueError:
+        pass
+    t = _RE_PRICE_STRIP.sub("", t).replace(",", "")
     try:
         return float(t)
     except ValueError:
         return None
 
 
+_JSONLD_SEL = 'script[type="application/ld+json"]'
+
+
+def _price_of(off: dict) -> float | None:
+    """Price of a single JSON-LD offer dict, checking priceSpecification too."""
+    price = off.get("price")
+    if not price:
+        spec = off.get("priceSpecification")
+        price = spec.get("price") if isinstance(spec, dict) else None
+    return _parse_price_number(str(price)) if price is not None else None
+
+
+def _price_from_jsonld_data(data) -> float | None:
+    """Pull the first usable offer price out of a decoded JSON-LD payload."""
+    blocks = data if isinstance(data, list) else [data]
+    for b in blocks:
+        if not isinstance(b, dict):
+            continue
+        offers = b.get("offers")
+        if not offers:
+            continue
+        if isinstance(offers, dict):
+            offers = [offers]
+        if isinstance(offers, list):
+            for off in offers:
+                if not isinstance(off, dict):
+                    continue
+                val = _price_of(off)
+                if val:
+                    return val
+    return None
+
+
 def _extract_price_from_jsonld(soup: BeautifulSoup) -> float | None:
-    for tag in soup.select('script[type="application/ld+json"]'):
+    for tag in soup.select(_JSONLD_SEL):
+        raw = tag.string or ""
+        # Pages carry several JSON-LD blocks (breadcrumbs, org info); only
+        # ones mentioning offers can hold a price, so skip the rest unparsed.
+        if '"offers"' not in raw:
+            continue
         try:
-            data = json.loads(tag.string or "")
+            data = _json_loads(raw)
         except Exception:
             continue
-        blocks = data if isinstance(data, list) else [data]
-        for b in blocks:
-            offers = b.get("offers")
-            if not offers:
-                continue
-            if isinstance(offers, list):
-                for off in offers:
-                    price = off.get("price") or off.get("priceSpecification", {}).get("price")
-                    val = _parse_price_number(str(price)) if price is not None else None
-                    if val:
-                        return val
-            elif isinstance(offers, dict):
-                price = offers.get("price") or offers.get("priceSpecification", {}).get("price")
-                val = _parse_price_number(str(price)) if price is not None else None
-                if val:
-                    return val
+        val = _price_from_jsonld_data(data)
+        if val:
+            return val
     return None
 
 
@@ -961,10 +1696,7 @@ def _extract_price_from_html(soup: BeautifulSoup) -> float | None:
     val = _extract_price_from_jsonld(soup)
     if val:
         return val
-    for sel in _HTML_PRICE_SELECTORS:
-        el = soup.select_one(sel)
-        if not el:
-            continue
+    for el in soup.select(_HTML_PRICE_SELECTOR_UNION):
         if el.name and el.name.lower() == "meta":
             content = el.get("content")
             val = _parse_price_number(content or "")
@@ -974,7 +1706,7 @@ def _extract_price_from_html(soup: BeautifulSoup) -> float | None:
         val = _parse_price_number(txt)
         if val:
             return val
-    m = re.search(r"\$\s*([0-9]+\.[0-9]{2})", soup.get_text(" ", strip=True))
+    m = _RE_DOLLAR.search(soup.get_text(" ", strip=True))
     if m:
         try:
             return float(m.group(1))
@@ -988,7 +1720,7 @@ def _extract_qty_from_html(soup: BeautifulSoup) -> int | None:
     if not el:
         return None
     txt = el.get_text(" ", strip=True)
-    m = re.search(r"\b(\d+)\b", txt)
+    m = _RE_QTY.search(txt)
     if not m:
         return None
     try:
@@ -998,10 +1730,7 @@ def _extract_qty_from_html(soup: BeautifulSoup) -> int | None:
 
 
 def _extract_image_url_from_html(soup: BeautifulSoup, base_url: str) -> str | None:
-    for sel in _HTML_IMAGE_SELECTORS:
-        el = soup.select_one(sel)
-        if not el:
-            continue
+    for el in soup.select(_HTML_IMAGE_SELECTOR_UNION):
         # meta/link provide content/href; img provides src
         src = el.get("content") or el.get("href") or el.get("src")
         if not src:
@@ -1009,6 +1738,63 @@ def _extract_image_url_from_html(soup: BeautifulSoup, base_url: str) -> str | No
         return _normalize_image_url(src, base_url)
     return None
 
+
+# --- selectolax twins of the product-page extractors. Same logic against
+# the C parser; enrich parses each page once and routes to whichever
+# family matches the tree it built.
+
+def _extract_price_from_html_slx(tree) -> float | None:
+    for node in tree.css(_JSONLD_SEL):
+        raw = node.text() or ""
+        if '"offers"' not in raw:
+            continue
+        try:
+            data = _json_loads(raw)
+        except Exception:
+            continue
+        val = _price_from_jsonld_data(data)
+        if val:
+            return val
+    for el in tree.css(_HTML_PRICE_SELECTOR_UNION):
+        if el.tag == "meta":
+            val = _parse_price_number(el.attributes.get("content") or "")
+            if val:
+                return val
+        val = _parse_price_number(el.text(separator=" ", strip=True))
+        if val:
+            return val
+    body = tree.body
+    m = _RE_DOLLAR.search(body.text(separator=" ", strip=True) if body else "")
+    if m:
+        try:
+            return float(m.group(1))
+        except ValueError:
+            pass
+    return None
+
+
+def _extract_qty_from_html_slx(tree) -> int | None:
+    el = tree.css_first("div.availability-info")
+    if el is None:
+        return None
+    m = _RE_QTY.search(el.text(separator=" ", strip=True))
+    if not m:
+        return None
+    try:
+        return int(m.group(1))
+    except ValueError:
+        return None
+
+
+def _extract_image_url_from_html_slx(tree, base_url: str) -> str | None:
+    for el in tree.css(_HTML_IMAGE_SELECTOR_UNION):
+        attrs = el.attributes
+        src = attrs.get("content") or attrs.get("href") or attrs.get("src")
+        if not src:
+            continue
+        return _normalize_image_url(src, base_url)
+    return None
+
 _BROWSER_UAS = [
     # A couple of realistic desktop Chrome UAs. Rotate to avoid simple blocks.
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0 Safari/537.36",
@@ -1052,19 +1838,48 @@ def _warm_up_site(session: requests.Session, base_url: str) -> None:
 
 # --- replace your _fetch_html with this version ---
 
+# Per-host politeness gap for release-page fetches. Hammering the host in
+# quick succession (variant prefetch + browser gotos) risks edge throttling,
+# and a temporarily banned host turns every later call into a slow timeout.
+_POLITE_DELAY = max(0.0, POLITE_DELAY_MS / 1000.0)
+_HOST_LAST: Dict[str, float] = {}
+_HOST_LOCK = threading.Lock()
+
+
+def _polite(host: str, min_delay: float = _POLITE_DELAY) -> None:
+    """Sleep just enough to keep min_delay between requests to one host."""
+    if min_delay <= 0 or not host:
+        return
+    while True:
+        now = time.monotonic()
+        with _HOST_LOCK:
+            wait = _HOST_LAST.get(host, 0.0) + min_delay - now
+            if wait <= 0:
+                _HOST_LAST[host] = now
+                return
+        time.sleep(wait)
+
+
 def _fetch_html(session: requests.Session, url: str) -> str | None:
     """
     Fetch HTML with browser-like headers and a homepage warm-up to dodge 403s.
     Uses direct session.get here (not the retry-decorated _get) to avoid
     5x retries on known 403s; we do a short local fallback sequence instead.
     """
+    cached = _HTML_CACHE.get(url)
+    if cached is not None:
+        return cached
+
     base = BASE_URL
-    # 1) Warm up cookies (once per call; cheap)
-    _warm_up_site(session, base)
+    _polite(urlparse(url).netloc)
+    # 1) Warm up cookies only when this session's jar is still empty; the
+    # jar persists across calls, so later fetches skip the round trip.
+    if not session.cookies:
+        _warm_up_site(session, base)
 
-    # Small cache-buster query to avoid overzealous edge caches
-    cache_bust = f"{'&' if '?' in url else '?'}_={int(time.time()) % 100000}"
-    url1 = url + cache_bust
+    # First try the bare URL so edge caches can answer; a cache-buster is
+    # added only on the 403 retry below.
+    url1 = url
 
     try_variants = [
         _browser_headers(base, alt=False),
@@ -1075,6 +1890,7 @@ def _fetch_html(session: requests.Session, url: str) -> str | None:
         try:
             resp = session.get(url1, headers=hdrs, timeout=14, allow_redirects=True)
             if resp.status_code == 200 and resp.text:
+                _HTML_CACHE.set(url, resp.text)
                 return resp.text
             if resp.status_code in (301, 302, 303, 307, 308) and resp.text:
                 return resp.text
@@ -1101,25 +1917,25 @@ def _fetch_html_browser(url: str, base_url: str = BASE_URL) -> str | None:
         return None
 
     try:
-        from playwright.sync_api import sync_playwright, TimeoutError as PWTimeoutError  # local import to avoid import errors at module load
-        with sync_playwright() as p:
-            logger.info("Release: using Playwright browser fallback for %s", url)
-            browser = p.chromium.launch(headless=True)
-            ctx = browser.new_context(
-                user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0 Safari/537.36",
-                locale="en-US",
-            )
-            page = ctx.new_page()
-            try:
-                page.goto(base_url.rstrip("/") + "/", wait_until="domcontentloaded", timeout=15000)
-            except Exception:
-                pass
+        logger.info("Release: using Playwright browser fallback for %s", url)
+        page = _get_browser_context().new_page()
+        try:
+            host = urlparse(base_url).netloc
+            # Warm up once per context: cookies persist in the shared
+            # context, so later calls can go straight to the product URL.
+            if host not in _pw_warmed:
+                try:
+                    _polite(host)
+                    page.goto(base_url.rstrip("/") + "/", wait_until="domcontentloaded", timeout=15000)
+                    _pw_warmed.add(host)
+                except Exception:
+                    pass
 
+            _polite(host)
             page.goto(url, wait_until="networkidle", timeout=RELEASE_BROWSER_TIMEOUT_MS)
-            html = page.content()
-            ctx.close()
-            browser.close()
-            return html
+            return page.content()
+        finally:
+            page.close()
     except PWTimeoutError:
         logger.info("Release: Playwright timeout loading %s", url)
         return None
@@ -1133,60 +1949,235 @@ def enrich_products_for_notifications(
     *,
     delay_seconds: float = 0.6,
     base_url: str = BASE_URL,
+    session: Optional[requests.Session] = None,
 ) -> None:
     """
     For each product, fetch its product page and try to fill:
       - price (only if <= 0)
       - quantity (only if <= 0; API remains source of truth if > 0)
       - image_url (only if empty)
+
+    Page fetches fan out over a small thread pool; delay_seconds paces
+    request *starts*, so the per-host request rate matches the old
+    sequential loop while the latencies overlap.
     """
     if not products:
         return
 
-    session = get_http_session()
-    try:
-        for p in products:
-            need_price = (p.price is None) or (float(p.price) <= 0.0)
-            need_qty = (p.quantity is None) or (int(p.quantity) <= 0)
-            need_img = not bool(p.image_url)
+    targets = [
+        p for p in products
+        if (p.price is None) or (float(p.price) <= 0.0)
+        or (p.quantity is None) or (int(p.quantity) <= 0)
+        or not bool(p.image_url)
+    ]
+    if not targets:
+        return
 
-            if not (need_price or need_qty or need_img):
-                continue
+    close_session = False
+    if session is None:
+        session = get_http_session()
+        close_session = True
+
+    # Shared pacer: each fetch claims the next start slot under the lock.
+    pace_lock = threading.Lock()
+    next_start = [time.monotonic()]
+
+    def _paced_fetch(p: Product) -> tuple[Product, Optional[str]]:
+        if delay_seconds and delay_seconds > 0:
+            with pace_lock:
+                slot = next_start[0]
+                next_start[0] = max(slot, time.monotonic()) + delay_seconds
+            wait = slot - time.monotonic()
+            if wait > 0:
+                time.sleep(wait)
+        return p, _fetch_html(session, p.page_url)
 
-            html = _fetch_html(session, p.page_url)
+    try:
+        if len(targets) > 1:
+            with ThreadPoolExecutor(
+                max_workers=min(ENRICHMENT_WORKERS, len(targets)), thread_name_prefix="enrich"
+            ) as ex:
+                fetched = list(ex.map(_paced_fetch, targets))
+        else:
+            fetched = [_paced_fetch(targets[0])]
+
+        # Parsing stays on the calling thread; it is CPU-cheap next to IO.
+        # Each page is parsed exactly once (selectolax when available,
+        # html.parser otherwise) and the tree shared by all extractors.
+        for p, html in fetched:
             if not html:
                 continue
 
-            soup = BeautifulSoup(html, "html.parser")
+            tree = None
+            if _SELECTOLAX_AVAILABLE:
+                try:
+                    tree = _SelectolaxParser(html)
+                except Exception:
+                    logger.debug("selectolax parse failed; using bs4", exc_info=True)
+            soup = None if tree is not None else BeautifulSoup(html, "html.parser")
 
-            if need_price:
-                price = _extract_price_from_html(soup)
+            if (p.price is None) or (float(p.price) <= 0.0):
+                price = (
+                    _extract_price_from_html_slx(tree)
+                    if tree is not None else _extract_price_from_html(soup)
+                )
                 if price is not None and price > 0:
                     p.price = price
 
-            if need_qty:
-                qty = _extract_qty_from_html(soup)
+            if (p.quantity is None) or (int(p.quantity) <= 0):
+                qty = (
+                    _extract_qty_from_html_slx(tree)
+                    if tree is not None else _extract_qty_from_html(soup)
+                )
                 if qty is not None and qty >= 0:
                     p.quantity = qty
 
-            if need_img:
-                img = _extract_image_url_from_html(soup, base_url=base_url)
+            if not p.image_url:
+                img = (
+                    _extract_image_url_from_html_slx(tree, base_url)
+                    if tree is not None else _extract_image_url_from_html(soup, base_url=base_url)
+                )
                 if img:
                     p.image_url = img
-
-            if delay_seconds and delay_seconds > 0:
-                time.sleep(delay_seconds)
     finally:
-        session.close()
+        if close_session:
+            session.close()
+
+# Sentinel: "use the configured ASSEMBLER_NS". Callers pass assembler_ns=None
+# to explicitly disable the Ns sort param (full-catalog sweeps).
+_NS_DEFAULT: object = object()
+
+# Attribute fallbacks per field, in preference order. Records arrive either
+# flat or nested under product./sku. prefixes depending on tenant.
+_REC_ID_KEYS = ("repositoryId", "product.repositoryId", "sku.repositoryId")
+_REC_NAME_KEYS = ("displayName", "product.displayName", "sku.displayName")
+_REC_LIST_KEYS = ("listPrice", "sku.listPrice")
+_REC_SALE_KEYS = ("salePrice", "sku.salePrice")
+_REC_IMG_KEYS = (
+    "primaryMediumImageURL",
+    "sku.primaryMediumImageURL",
+    "primaryLargeImageURL",
+    "sku.primaryLargeImageURL",
+    "sku.primaryFullImageURL",
+)
+_REC_ROUTE_KEYS = ("route", "product.route", "sku.route", "seoUrl", "seoUrlSlugDerived")
+
+# Field order for per-page key resolution: the response schema is stable
+# across records of one page, so the winning key per field is resolved on
+# the first kept record and reused as a direct lookup for the rest. The
+# keys are interned here because the compiler only auto-interns
+# identifier-like literals — the dotted ones ("product.repositoryId")
+# would otherwise miss the pointer-equality fast path when probing dicts
+# whose keys the JSON parser interned.
+_REC_FIELD_PLANS = tuple(
+    tuple(map(sys.intern, keys))
+    for keys in (
+        _REC_ID_KEYS,
+        _REC_NAME_KEYS,
+        _REC_LIST_KEYS,
+        _REC_SALE_KEYS,
+        _REC_IMG_KEYS,
+        _REC_ROUTE_KEYS,
+    )
+)
+(
+    _REC_ID_KEYS,
+    _REC_NAME_KEYS,
+    _REC_LIST_KEYS,
+    _REC_SALE_KEYS,
+    _REC_IMG_KEYS,
+    _REC_ROUTE_KEYS,
+) = _REC_FIELD_PLANS
+
+
+def _resolved_get(attrs: dict, key: Optional[str], keys: tuple):
+    """Direct lookup via a page-resolved key, falling back to the probe.
+
+    The fallback covers sparse records (resolved key absent or None) and
+    pages whose first record happened to lack the field entirely.
+    """
+    if key is not None:
+        val = attrs.get(key)
+        if val is not None:
+            if type(val) is list:
+                return val[0] if val else None
+            return val
+    return _first_present(attrs, keys)
+
+
+def _as_float(v):
+    """Price coercion that skips float() when the parser already made one.
+
+    orjson and the stdlib both hand back floats for unquoted JSON numbers,
+    so `type(v) is float` short-circuits the common case; quoted prices
+    still fall through to the constructor.
+    """
+    return v if v is None or type(v) is float else float(v)
+
+
+def _unlist(x):
+    """Unwrap OCC's single-element list scalars.
+
+    `type(x) is list` is an exact pointer compare; JSON never hands back
+    list subclasses, so the isinstance MRO walk is dead weight per record.
+    """
+    return x[0] if type(x) is list and x else x
+
+
+def _first_attr(g, names):
+    for name in names:
+        val = g(name)
+        if val is not None:
+            return val
+    return None
+
+
+def _record_to_item(rec: dict, is_oe: Optional[bool] = None) -> Optional[dict]:
+    """Normalize one assembler record into our item dict; None when it has no id."""
+    attrs = rec.get("attributes", rec)
+    g = attrs.get  # bound once; this runs per record across thousands
+
+    raw_id = _unlist(_first_attr(g, _REC_ID_KEYS))
+    if raw_id is None:
+        return None
+
+    # str() is an identity no-op for exact str inputs, so it stays as a
+    # guard against the occasional numeric name without costing a copy.
+    raw_name = _unlist(_first_attr(g, _REC_NAME_KEYS)) or ""
+
+    raw_list = _first_attr(g, _REC_LIST_KEYS)
+    raw_sale = _first_attr(g, _REC_SALE_KEYS)
+
+    image_rel = _unlist(_first_attr(g, _REC_IMG_KEYS))
+    route = _unlist(_first_attr(g, _REC_ROUTE_KEYS))
+
+    parent_cats = _extract_parent_categories(attrs)
+    item = {
+        "repositoryId": sys.intern(str(raw_id)),
+        "displayName": str(raw_name),
+        "listPrice": _as_float(raw_list),
+        "salePrice": _as_float(raw_sale),
+        "primaryMediumImageURL": image_rel or None,
+        "route": route or None,
+        # give build_products multiple options to detect OE
+        "parentCategories": parent_cats,
+        "categoryIds": [c["repositoryId"] for c in parent_cats] if parent_cats else None,
+    }
+    if is_oe is not None:
+        item["is_online_exclusive"] = is_oe
+    return item
+
 
 def fetch_all_product_items(
     category_id: str = CATEGORY_ID,
     base_url: str = BASE_URL,
     session: Optional[requests.Session] = None,
     force_legacy: bool = False,
+    assembler_ns: object = _NS_DEFAULT,
 ) -> List[dict]:
     """Preferred: OSF assembler paging; Fallback: v1/products paging."""
     is_oe_context = category_id in ONLINE_EXCLUSIVE_CATEGORY_IDS
+    use_ns = ASSEMBLER_NS if assembler_ns is _NS_DEFAULT else assembler_ns
     close_session = False
     if session is None:
         session = get_http_session()
@@ -1195,87 +2186,90 @@ def fetch_all_product_items(
     try:
         # ---- Preferred: assembler paging ----
         if not force_legacy:
-            assembler_url = (
-                f"{base_url.rstrip('/')}/ccstore/v1/assembler/pages/Default/osf/catalog"
-            )
+            assembler_url = _assembler_endpoint(base_url)
+            nrpp_str = str(ASSEMBLER_NRPP)
             all_records: List[dict] = []
-            offset = 0
-            while True:
-                params = {"N": category_id, "Nrpp": str(ASSEMBLER_NRPP), "No": str(offset)}
-                if ASSEMBLER_NS:
-                    params["Ns"] = ASSEMBLER_NS
-                logger.debug("Assembler page fetch: %s %s", assembler_url, params)
+            # Where the records array lives ("results.records.item" or
+            # "records.item"); the buffered first page fills this in so later
+            # pages can be stream-parsed.
+            rec_prefix: list = [None]
+            # One level check per call instead of logging's per-page walk
+            # through the disabled-record machinery.
+            debug = logger.isEnabledFor(logging.DEBUG)
+
+            def _assembler_page(offset: int):
+                params = {"N": category_id, "Nrpp": nrpp_str, "No": str(offset)}
+                if use_ns:
+                    params["Ns"] = use_ns
+                if debug:
+                    logger.debug("Assembler page fetch: %s %s", assembler_url, params)
+
+                # Later pages only need the records array: stream-parse them
+                # so decoding overlaps reception and the surrounding payload
+                # dict is never materialized. The total came from page 0.
+                if offset and rec_prefix[0] and _IJSON_AVAILABLE:
+                    resp = _get(session, assembler_url, params=params, stream=True)
+                    try:
+                        resp.raw.decode_content = True
+                        return list(ijson.items(resp.raw, rec_prefix[0])), None
+                    except Exception:
+                        logger.debug("Assembler stream parse failed; refetching buffered", exc_info=True)
+                    finally:
+                        resp.close()
+
                 resp = _get(session, assembler_url, params=params)
-                data = resp.json()
+                data = _json_loads(resp.content)
                 results = data.get("results") or {}
-                recs = (results.get("records") if isinstance(results, dict) else None) or data.get("records", [])
-                if not isinstance(recs, list) or len(recs) == 0:
-                    break
-                all_records.extend(recs)
-                offset += len(recs)
+                from_results = results.get("records") if isinstance(results, dict) else None
+                recs = from_results or data.get("records", [])
+                if not isinstance(recs, list):
+                    recs = []
+                if offset == 0 and recs:
+                    rec_prefix[0] = "results.records.item" if from_results else "records.item"
+                total = results.get("totalNumRecs") if isinstance(results, dict) else None
+                if total is None:
+                    total = data.get("totalResults")
+                return recs, total
+
+            # Probe the first page for the record total, then fetch the
+            # remaining offsets in parallel instead of one RTT per page.
+            first, total = _assembler_page(0)
+            all_records.extend(first)
+            try:
+                total = int(total)
+            except (TypeError, ValueError):
+                total = None
+            if first and total is not None and total > len(first):
+                offsets = range(len(first), total, len(first))
+                with ThreadPoolExecutor(
+                    max_workers=min(8, len(offsets)), thread_name_prefix="assembler"
+                ) as pool:
+                    for recs, _ in pool.map(_assembler_page, offsets):
+                        all_records.extend(recs)
+            elif first and total is None:
+                # Total not reported: fall back to walking pages serially
+                # until one comes back empty.
+                offset = len(first)
+                while True:
+                    recs, _ = _assembler_page(offset)
+                    if not recs:
+                        break
+                    all_records.extend(recs)
+                    offset += len(recs)
 
             if all_records:
-                items = []
-                for rec in all_records:
-                    attrs = rec.get("attributes", rec)
-
-                    def extract(names: Sequence[str]):
-                        for name in names:
-                            val = attrs.get(name)
-                            if val is not None:
-                                return val
-                        return None
-
-                    raw_id = extract(["repositoryId", "product.repositoryId", "sku.repositoryId"])
-                    if raw_id is None:
-                        continue
-                    if isinstance(raw_id, list):
-                        raw_id = raw_id[0]
-                    repository_id = str(raw_id)
-
-                    raw_name = extract(["displayName", "product.displayName", "sku.displayName"]) or ""
-                    if isinstance(raw_name, list):
-                        raw_name = raw_name[0]
-                    display_name = str(raw_name)
-
-                    raw_list = extract(["listPrice", "sku.listPrice"])
-                    raw_sale = extract(["salePrice", "sku.salePrice"])
-                    list_price = float(raw_list) if raw_list is not None else None
-                    sale_price = float(raw_sale) if raw_sale is not None else None
-
-                    raw_img = extract([
-                        "primaryMediumImageURL",
-                        "sku.primaryMediumImageURL",
-                        "primaryLargeImageURL",
-                        "sku.primaryLargeImageURL",
-                        "sku.primaryFullImageURL",
-                    ])
-                    image_rel = raw_img[0] if isinstance(raw_img, list) else raw_img
-
-                    raw_route = extract(["route", "product.route", "sku.route", "seoUrl", "seoUrlSlugDerived"])
-                    route = raw_route[0] if isinstance(raw_route, list) else raw_route
-
-                    parent_cats = _extract_parent_categories(attrs)
-                    items.append({
-                "repositoryId": repository_id,
-                "displayName": display_name,
-                "listPrice": list_price,
-                "salePrice": sale_price,
-                "primaryMediumImageURL": image_rel or None,
-                "route": route or None,
-                "parentCategories": parent_cats,
-                "categoryIds": [c["repositoryId"] for c in parent_cats] if parent_cats else None,
-                "is_online_exclusive": is_oe_context,  # <<<< HERE
-            })
-
-                return items
+                return [
+                    it
+                    for rec in all_records
+                    if (it := _record_to_item(rec, is_oe_context)) is not None
+                ]
 
         # ---- Fallback: legacy v1/products paging ----
         products_url = f"{base_url.rstrip('/')}/ccstore/v1/products"
-        offset = 0
         limit = 100
         all_items: List[dict] = []
-        while True:
+
+        def _legacy_page(offset: int) -> dict:
             params2 = {
                 "categoryId": LEGACY_CATEGORY_ID,
                 "limit": limit,
@@ -1283,15 +2277,22 @@ def fetch_all_product_items(
             }
             logger.debug("Products fetch (legacy): offset=%s limit=%s", offset, limit)
             resp = _get(session, products_url, params=params2)
-            data = resp.json()
-            page_items = data.get("items", [])
-            if not isinstance(page_items, list) or not page_items:
-                break
+            return _json_loads(resp.content)
+
+        data = _legacy_page(0)
+        page_items = data.get("items", [])
+        if isinstance(page_items, list) and page_items:
             all_items.extend(page_items)
             total = int(data.get("totalResults", len(page_items)))
-            offset += len(page_items)
-            if offset >= total:
-                break
+            if total > len(page_items):
+                offsets = range(len(page_items), total, len(page_items))
+                with ThreadPoolExecutor(
+                    max_workers=min(8, len(offsets)), thread_name_prefix="products"
+                ) as pool:
+                    for page in pool.map(_legacy_page, offsets):
+                        items2 = page.get("items", [])
+                        if isinstance(items2, list):
+                            all_items.extend(items2)
         for it in all_items:
             it["is_online_exclusive"] = is_oe_context
         return all_items
@@ -1304,82 +2305,34 @@ def fetch_front_page_items(
     category_id: str = CATEGORY_ID,
     base_url: str = BASE_URL,
     nrpp: int = 120,
-    ns_override: Optional[str] = None,
+    ns_override: object = _NS_DEFAULT,
     session: Optional[requests.Session] = None,
 ) -> List[dict]:
-    """Fetch the first assembler page (quick scan)."""
+    """Fetch the first assembler page (quick scan).
+
+    ns_override follows the same convention as fetch_all_product_items:
+    leave it at the sentinel for the configured ASSEMBLER_NS, pass a string
+    for a specific sort, or None to omit Ns entirely.
+    """
     close_session = False
     if session is None:
         session = get_http_session()
         close_session = True
 
     try:
-        assembler_url = f"{base_url.rstrip('/')}/ccstore/v1/assembler/pages/Default/osf/catalog"
+        assembler_url = _assembler_endpoint(base_url)
         params = {"N": category_id, "Nrpp": str(nrpp), "No": "0"}
-        use_ns = ns_override if ns_override is not None else ASSEMBLER_NS
+        use_ns = ASSEMBLER_NS if ns_override is _NS_DEFAULT else ns_override
         if use_ns:
             params["Ns"] = use_ns
 
         resp = _get(session, assembler_url, params=params)
-        data = resp.json()
+        data = _json_loads(resp.content)
 
         results = data.get("results") or {}
         recs = (results.get("records") if isinstance(results, dict) else None) or data.get("records", [])
 
-        items: List[dict] = []
-        for rec in recs:
-            attrs = rec.get("attributes", rec)
-
-            def extract(names: Sequence[str]):
-                for name in names:
-                    val = attrs.get(name)
-                    if val is not None:
-                        return val
-                return None
-
-            raw_id = extract(["repositoryId", "product.repositoryId", "sku.repositoryId"])
-            if raw_id is None:
-                continue
-            if isinstance(raw_id, list):
-                raw_id = raw_id[0]
-            repository_id = str(raw_id)
-
-            raw_name = extract(["displayName", "product.displayName", "sku.displayName"]) or ""
-            if isinstance(raw_name, list):
-                raw_name = raw_name[0]
-            display_name = str(raw_name)
-
-            raw_list = extract(["listPrice", "sku.listPrice"])
-            raw_sale = extract(["salePrice", "sku.salePrice"])
-            list_price = float(raw_list) if raw_list is not None else None
-            sale_price = float(raw_sale) if raw_sale is not None else None
-
-            raw_img = extract([
-                "primaryMediumImageURL",
-                "sku.primaryMediumImageURL",
-                "primaryLargeImageURL",
-                "sku.primaryLargeImageURL",
-                "sku.primaryFullImageURL",
-            ])
-            image_rel = raw_img[0] if isinstance(raw_img, list) else raw_img
-
-            raw_route = extract(["route", "product.route", "sku.route", "seoUrlSlugDerived"])
-            route = raw_route[0] if isinstance(raw_route, list) else raw_route
-
-            parent_cats = _extract_parent_categories(attrs)
-            items.append({
-                "repositoryId": repository_id,
-                "displayName": display_name,
-                "listPrice": list_price,
-                "salePrice": sale_price,
-                "primaryMediumImageURL": image_rel or None,
-                "route": route or None,
-                # give build_products multiple options to detect OE
-                "parentCategories": parent_cats,
-                "categoryIds": [c["repositoryId"] for c in parent_cats] if parent_cats else None,
-            })
-
-        return items
+        return [it for rec in recs if (it := _record_to_item(rec)) is not None]
     finally:
         if close_session:
             session.close()
@@ -1387,11 +2340,14 @@ def fetch_front_page_items(
 # --- Coming Soon (HTML) ------------------------------------------------------
 
 _COMING_SOON_NRPP = 12  # matches the site’s grid page size
+# Stop the assembler scan after this many consecutive pages with no kept
+# coming-soon record (only once something was kept — the sort fronts them).
+_COMING_SOON_MAX_EMPTY_PAGES = 3
 
 def _extract_repo_id_from_href(href: str) -> Optional[str]:
     if not href:
         return None
-    m = re.search(r"/product/(\d{6,})", href)
+    m = _RE_PRODUCT_HREF.search(href)
     return m.group(1) if m else None
 
 def _product_card_container(a: Tag) -> Tag:
@@ -1421,7 +2377,7 @@ def _tile_price(card: Tag) -> Optional[float]:
     if not el:
         return None
     txt = el.get_text(" ", strip=True) if hasattr(el, "get_text") else str(el)
-    txt = re.sub(r"[^0-9\.,]", "", txt).replace(",", "")
+    txt = _RE_PRICE_STRIP.sub("", txt).replace(",", "")
     try:
         return float(txt) if txt else None
     except ValueError:
@@ -1437,6 +2393,109 @@ def _tile_image(card: Tag, base_url: str) -> Optional[str]:
         return _normalize_image_url(img.get("src"), base_url)
     return None
 
+def _scan_coming_soon_bs4(html: str, base_url: str, seen: set, items: list) -> int:
+    """One page of the coming-soon grid via BeautifulSoup; returns new tiles."""
+    soup = BeautifulSoup(html, "html.parser")
+    found = 0
+    for a in soup.select('a[href*="/product/"]'):
+        href = a.get("href") or ""
+        rid = _extract_repo_id_from_href(href)
+        # Grid tiles hold several anchors to the same product; skip known
+        # rids before paying the parent climb and tile text scan.
+        if not rid or rid in seen:
+            continue
+        card = _product_card_container(a)
+        if not _tile_has_coming_soon(card):
+            continue  # only keep tiles explicitly marked "COMING SOON"
+
+        seen.add(rid)
+        found += 1
+
+        name = _tile_name(card, href)
+        price = _tile_price(card)
+        img = _tile_image(card, base_url)
+        route = href if href.startswith("http") else urljoin(_base_slash(base_url), href.lstrip("/"))
+
+        items.append({
+            "repositoryId": rid,
+            "displayName": name,
+            "listPrice": price,
+            "salePrice": None,
+            "primaryMediumImageURL": img,
+            "route": route,
+        })
+    return found
+
+
+def _scan_coming_soon_slx(html: str, base_url: str, seen: set, items: list) -> int:
+    """selectolax twin of _scan_coming_soon_bs4."""
+    tree = _SelectolaxParser(html)
+    found = 0
+    for a in tree.css(_PRODUCT_A_SEL):
+        href = a.attributes.get("href") or ""
+        rid = _extract_repo_id_from_href(href)
+        if not rid or rid in seen:
+            continue
+        # Walk up to a plausible tile/card element.
+        card = a.parent
+        while card is not None and card.tag not in ("li", "article", "div"):
+            card = card.parent
+        if card is None:
+            card = a
+        if "coming soon" not in card.text(separator=" ", strip=True).lower():
+            continue
+        seen.add(rid)
+        found += 1
+
+        name_el = card.css_first("h2,h3,.card__name,.product__name,[itemprop='name']")
+        name = name_el.text(separator=" ", strip=True) if name_el else ""
+        if not name:
+            img_el = card.css_first("img")
+            name = (img_el.attributes.get("alt") or "").strip() if img_el else ""
+        if not name:
+            name = href.rsplit("/", 1)[-1].replace("-", " ").strip() or "Coming Soon Item"
+
+        price = None
+        price_el = card.css_first(
+            "span.card__price-amount,[itemprop='price'],.price__value,.cc-product-price__value"
+        )
+        if price_el is not None:
+            txt = _RE_PRICE_STRIP.sub("", price_el.text(separator=" ", strip=True)).replace(",", "")
+            try:
+                price = float(txt) if txt else None
+            except ValueError:
+                price = None
+
+        img = None
+        meta = card.css_first(_OG_IMG_SEL)
+        if meta is not None and meta.attributes.get("content"):
+            img = _normalize_image_url(meta.attributes.get("content"), base_url)
+        else:
+            img_el = card.css_first("img")
+            if img_el is not None and img_el.attributes.get("src"):
+                img = _normalize_image_url(img_el.attributes.get("src"), base_url)
+
+        route = href if href.startswith("http") else urljoin(_base_slash(base_url), href.lstrip("/"))
+        items.append({
+            "repositoryId": rid,
+            "displayName": name,
+            "listPrice": price,
+            "salePrice": None,
+            "primaryMediumImageURL": img,
+            "route": route,
+        })
+    return found
+
+
+def _scan_coming_soon_html(html: str, base_url: str, seen: set, items: list) -> int:
+    if _SELECTOLAX_AVAILABLE:
+        try:
+            return _scan_coming_soon_slx(html, base_url, seen, items)
+        except Exception:
+            logger.debug("selectolax coming-soon scan failed; using bs4", exc_info=True)
+    return _scan_coming_soon_bs4(html, base_url, seen, items)
+
+
 def _fetch_coming_soon_items_html(
     category_id: str = CATEGORY_ID,
     base_url: str = BASE_URL,
@@ -1475,37 +2534,7 @@ def _fetch_coming_soon_items_html(
             if not html:
                 break
 
-            soup = BeautifulSoup(html, "html.parser")
-            anchors = soup.select('a[href*="/product/"]')
-            found_this_page = 0
-
-            for a in anchors:
-                href = a.get("href") or ""
-                rid = _extract_repo_id_from_href(href)
-                if not rid:
-                    continue
-                card = _product_card_container(a)
-                if not _tile_has_coming_soon(card):
-                    continue  # only keep tiles explicitly marked "COMING SOON"
-
-                if rid in seen:
-                    continue
-                seen.add(rid)
-                found_this_page += 1
-
-                name = _tile_name(card, href)
-                price = _tile_price(card)
-                img = _tile_image(card, base_url)
-                route = href if href.startswith("http") else urljoin(base_url.rstrip("/") + "/", href.lstrip("/"))
-
-                items.append({
-                    "repositoryId": rid,
-                    "displayName": name,
-                    "listPrice": price,
-                    "salePrice": None,
-                    "primaryMediumImageURL": img,
-                    "route": route,
-                })
+            found_this_page = _scan_coming_soon_html(html, base_url, seen, items)
 
             # stop when a page returns no new "coming soon" cards
             if found_this_page == 0:
@@ -1529,32 +2558,81 @@ def _coerce_truthy(v) -> bool:
         return v.strip().lower() in {"y", "yes", "true", "1"}
     return False
 
-def _get_attr(attrs: dict, *names: str):
-    """Return the first non-None attribute among possible names (handles list scalars)."""
-    for name in names:
+def _first_present(attrs: dict, keys: tuple):
+    """Return the first non-None attribute among keys (handles list scalars).
+
+    Takes the key tuple directly so the per-record call sites pass the
+    module-level plans (_REC_*_KEYS) without a variadic splat.
+    """
+    for name in keys:
         val = attrs.get(name)
         if val is not None:
-            if isinstance(val, list):
+            if type(val) is list:
                 return val[0] if val else None
             return val
     return None
 
+# Likely keys OCC exposes for the coming-soon flag. The tuple keeps the
+# probe priority; the frozenset lets the per-record presence test run as one
+# C-level intersection with attrs.keys() instead of six dict lookups.
+_COMING_SOON_KEY_ORDER = tuple(map(sys.intern, (
+    "B2CProduct.b2c_comingSoon",
+    "b2c_comingSoon",
+    "product.b2c_comingSoon",
+    "sku.b2c_comingSoon",
+    "B2CProduct.b2cComingSoon",
+    "b2cComingSoon",
+)))
+_COMING_SOON_KEYS = frozenset(_COMING_SOON_KEY_ORDER)
+
+
+class _EtagPageCache:
+    """Per-process validator cache for assembler pages.
+
+    Maps a page key to (etag, records, total). Repeat polls send
+    If-None-Match, and a 304 reuses the parsed records with no body
+    transferred or decoded — the common case while the catalog is
+    quiescent between polls.
+    """
+
+    _MAX_ENTRIES = 64
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[tuple, tuple]" = OrderedDict()
+
+    def get(self, key: tuple) -> Optional[tuple]:
+        with self._lock:
+            hit = self._entries.get(key)
+            if hit is not None:
+                self._entries.move_to_end(key)
+            return hit
+
+    def put(self, key: tuple, etag: Optional[str], recs: list, total) -> None:
+        if not etag:
+            return
+        with self._lock:
+            self._entries[key] = (etag, recs, total)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._MAX_ENTRIES:
+                self._entries.popitem(last=False)
+
+
+_COMING_SOON_PAGES = _EtagPageCache()
+
+
 def _is_coming_soon(attrs: dict) -> bool:
-    # Try a handful of likely keys OCC exposes on the record
-    candidates = (
-        "B2CProduct.b2c_comingSoon",
-        "b2c_comingSoon",
-        "product.b2c_comingSoon",
-        "sku.b2c_comingSoon",
-        "B2CProduct.b2cComingSoon",
-        "b2cComingSoon",
-    )
-    val = None
-    for k in candidates:
-        if k in attrs:
-            val = _get_attr(attrs, k)
-            break
-    return _coerce_truthy(val)
+    hit = _COMING_SOON_KEYS & attrs.keys()
+    if not hit:
+        return False
+    if len(hit) == 1:
+        (k,) = hit
+    else:
+        k = next(k for k in _COMING_SOON_KEY_ORDER if k in hit)
+    v = attrs.get(k)
+    if type(v) is list:
+        v = v[0] if v else None
+    return _coerce_truthy(v)
 
 def fetch_coming_soon_items(
     category_id: str = CATEGORY_ID,
@@ -1574,81 +2652,174 @@ def fetch_coming_soon_items(
         close_session = True
 
     try:
-        assembler_url = f"{base_url.rstrip('/')}/ccstore/v1/assembler/pages/Default/osf/catalog"
-        sort_expr = COMING_SOON_NS or "B2CProduct.b2c_comingSoon|1"
+        assembler_url = _assembler_endpoint(base_url)
+        nrpp_str = str(nrpp)
 
         out: List[dict] = []
+        # Exact per-scan dedup. Ids are interned, so the set stores shared
+        # pointers and stays a few hundred KB even for the full catalog; a
+        # probabilistic filter would cost more per test than this C-level
+        # probe at this scale.
         seen: set[str] = set()
         offset = 0
-
-        while True:
-            params = {"N": category_id, "Nrpp": str(nrpp), "No": str(offset), "Ns": sort_expr}
-            logger.debug("ComingSoon assembler fetch: %s %s", assembler_url, params)
-            resp = _get(session, assembler_url, params=params)
-            data = resp.json()
-
+        # Records-array location, filled in by the buffered first page so
+        # later pages can be stream-parsed (same dance as
+        # fetch_all_product_items).
+        rec_prefix: list = [None]
+        # One level check per scan instead of logging's per-page walk
+        # through the disabled-record machinery.
+        debug = logger.isEnabledFor(logging.DEBUG)
+
+        def _buffered(resp, page_offset: int, cache_key: tuple):
+            data = _json_loads(resp.content)
             results = data.get("results") or {}
-            recs = (results.get("records") if isinstance(results, dict) else None) or data.get("records", [])
-            if not isinstance(recs, list) or not recs:
-                break
-
-            kept_this_page = 0
+            from_results = results.get("records") if isinstance(results, dict) else None
+            recs = from_results or data.get("records", [])
+            if not isinstance(recs, list):
+                recs = []
+            if page_offset == 0 and recs:
+                rec_prefix[0] = "results.records.item" if from_results else "records.item"
+            total = results.get("totalNumRecs") if isinstance(results, dict) else None
+            if total is None:
+                total = data.get("totalResults")
+            _COMING_SOON_PAGES.put(cache_key, resp.headers.get("ETag"), recs, total)
+            return recs, total
+
+        def _page(page_offset: int):
+            params = {"N": category_id, "Nrpp": nrpp_str, "No": str(page_offset), "Ns": _COMING_SOON_SORT}
+            if debug:
+                logger.debug("ComingSoon assembler fetch: %s %s", assembler_url, params)
+            cache_key = (assembler_url, category_id, nrpp_str, page_offset)
+
+            # Revalidate pages seen on an earlier poll: a 304 reuses the
+            # cached parsed records with no body transferred or decoded.
+            cached = _COMING_SOON_PAGES.get(cache_key)
+            if cached is not None:
+                etag, recs, total = cached
+                resp = _get(session, assembler_url, params=params,
+                            headers={"If-None-Match": etag})
+                if resp.status_code == 304:
+                    return recs, total
+                return _buffered(resp, page_offset, cache_key)
+
+            # The total only comes from page 0, so later pages need just the
+            # records array: stream-parse it so most records are filtered out
+            # by _keep without the surrounding payload dict ever existing.
+            if page_offset and rec_prefix[0] and _IJSON_AVAILABLE:
+                resp = _get(session, assembler_url, params=params, stream=True)
+                try:
+                    resp.raw.decode_content = True
+                    recs = list(ijson.items(resp.raw, rec_prefix[0]))
+                    _COMING_SOON_PAGES.put(cache_key, resp.headers.get("ETag"), recs, None)
+                    return recs, None
+                except Exception:
+                    logger.debug("ComingSoon stream parse failed; refetching buffered", exc_info=True)
+                finally:
+                    resp.close()
+
+            return _buffered(_get(session, assembler_url, params=params), page_offset, cache_key)
+
+        def _rows(recs: list):
+            """Filter/extract one page of records; main thread only."""
+            # Python sets/lists cannot be pre-sized, but their growth is
+            # geometric, so a full scan costs only O(log N) resizes anyway;
+            # binding seen.add keeps the per-kept-record attribute lookup
+            # out of the loop (out gets no such binding — list.extend
+            # already drives its appends in C).
+            seen_add = seen.add
+            resolved = None
             for rec in recs:
                 attrs = rec.get("attributes", rec)
                 # FILTER: only keep records flagged as coming soon
                 if not _is_coming_soon(attrs):
                     continue
 
-                def extract(names: Sequence[str]):
-                    v = _get_attr(attrs, *names)
-                    return v
+                if resolved is None:
+                    # Resolve each field's winning key on the first kept
+                    # record; the rest of the page does direct lookups with
+                    # _resolved_get's probing fallback for sparse records.
+                    resolved = tuple(
+                        next((k for k in keys if attrs.get(k) is not None), None)
+                        for keys in _REC_FIELD_PLANS
+                    )
+                id_k, name_k, list_k, sale_k, img_k, route_k = resolved
 
-                raw_id = extract(["repositoryId", "product.repositoryId", "sku.repositoryId"])
+                raw_id = _resolved_get(attrs, id_k, _REC_ID_KEYS)
                 if raw_id is None:
                     continue
-                repository_id = str(raw_id)
+                repository_id = sys.intern(str(raw_id))
 
                 if repository_id in seen:
                     continue
-                seen.add(repository_id)
-
-                raw_name = extract(["displayName", "product.displayName", "sku.displayName"]) or ""
-                display_name = str(raw_name[0] if isinstance(raw_name, list) else raw_name)
-
-                raw_list = extract(["listPrice", "sku.listPrice"])
-                raw_sale = extract(["salePrice", "sku.salePrice"])
-                list_price = float(raw_list) if raw_list is not None else None
-                sale_price = float(raw_sale) if raw_sale is not None else None
-
-                raw_img = extract([
-                    "primaryMediumImageURL",
-                    "sku.primaryMediumImageURL",
-                    "primaryLargeImageURL",
-                    "sku.primaryLargeImageURL",
-                    "sku.primaryFullImageURL",
-                ])
-                image_rel = raw_img[0] if isinstance(raw_img, list) else raw_img
-
-                raw_route = extract(["route", "product.route", "sku.route", "seoUrl", "seoUrlSlugDerived"])
-                route = raw_route[0] if isinstance(raw_route, list) else raw_route
-
-                out.append({
+                seen_add(repository_id)
+
+                # Deliberately the same dict shape as _record_to_item and the
+                # HTML fallback: every consumer (build_products and friends)
+                # reads items with .get, so a slotted/namedtuple item here
+                # would fork the API for a memory win that only shows up at
+                # scans far larger than this catalog.
+                yield {
                     "repositoryId": repository_id,
-                    "displayName": display_name,
-                    "listPrice": list_price,
-                    "salePrice": sale_price,
-                    "primaryMediumImageURL": image_rel or None,
-                    "route": route or None,
-                })
-                kept_this_page += 1
-
-            offset += len(recs)
-
-            # Optional optimization: once we hit a page with 0 kept while we keep paging through
-            # a sort that has all the "coming soon" first, we *could* break. Safer to read all
-            # pages—FWGS sometimes interleaves.
-            # if kept_this_page == 0:
-            #     break
+                    "displayName": str(_resolved_get(attrs, name_k, _REC_NAME_KEYS) or ""),
+                    "listPrice": _as_float(_resolved_get(attrs, list_k, _REC_LIST_KEYS)),
+                    "salePrice": _as_float(_resolved_get(attrs, sale_k, _REC_SALE_KEYS)),
+                    "primaryMediumImageURL": _resolved_get(attrs, img_k, _REC_IMG_KEYS) or None,
+                    "route": _resolved_get(attrs, route_k, _REC_ROUTE_KEYS) or None,
+                }
+
+        def _keep(recs: list) -> int:
+            """Extend out with one page's kept rows; list.extend drives the
+            generator's appends in C."""
+            before = len(out)
+            out.extend(_rows(recs))
+            return len(out) - before
+
+        # Probe the first page for the record total, then fetch the remaining
+        # offsets in bounded parallel waves. Records are filtered in the main
+        # thread in offset order, so seen/out behave as in the serial walk.
+        # The Ns sort fronts coming-soon items; FWGS sometimes interleaves,
+        # so a single empty page does not stop the scan — only a streak of
+        # _COMING_SOON_MAX_EMPTY_PAGES pages without a kept record does.
+        first, total = _page(0)
+        empty_streak = 0 if _keep(first) else 1
+        offset = len(first)
+        try:
+            total = int(total)
+        except (TypeError, ValueError):
+            total = None
+        if first and total is not None and total > offset:
+            offsets = list(range(offset, total, len(first)))
+            workers = min(8, len(offsets))
+            with ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="comingsoon"
+            ) as pool:
+                for i in range(0, len(offsets), workers):
+                    wave = offsets[i : i + workers]
+                    for recs, _ in pool.map(_page, wave):
+                        kept = _keep(recs)
+                        offset += len(recs)
+                        empty_streak = 0 if kept else empty_streak + 1
+                    if out and empty_streak >= _COMING_SOON_MAX_EMPTY_PAGES:
+                        logger.debug(
+                            "ComingSoon: %d pages without a kept record; stopping at offset %d/%d.",
+                            empty_streak, offset, total,
+                        )
+                        break
+        elif first and total is None:
+            # Total not reported: keep the serial walk-until-empty loop.
+            while True:
+                recs, _ = _page(offset)
+                if not recs:
+                    break
+                kept = _keep(recs)
+                offset += len(recs)
+                empty_streak = 0 if kept else empty_streak + 1
+                if out and empty_streak >= _COMING_SOON_MAX_EMPTY_PAGES:
+                    logger.debug(
+                        "ComingSoon: %d pages without a kept record; stopping at offset %d.",
+                        empty_streak, offset,
+                    )
+                    break
 
         if out:
             logger.info("ComingSoon assembler scan kept %d items (from %d total records).", len(out), offset)
@@ -1663,6 +2834,55 @@ def fetch_coming_soon_items(
             session.close()
 
 
+def fetch_coming_soon_items_multi(
+    category_ids: Sequence[str],
+    base_url: str = BASE_URL,
+    session: Optional[requests.Session] = None,
+    nrpp: int = ASSEMBLER_NRPP,
+) -> List[dict]:
+    """Sweep several categories for coming-soon items concurrently.
+
+    Categories run on a thread pool sharing one session (its adapter pool
+    is sized for our fan-outs), so a K-category sweep costs roughly the
+    slowest category instead of the sum. Results are merged in the given
+    category order and deduped by repositoryId across categories.
+    """
+    category_ids = list(category_ids)
+    if not category_ids:
+        return []
+    close_session = False
+    if session is None:
+        session = get_http_session()
+        close_session = True
+
+    try:
+        if len(category_ids) == 1:
+            return fetch_coming_soon_items(category_ids[0], base_url, session=session, nrpp=nrpp)
+
+        def _one(cid: str) -> List[dict]:
+            try:
+                return fetch_coming_soon_items(cid, base_url, session=session, nrpp=nrpp)
+            except Exception:
+                logger.warning("ComingSoon sweep failed for category %s", cid, exc_info=True)
+                return []
+
+        out: List[dict] = []
+        seen: set[str] = set()
+        with ThreadPoolExecutor(
+            max_workers=min(8, len(category_ids)), thread_name_prefix="comingsoon-cat"
+        ) as pool:
+            for items in pool.map(_one, category_ids):
+                for item in items:
+                    rid = item["repositoryId"]
+                    if rid in seen:
+                        continue
+                    seen.add(rid)
+                    out.append(item)
+        return out
+    finally:
+        if close_session:
+            session.close()
+
 
 __all__ = [
     "Product",
@@ -1674,5 +2894,6 @@ __all__ = [
     "ReleaseCard",
     "fetch_release_cards",
     "fetch_coming_soon_items",
+    "fetch_coming_soon_items_multi",
 ]
 
@@ -7,16 +7,41 @@ configured HTTP session and applying retry policies to network calls.
 from __future__ import annotations
 
 import logging
+import time
 from typing import Any, Callable, Dict
 
 import requests
 from requests import Response
-from tenacity import (after_log, retry, retry_if_exception_type,
-                      stop_after_attempt, wait_exponential)
+from requests.adapters import HTTPAdapter
 
 
 logger = logging.getLogger(__name__)
 
+# urllib3 can decode brotli when either binding is installed; only then is it
+# safe to advertise `br` (older requests releases hardcode "gzip, deflate").
+try:
+    import brotli  # noqa: F401
+    _BROTLI_AVAILABLE = True
+except ImportError:
+    try:
+        import brotlicffi  # noqa: F401
+        _BROTLI_AVAILABLE = True
+    except ImportError:
+        _BROTLI_AVAILABLE = False
+
+# Connection pool sizing for sessions handed out by get_http_session. The
+# requests default of 10 is smaller than our thread-pool fan-outs (category
+# sweeps, enrichment, release variants), which makes urllib3 discard pooled
+# sockets and pay a fresh TCP+TLS handshake per overflow request. maxsize
+# is higher than the per-host pool so simultaneous fan-outs can still
+# borrow sockets without blocking. Parallel keep-alive sockets are this
+# stack's substitute for HTTP/2 multiplexing: requests/urllib3 speak only
+# HTTP/1.1, and swapping the hot path to an httpx H2 client would fork
+# the session plumbing (retry wrapper, adapters, cookie warm-up) for a
+# win the pooled sockets already mostly capture.
+_POOL_CONNECTIONS = 32
+_POOL_MAXSIZE = 64
+
 
 def get_http_session() -> requests.Session:
     """Return a new HTTP session with sensible defaults.
@@ -32,6 +57,19 @@ def get_http_session() -> requests.Session:
             "Accept": "application/json, text/javascript, */*; q=0.01",
         }
     )
+    if _BROTLI_AVAILABLE:
+        # br typically shaves another 15-25% over gzip on assembler JSON;
+        # without a binding requests keeps its gzip/deflate default.
+        session.headers["Accept-Encoding"] = "br, gzip, deflate"
+    # max_retries=0: retry policy lives in retryable_request.
+    adapter = HTTPAdapter(
+        pool_connections=_POOL_CONNECTIONS,
+        pool_maxsize=_POOL_MAXSIZE,
+        pool_block=False,
+        max_retries=0,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
     # Respect environment proxies if configured (requests does this by default)
     return session
 
@@ -40,13 +78,6 @@ class HTTPError(Exception):
     """Raised when an HTTP request fails after retries."""
 
 
-def _raise_for_status(resp: Response) -> None:
-    try:
-        resp.raise_for_status()
-    except requests.RequestException as e:
-        raise HTTPError(str(e)) from e
-
-
 def retryable_request(method: Callable[[requests.Session, str, Dict[str, Any]], Response]) -> Callable[..., Response]:
     """Decorator factory to apply retry logic to HTTP calls.
 
@@ -57,23 +88,25 @@ def retryable_request(method: Callable[[requests.Session, str, Dict[str, Any]],
     exponential back‑off between 1 and 10 seconds.
     """
 
-    @retry(
-        reraise=True,
-        stop=stop_after_attempt(5),
-        wait=wait_exponential(multiplier=1, min=1, max=10),
-        retry=(
-            retry_if_exception_type(requests.RequestException)
-            | retry_if_exception_type(HTTPError)
-        ),
-        after=after_log(logger, logging.WARNING),
-    )
     def wrapper(session: requests.Session, url: str, **kwargs: Any) -> Response:
-        response = method(session, url, **kwargs)
-        # If server returned >= 500, raise to trigger retry
-        if response.status_code >= 500:
-            raise HTTPError(f"Server returned status {response.status_code}")
-        _raise_for_status(response)
-        return response
+        delay = 1.0
+        for attempt in range(5):
+            try:
+                response = method(session, url, **kwargs)
+                # Checking the cached status code directly keeps the hot 2xx
+                # path to two comparisons.
+                sc = response.status_code
+                if sc >= 500:
+                    raise HTTPError(f"Server returned status {sc}")
+                if sc >= 400:
+                    raise HTTPError(f"Client error {sc} for {url}")
+                return response
+            except (requests.RequestException, HTTPError) as e:
+                if attempt == 4:
+                    raise
+                logger.warning("Retrying %s (attempt %d/5): %s", url, attempt + 1, e)
+                time.sleep(min(delay, 10.0))
+                delay *= 2
 
     return wrapper
 